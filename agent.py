@@ -1,160 +1,270 @@
+import hashlib
+import json
+import logging
 import os
 import re
-from langchain_community.document_loaders import PyPDFLoader, TextLoader
-from langchain_community.vectorstores import FAISS
-from langchain_community.embeddings import OllamaEmbeddings
-from langchain_community.llms import Ollama
-from langchain.chains import RetrievalQA
+import threading
+import time
+
+import telemetry
 
 # Paths
 DOCS_PATH = "docs"
 VECTORSTORE_PATH = "vectorstore"
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", os.path.join("cache", "embeddings.sqlite"))
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "100000"))
+# Set RESULT_CACHE_PATH to an empty string to keep results in memory only
+RESULT_CACHE_PATH = os.getenv("RESULT_CACHE_PATH", os.path.join("cache", "results.sqlite"))
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "1024"))
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", str(7 * 24 * 3600)))
+RESULT_CACHE_DISK_ENTRIES = int(os.getenv("RESULT_CACHE_DISK_ENTRIES", "10000"))
+
+MODEL_NAME = "llama3.2"
+OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+
+logger = logging.getLogger(__name__)
+
+# Process-wide clients, created on first use so importing this module stays cheap
+_resources = {}
+_resources_lock = threading.Lock()
+_db_lock = threading.Lock()
+_warmup_thread = None
+
+
+def get_embeddings():
+    """Return the shared embeddings model (behind a persistent cache)."""
+    with _resources_lock:
+        if "embeddings" not in _resources:
+            from langchain_community.embeddings import OllamaEmbeddings
+            from embedding_cache import CachedEmbeddings
+
+            _resources["embeddings"] = CachedEmbeddings(
+                OllamaEmbeddings(model=MODEL_NAME, base_url=OLLAMA_BASE_URL),
+                model=MODEL_NAME,
+                path=EMBEDDING_CACHE_PATH,
+                max_entries=EMBEDDING_CACHE_MAX_ENTRIES,
+            )
+        return _resources["embeddings"]
+
 
-# Initialize embeddings and model
-embeddings = OllamaEmbeddings(model="llama3.2")
-llm = Ollama(model="llama3.2")
+def get_llm():
+    """Return the shared Ollama LLM client."""
+    with _resources_lock:
+        if "llm" not in _resources:
+            from langchain_community.llms import Ollama
 
+            _resources["llm"] = Ollama(model=MODEL_NAME, base_url=OLLAMA_BASE_URL)
+        return _resources["llm"]
 
-def load_documents():
+
+def get_db():
+    """
+    Return the shared vectorstore, loading or building it on first use.
+    The index is brought up to date once per process.
     """
-    Load all documents from the docs/ folder.
-    Supports both PDF and TXT files.
+    with _db_lock:
+        if "db" not in _resources:
+            _resources["db"] = get_vectorstore()
+        return _resources["db"]
 
-    Returns:
-        list: A list of loaded documents.
-    Raises:
-        FileNotFoundError: If no documents are found in the folder.
-    """
-    docs = []
-    for file in os.listdir(DOCS_PATH):
-        path = os.path.join(DOCS_PATH, file)
-        if file.endswith(".pdf"):
-            loader = PyPDFLoader(path)
-            docs.extend(loader.load())
-        elif file.endswith(".txt"):
-            loader = TextLoader(path)
-            docs.extend(loader.load())
-
-    if not docs:
-        raise FileNotFoundError(f"No source documents found in '{DOCS_PATH}' to build FAISS index.")
 
-    return docs
+def get_retriever(k: int = 3):
+    """Return a retriever over the shared vectorstore."""
+    return get_db().as_retriever(search_kwargs={"k": k})
 
 
-def get_vectorstore():
+def is_ready() -> bool:
+    """Whether the vectorstore has been loaded and queries won't block on it."""
+    return "db" in _resources
+
+
+def warm_up(background: bool = True):
     """
-    Load an existing FAISS index or create a new one.
-    Rebuilds the index if source documents are newer than the cached index.
+    Load the vectorstore ahead of the first query.
+
+    Args:
+        background (bool): Run in a daemon thread instead of blocking.
 
     Returns:
-        FAISS: A vectorstore ready to be used for retrieval.
+        threading.Thread | None: The warm-up thread, if one was started.
     """
-    persist_dir = VECTORSTORE_PATH
-    index_path = os.path.join(persist_dir, "index.faiss")
-
-    # If an index already exists
-    if os.path.exists(index_path):
-        index_mtime = os.path.getmtime(index_path)  # last modification of index
-
-        # Get the last modification among all docs
-        docs_mtime = max(
-            os.path.getmtime(os.path.join(DOCS_PATH, f))
-            for f in os.listdir(DOCS_PATH)
-        )
-
-        # If docs were updated after the index → rebuild
-        if docs_mtime > index_mtime:
-            print("📌 Detected document update → rebuilding FAISS index...")
-            docs = load_documents()
-            db = FAISS.from_documents(docs, embeddings)
-            db.save_local(persist_dir)
-            return db
-        else:
-            print("✅ Using cached FAISS index (no updates in docs).")
-            return FAISS.load_local(
-                persist_dir,
-                embeddings,
-                allow_dangerous_deserialization=True
-            )
-    else:
-        print("📌 No index found → creating new FAISS index...")
-        docs = load_documents()
-        db = FAISS.from_documents(docs, embeddings)
-        db.save_local(persist_dir)
-        return db
+    global _warmup_thread
 
+    if not background:
+        get_db()
+        return None
 
-# Load vectorstore
-db = get_vectorstore()
+    with _resources_lock:
+        if is_ready():
+            return None
+        if _warmup_thread is None or not _warmup_thread.is_alive():
+            _warmup_thread = threading.Thread(target=_warm_up, name="vectorstore-warmup", daemon=True)
+            _warmup_thread.start()
+        return _warmup_thread
 
-# Create a RetrievalQA chain
-qa_chain = RetrievalQA.from_chain_type(
-    llm=llm,
-    retriever=db.as_retriever(),
-)
 
+def _warm_up():
+    try:
+        get_db()
+    except Exception as e:
+        # The next query retries and surfaces the error to the caller
+        logger.warning("⚠️ Error warming up vectorstore: %s", e)
 
-def parse_llm_response(response: str):
+
+SUPPORTED_EXTENSIONS = (".pdf", ".txt")
+MANIFEST_FILE = "manifest.json"
+
+
+def file_hash(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def scan_sources():
     """
-    Parse the LLM response to extract brand name, slogan, logo mark, color, and branding concept.
+    Hash every supported file in the docs/ folder.
 
-    Args:
-        response (str): Raw LLM output.
+    Returns:
+        dict: Mapping of file name to content hash.
+    """
+    return {
+        file: file_hash(os.path.join(DOCS_PATH, file))
+        for file in sorted(os.listdir(DOCS_PATH))
+        if file.endswith(SUPPORTED_EXTENSIONS)
+    }
+
+
+def load_manifest(persist_dir: str):
+    """
+    Read the manifest stored next to the FAISS index.
+
+    The manifest maps each source file to its content hash and the
+    docstore IDs of the vectors it produced.
 
     Returns:
-        tuple: (name, slogan, concept, logo_mark, color)
+        dict | None: The manifest, or None if missing or unreadable.
     """
-    # First try the expected format (with **)
-    name_match = re.search(r"\*\*Brand Name:\*\*\s*(.+)", response)
-    slogan_match = re.search(r"\*\*Slogan:\*\*\s*(.+)", response)
-    logo_mark = re.search(r"\*\*Logo Mark:\*\*\s*(.+)", response)
-    color = re.search(r"\*\*Color:\*\*\s*(.+)", response)
-    concept_match = re.search(r"\*\*Branding Concept:\*\*\s*(.+)", response, re.DOTALL)
+    path = os.path.join(persist_dir, MANIFEST_FILE)
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest.get("files"), dict) else None
 
-    # If not found, try looser formats
-    if not name_match:
-        name_match = re.search(r"(?i)(?:Brand Name|Name)[:\-]?\s*([^\n]+)", response)
 
-    if not slogan_match:
-        slogan_match = re.search(r"(?i)(?:Slogan)[:\-]?\s*([^\n]+)", response)
+def save_manifest(persist_dir: str, manifest: dict):
+    """Atomically write the manifest next to the FAISS index."""
+    path = os.path.join(persist_dir, MANIFEST_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
 
-    if not logo_mark:
-        logo_mark = re.search(r"(?i)(?:Logo Mark)[:\-]?\s*(.+)", response, re.DOTALL)
 
-    if not color:
-        color = re.search(r"(?i)(?:Color)[:\-]?\s*(.+)", response, re.DOTALL)
+def source_paths(sources: dict, files=None):
+    """Return (file, path, digest) tuples for the ingestion pipeline."""
+    return [
+        (file, os.path.join(DOCS_PATH, file), sources[file])
+        for file in (sources if files is None else files)
+    ]
 
-    if not concept_match:
-        concept_match = re.search(r"(?i)(?:Branding Concept)[:\-]?\s*(.+)", response, re.DOTALL)
 
-    name = name_match.group(1).strip() if name_match else "Name not generated"
-    slogan = slogan_match.group(1).strip() if slogan_match else "Slogan not generated"
-    logo_mark = logo_mark.group(1).strip() if logo_mark else "Logo Mark not generated"
-    color = color.group(1).strip() if color else "Color not generated"
-    concept = concept_match.group(1).strip() if concept_match else "Concept not generated"
+def sync_documents(persist_dir: str, manifest: dict, sources: dict):
+    """
+    Bring the docstore in line with the docs/ folder.
 
-    return name, slogan, concept, logo_mark, color
+    Only added or changed files are embedded. Chunks of deleted or
+    changed files are dropped from the manifest but stay in the docstore
+    until the index no longer references them (see `faiss_store.rebuild_index`).
 
+    The manifest is not saved here: the caller saves it once the index
+    has been rebuilt, so an interrupted rebuild is retried on the next start.
 
-def generate_branding(description: str):
+    Returns:
+        tuple: (manifest, changed) — the updated manifest and whether
+        anything was added or removed.
     """
-    Generate branding elements (name, slogan, concept, logo mark, color) 
-    based on a user description and reference documents.
+    from faiss_store import DOCSTORE_FILE, SQLiteDocstore
+    from ingest import chunking_config, ingest
 
-    Args:
-        description (str): The brand/business description provided by the user.
+    indexed = manifest["files"]
+    stale = [f for f, entry in indexed.items() if sources.get(f) != entry["sha256"]]
+    fresh = [f for f, digest in sources.items() if indexed.get(f, {}).get("sha256") != digest]
+
+    if not stale and not fresh:
+        return manifest, False
+
+    logger.info("📌 Detected document update → %d file(s) to embed, %d to remove...", len(fresh), len(stale))
+
+    files = {f: entry for f, entry in indexed.items() if f not in stale}
+    if fresh:
+        docstore = SQLiteDocstore(os.path.join(persist_dir, DOCSTORE_FILE))
+        with telemetry.span("vectorstore.ingest") as span:
+            added, stats = ingest(docstore, source_paths(sources, fresh), get_embeddings())
+            span.set(files=stats["files"], chunks=stats["chunks"])
+        files.update(added)
+
+    return {"files": files, "chunking": chunking_config()}, True
+
+
+def get_vectorstore():
+    """
+    Load the FAISS index, creating or updating it first if needed.
+    Files in docs/ are tracked by content hash in a manifest stored next
+    to the index, so only added or changed files are re-embedded. The
+    index itself is rebuilt from the stored vectors when documents
+    change or the configured index type (FAISS_INDEX) differs.
+
+    Updates hold a lock on the vectorstore, so concurrent processes wait
+    for one build instead of racing; readers keep using the previous
+    index until the new one is switched in.
 
     Returns:
-        dict: A dictionary with branding information.
+        FAISS: A vectorstore ready to be used for retrieval.
     """
-    # Retrieve relevant docs (top k summaries)
-    retriever = db.as_retriever(search_kwargs={"k": 3})
-    docs = retriever.invoke(description)
-    context = "\n".join([d.page_content for d in docs])
-    print("context:\n", context)
+    import faiss_store
+    from ingest import chunking_config
 
-    # LLM prompt
-    prompt = f"""
+    persist_dir = VECTORSTORE_PATH
+    docstore_path = os.path.join(persist_dir, faiss_store.DOCSTORE_FILE)
+    sources = scan_sources()
+
+    if not sources:
+        raise FileNotFoundError(f"No source documents found in '{DOCS_PATH}' to build FAISS index.")
+
+    with faiss_store.build_lock(persist_dir):
+        # Read under the lock: another process may have just updated the store
+        manifest = load_manifest(persist_dir)
+
+        # A store built before manifests existed (or with other chunking) can't be diffed → rebuild once
+        if not os.path.exists(docstore_path) or manifest is None or manifest.get("chunking") != chunking_config():
+            logger.info("📌 No index found → creating new FAISS index...")
+            if os.path.exists(docstore_path):
+                os.remove(docstore_path)
+            manifest = {"files": {}}
+
+        manifest, changed = sync_documents(persist_dir, manifest, sources)
+
+        info = faiss_store.index_info(persist_dir)
+        if changed or info.get("index_type") != faiss_store.FAISS_INDEX:
+            ids = [i for f in sorted(manifest["files"]) for i in manifest["files"][f]["ids"]]
+            if faiss_store.rebuild_index(persist_dir, faiss_store.FAISS_INDEX, ids) is None:
+                raise FileNotFoundError(f"No source documents found in '{DOCS_PATH}' to build FAISS index.")
+            # Only now does the live index match the manifest
+            save_manifest(persist_dir, manifest)
+        else:
+            logger.info("✅ Using cached FAISS index (no updates in docs).")
+
+    with telemetry.span("vectorstore.load"):
+        return faiss_store.load(persist_dir, get_embeddings())
+
+
+PROMPT_TEMPLATE = """
 You are a branding expert. Based on the description below and the provided references, create ONE SINGLE branding suggestion.
 
 ⚠️ Important:
@@ -174,15 +284,426 @@ User description:
 Reference keywords or insights:
 {context}
 """
-    response = llm.invoke(prompt)
-    print("LLM Response:", response)
 
-    name, slogan, concept, logo, color = parse_llm_response(response)
+# Parsed field keys, in the order the prompt asks for them
+BRANDING_FIELDS = ("name", "slogan", "logo_mark", "color", "explanation")
+
+
+# Placeholder values for fields the LLM did not produce
+FIELD_DEFAULTS = {
+    "name": "Name not generated",
+    "slogan": "Slogan not generated",
+    "logo_mark": "Logo Mark not generated",
+    "color": "Color not generated",
+    "explanation": "Concept not generated",
+}
+
+_FIELD_LABELS = {
+    "brand name": "name",
+    "name": "name",
+    "slogan": "slogan",
+    "logo mark": "logo_mark",
+    "color": "color",
+    "branding concept": "explanation",
+}
+
+# A label line: optional markdown (bullets, headings, bold/italics), a known
+# label, a ":" or a spaced "-"/"–" separator, then the value with any closing
+# markdown stripped. Handles "**Brand Name:** X", "**Logo Mark: X**",
+# "Color - X" and "- Slogan: X", but not prose like "Name-brand quality".
+_LABEL_LINE_RE = re.compile(
+    r"^[\s>#*_-]*(brand name|name|slogan|logo mark|color|branding concept)[\s*_]*(?::|\s[-\u2013]\s)[\s*_]*(.*?)[\s*_]*$",
+    re.IGNORECASE,
+)
 
-    return {
+# Fields whose value may continue on the following lines
+_MULTILINE_FIELDS = {"explanation"}
+
+
+class BrandingParser:
+    """
+    Single-pass, incremental parser for the LLM's branding answer.
+
+    Text is scanned line by line exactly once. Each field starts at its
+    label line (bold or plain) and stops at the next label; single-line
+    fields take the rest of their label line (or the next non-empty line
+    if that is blank), the branding concept takes every line up to the
+    next label. The first occurrence of a field wins.
+
+    Feed text as it streams in; completed fields are returned as soon as
+    they can no longer change.
+    """
+
+    def __init__(self):
+        self.fields = {}
+        self._parts = []
+        self._pending = ""
+        self._current = None
+        self._lines = []
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self._parts)
+
+    def feed(self, chunk: str):
+        """
+        Consume a chunk of streamed text.
+
+        Returns:
+            list: (field, value) pairs completed by this chunk.
+        """
+        self._parts.append(chunk)
+        if "\n" not in chunk:
+            self._pending += chunk
+            return []
+        *lines, self._pending = (self._pending + chunk).split("\n")
+        emitted = []
+        for line in lines:
+            self._scan_line(line, emitted)
+        return emitted
+
+    def close(self):
+        """
+        Finish the stream.
+
+        Returns:
+            list: (field, value) pairs not emitted yet, with placeholders
+            for fields that were never produced.
+        """
+        emitted = []
+        self._scan_line(self._pending, emitted)
+        self._pending = ""
+        self._finish_field(emitted)
+        for field in BRANDING_FIELDS:
+            if field not in self.fields:
+                self.fields[field] = FIELD_DEFAULTS[field]
+                emitted.append((field, FIELD_DEFAULTS[field]))
+        return emitted
+
+    def _scan_line(self, line: str, emitted: list):
+        match = _LABEL_LINE_RE.match(line)
+        if match:
+            self._finish_field(emitted)
+            field = _FIELD_LABELS[match.group(1).lower()]
+            if field in self.fields:
+                return
+            self._current = field
+            self._lines = [match.group(2)] if match.group(2) else []
+            if self._lines and field not in _MULTILINE_FIELDS:
+                self._finish_field(emitted)
+        elif self._current is not None:
+            if self._current in _MULTILINE_FIELDS:
+                self._lines.append(line)
+            elif line.strip():
+                self._lines = [line.strip(" *_")]
+                self._finish_field(emitted)
+
+    def _finish_field(self, emitted: list):
+        field, self._current = self._current, None
+        value = "\n".join(self._lines).strip()
+        self._lines = []
+        if field is not None and value:
+            self.fields[field] = value
+            emitted.append((field, value))
+
+
+def parse_llm_response(response: str):
+    """
+    Parse the LLM response to extract brand name, slogan, logo mark, color, and branding concept.
+
+    Args:
+        response (str): Raw LLM output.
+
+    Returns:
+        tuple: (name, slogan, concept, logo_mark, color)
+    """
+    parser = BrandingParser()
+    parser.feed(response)
+    parser.close()
+    fields = parser.fields
+    return fields["name"], fields["slogan"], fields["explanation"], fields["logo_mark"], fields["color"]
+
+
+PROMPT_HASH = hashlib.sha256(PROMPT_TEMPLATE.encode("utf-8")).hexdigest()
+
+
+def get_result_cache():
+    """
+    Return the branding result caches.
+
+    Returns:
+        tuple: (TTLCache, SqliteLRUStore | None) — the in-memory cache and,
+        unless disabled, the on-disk store shared by worker processes.
+    """
+    with _resources_lock:
+        if "result_cache" not in _resources:
+            from caching import SqliteLRUStore, TTLCache
+
+            memory = TTLCache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL)
+            disk = None
+            if RESULT_CACHE_PATH:
+                disk = SqliteLRUStore(RESULT_CACHE_PATH, max_entries=RESULT_CACHE_DISK_ENTRIES)
+            _resources["result_cache"] = (memory, disk)
+        return _resources["result_cache"]
+
+
+def normalize_description(description: str) -> str:
+    """Collapse whitespace so trivially different descriptions share a cache entry."""
+    return " ".join(description.split())
+
+
+def corpus_version() -> str:
+    """
+    Identify the indexed corpus by hashing the FAISS manifest.
+
+    Returns:
+        str: A hex digest, or "none" if no index has been built.
+    """
+    try:
+        with open(os.path.join(VECTORSTORE_PATH, MANIFEST_FILE), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return "none"
+
+
+def result_cache_key(description: str) -> str:
+    """Key a result by description, model, prompt template and corpus version."""
+    parts = [normalize_description(description), MODEL_NAME, PROMPT_HASH, corpus_version()]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def get_cached_result(description: str):
+    """
+    Look up a previously generated branding result.
+
+    Returns:
+        dict | None: {"result": dict, "assets": dict | None}, or None on a miss.
+    """
+    memory, disk = get_result_cache()
+    key = result_cache_key(description)
+    entry = memory.get(key)
+    if entry is None and disk is not None:
+        value = disk.get(key)
+        if value is not None:
+            entry = json.loads(value)
+            # Disk entries outlive the process, so they carry their own expiry
+            remaining = entry.get("stored_at", 0) + RESULT_CACHE_TTL - time.time()
+            if remaining <= 0:
+                return None
+            memory.set(key, entry, ttl=remaining)
+    return entry
+
+
+def cache_result(description: str, result: dict, assets=None):
+    """
+    Store a branding result, optionally with references to its assets
+    (e.g. the logo cache key and palette query).
+    """
+    memory, disk = get_result_cache()
+    key = result_cache_key(description)
+    entry = {"result": dict(result), "assets": assets, "stored_at": time.time()}
+    memory.set(key, entry)
+    if disk is not None:
+        disk.put(key, json.dumps(entry).encode("utf-8"))
+
+
+def result_cache_stats():
+    """
+    Return hit/miss counters of the result caches.
+
+    Returns:
+        dict: {"memory": {...}, "disk": {...} | None}
+    """
+    memory, disk = get_result_cache()
+    return {"memory": memory.stats(), "disk": disk.stats() if disk is not None else None}
+
+
+def retrieve_context(description: str) -> str:
+    """Retrieve the reference snippets (top k documents) for a description."""
+    with telemetry.span("retrieval"):
+        docs = get_retriever(k=3).invoke(description)
+    context = "\n".join([d.page_content for d in docs])
+    logger.debug("Retrieved context:\n%s", context, extra={"fields": {"documents": len(docs)}})
+    return context
+
+
+def retrieve_contexts(descriptions, k: int = 3):
+    """
+    Retrieve reference snippets for many descriptions at once.
+
+    All descriptions are embedded as queries in one batched call and
+    searched as a single matrix query against the FAISS index.
+
+    Args:
+        descriptions (list[str]): Brand/business descriptions.
+        k (int): Documents retrieved per description.
+
+    Returns:
+        list[str]: One context string per description.
+    """
+    import numpy as np
+
+    if not descriptions:
+        return []
+
+    db = get_db()
+    with telemetry.span("retrieval") as span:
+        span.set(batch=len(descriptions))
+        # faiss_store indexes raw (unnormalised) vectors, so queries are searched as-is
+        vectors = np.asarray(get_embeddings().embed_queries(list(descriptions)), dtype=np.float32)
+        _, indices = db.index.search(vectors, k)
+
+        contexts = []
+        for row in indices:
+            docs = [db.docstore.search(db.index_to_docstore_id[i]) for i in row if i != -1]
+            contexts.append("\n".join(d.page_content for d in docs))
+    return contexts
+
+
+def build_prompt(description: str, context: str) -> str:
+    """Fill the branding prompt with the user description and retrieved context."""
+    return PROMPT_TEMPLATE.format(description=description, context=context)
+
+
+class GenerationTimer:
+    """
+    Time an LLM token stream: total duration, time to first token and
+    tokens per second (Ollama streams roughly one token per chunk).
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.first_token = None
+        self.tokens = 0
+
+    def token(self):
+        """Count a streamed chunk."""
+        if self.first_token is None:
+            self.first_token = time.perf_counter() - self.started
+        self.tokens += 1
+
+    def finish(self):
+        """Record the generation as an "llm" span and the LLM metrics."""
+        total = time.perf_counter() - self.started
+        attributes = {"model": MODEL_NAME, "tokens": self.tokens}
+        if self.first_token is not None:
+            attributes["ttft_ms"] = round(self.first_token * 1000, 1)
+            telemetry.observe("llm_time_to_first_token_seconds", self.first_token, model=MODEL_NAME)
+            if total > self.first_token:
+                rate = (self.tokens - 1) / (total - self.first_token)
+                attributes["tokens_per_second"] = round(rate, 1)
+                telemetry.observe("llm_tokens_per_second", rate, model=MODEL_NAME)
+        telemetry.inc("llm_tokens_total", self.tokens, model=MODEL_NAME)
+        telemetry.record("llm", total, **attributes)
+
+
+def generate_branding(description: str, use_cache: bool = True):
+    """
+    Generate branding elements (name, slogan, concept, logo mark, color) 
+    based on a user description and reference documents.
+
+    Args:
+        description (str): The brand/business description provided by the user.
+        use_cache (bool): Serve a previous result for the same description
+            if there is one. Pass False for a fresh suggestion (it still
+            replaces the cached entry).
+
+    Returns:
+        dict: A dictionary with branding information.
+    """
+    # Make sure the index (and therefore the corpus version) is current
+    get_db()
+    if use_cache:
+        entry = get_cached_result(description)
+        if entry is not None:
+            return dict(entry["result"])
+
+    return generate_from_context(description, retrieve_context(description))
+
+
+def generate_from_context(description: str, context: str):
+    """
+    Run the LLM for a description whose reference context is already retrieved,
+    and cache the parsed result.
+
+    Args:
+        description (str): The brand/business description provided by the user.
+        context (str): Reference snippets to include in the prompt.
+
+    Returns:
+        dict: A dictionary with branding information.
+    """
+    with telemetry.span("prompt"):
+        prompt = build_prompt(description, context)
+
+    # Streamed (and joined) rather than invoked, to measure time to first token
+    timer = GenerationTimer()
+    tokens = []
+    for token in get_llm().stream(prompt):
+        timer.token()
+        tokens.append(token)
+    timer.finish()
+    response = "".join(tokens)
+    logger.debug("LLM Response:\n%s", response)
+
+    with telemetry.span("parse"):
+        name, slogan, concept, logo, color = parse_llm_response(response)
+
+    result = {
         "name": name,
         "slogan": slogan,
         "logo_mark": logo,
         "color": color,
         "explanation": concept
-    }
\ No newline at end of file
+    }
+    cache_result(description, result)
+    return result
+
+
+def stream_branding(description: str, use_cache: bool = True):
+    """
+    Stream branding elements while the LLM is still generating.
+
+    Args:
+        description (str): The brand/business description provided by the user.
+        use_cache (bool): Replay a previous result for the same description
+            (without tokens) if there is one.
+
+    Yields:
+        tuple: ("token", text) for every raw token, (field, value) as soon as
+        a field is parsed (keys as in `generate_branding`), and finally
+        ("result", dict) with the complete branding information.
+    """
+    get_db()
+    if use_cache:
+        entry = get_cached_result(description)
+        if entry is not None:
+            for field in BRANDING_FIELDS:
+                yield field, entry["result"][field]
+            yield "result", dict(entry["result"])
+            return
+
+    context = retrieve_context(description)
+    with telemetry.span("prompt"):
+        prompt = build_prompt(description, context)
+    parser = BrandingParser()
+    timer = GenerationTimer()
+    parse_seconds = 0.0
+
+    for token in get_llm().stream(prompt):
+        timer.token()
+        yield "token", token
+        started = time.perf_counter()
+        fields = parser.feed(token)
+        parse_seconds += time.perf_counter() - started
+        yield from fields
+    timer.finish()
+    started = time.perf_counter()
+    fields = parser.close()
+    telemetry.record("parse", parse_seconds + time.perf_counter() - started)
+    yield from fields
+
+    logger.debug("LLM Response:\n%s", parser.text)
+    cache_result(description, parser.fields)
+    yield "result", dict(parser.fields)
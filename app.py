@@ -1,27 +1,24 @@
+import logging
+
 import streamlit as st
-import asyncio
-from agent import generate_branding
-from pollinations_api import generate_logo_image
+import http_client
+import telemetry
+from agent import cache_result, is_ready, result_cache_stats, stream_branding, warm_up
+from branding_client import BRANDING_API_URL, request_branding
+from pollinations_api import generate_logo_bytes, logo_cache_key
 from colormagic_api import generate_slogan_palette
-from assets import (
-    LOGO_BASE64,
-    SUGGESTED_NAME,
-    SLOGAN_TEXT,
-    BRANDING_TEXT,
-    SLOGAN_IMAGE,
-    PALLETES_IMAGE,
-)
+from assets import encode_image, icon_url
 
-if "current_image" not in st.session_state:
-    st.session_state.current_image = LOGO_BASE64
+telemetry.setup()
+logger = logging.getLogger(__name__)
 
 
 def render_title():
-    """Render the app title with the current logo image."""
+    """Render the app title with the logo icon."""
     st.markdown(
         f"""
         <h1 style="display: flex; align-items: center;">
-            <img src="data:image/png;base64,{st.session_state.current_image}" 
+            <img src="{icon_url('logo')}" 
                  style="height:100px; margin-right:20px;">
             Branding AI Assistant
         </h1>
@@ -30,102 +27,179 @@ def render_title():
     )
 
 
+# Load the vectorstore in the background so the page renders immediately
+# (unless generation is delegated to a branding API server)
+if not BRANDING_API_URL:
+    warm_up()
+
 render_title()
 st.write("Create name, slogan, and brand concept from a description.")
 
+if not BRANDING_API_URL and not is_ready():
+    st.caption("⏳ Loading reference documents in the background...")
+
 description = st.text_area("Describe your brand/business:", height=150)
+fresh = st.checkbox("Fresh suggestion", help="Ignore previously generated results for this description.")
 
 
-async def generate_assets(result):
-    """Run logo and color palette generation concurrently."""
-    logo_task = generate_logo_image(result["logo_mark"])
-    palette_task = generate_slogan_palette(
-        result["slogan"], query=result["color"].lower()
-    )
-    slogan_img, (palette_img, palette_text, palette_colors) = await asyncio.gather(
-        logo_task, palette_task
+def start_logo(logo_mark):
+    """Kick off the Pollinations logo request in the background."""
+    return http_client.submit(generate_logo_bytes(logo_mark))
+
+
+def start_palette(slogan, color):
+    """Kick off the ColorMagic palette request in the background."""
+    return http_client.submit(generate_slogan_palette(slogan, query=color.lower()))
+
+
+def render_heading(icon, label):
+    """Render a section heading with its icon (a name from `assets.ICONS`)."""
+    st.markdown(
+        f"""
+        <h3 style="display:flex; align-items:center; gap:10px;">
+            <img src="{icon_url(icon)}" style="height:50px;">
+            {label}
+        </h3>
+        """,
+        unsafe_allow_html=True,
     )
-    return slogan_img, palette_img, palette_text, palette_colors
 
 
-if st.button("Generate Branding"):
-    if description.strip():
-        with st.spinner("Generating..."):
-            result = generate_branding(description)
-            print("[logo_mark]:", result["logo_mark"])
-            print("[color]:", result["color"].lower())
+def render_field(slots, field, value):
+    """Show a parsed branding field in its placeholder."""
+    if field == "name":
+        slots["name"].markdown(
+            f"<h2 style='color:#919DC1;'>{value}</h2>",
+            unsafe_allow_html=True,
+        )
+    elif field == "slogan":
+        slots["slogan"].markdown(
+            f"<h3 style='color:#919DC1; font-style:italic;'>{value}</h3>",
+            unsafe_allow_html=True,
+        )
+    elif field == "explanation":
+        slots["explanation"].markdown(
+            f"<p style='color:#919DC1; font-size:18px; line-height:1.6;'>{value}</p>",
+            unsafe_allow_html=True,
+        )
+
+
+def render_logo(slot, logo):
+    """Show the logo image, or a note if it could not be generated."""
+    if logo is not None:
+        slot.image(encode_image(logo))
+    else:
+        slot.caption("Logo unavailable.")
+
+
+def generate_local(slots):
+    """
+    Stream the branding in-process, starting the asset requests as soon
+    as their fields are parsed.
+
+    Returns:
+        tuple: (palette_img, palette_text, palette_colors)
+    """
+    fields = {}
+    logo_future = palette_future = None
+    draft = ""
+
+    for kind, value in stream_branding(description, use_cache=not fresh):
+        if kind == "token":
+            # Show the raw answer as it arrives until the concept is parsed
+            draft += value
+            slots["explanation"].caption(draft)
+            continue
+        if kind == "result":
+            result = value
+            continue
+
+        fields[kind] = value
+        render_field(slots, kind, value)
+        if kind == "logo_mark":
+            logger.debug("[logo_mark]: %s", value)
+            logo_future = start_logo(value)
+
+        if palette_future is None and "slogan" in fields and "color" in fields:
+            logger.debug("[color]: %s", fields["color"].lower())
+            palette_future = start_palette(fields["slogan"], fields["color"])
+
+    render_logo(slots["logo"], logo_future.result())
+    palette_img, palette_text, palette_colors = palette_future.result()
+
+    cache_result(description, result, assets={
+        "logo_key": logo_cache_key(result["logo_mark"]),
+        "palette_query": result["color"].lower(),
+        "palette_name": palette_text,
+        "palette_colors": palette_colors,
+    })
+    return palette_img, palette_text, palette_colors
+
+
+def generate_remote(slots):
+    """
+    Ask the branding API server for the result and its assets.
+
+    Returns:
+        tuple: (palette_img, palette_text, palette_colors)
+    """
+    result, logo, palette = http_client.run(request_branding(description, use_cache=not fresh))
+    for field in ("name", "slogan", "explanation"):
+        render_field(slots, field, result[field])
+    render_logo(slots["logo"], logo)
+    return palette
 
-            slogan_img, palette_img, palette_text, palette_colors = asyncio.run(
-                generate_assets(result)
-            )
 
+if st.button("Generate Branding"):
+    if description.strip():
         col1, col2 = st.columns([2, 1])
+        slots = {}
 
         with col1:
-            st.markdown(
-                f"""
-                <h3 style="display:flex; align-items:center; gap:10px;">
-                    <img src="data:image/png;base64,{SUGGESTED_NAME}" style="height:50px;">
-                    Suggested name:
-                </h3>
-                """,
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f"<h2 style='color:#919DC1;'>{result['name']}</h2>",
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f"""
-                <h3 style="display:flex; align-items:center; gap:10px;">
-                    <img src="data:image/png;base64,{SLOGAN_TEXT}" style="height:50px;">
-                    Suggested slogan:
-                </h3>
-                """,
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f"<h3 style='color:#919DC1; font-style:italic;'>{result['slogan']}</h3>",
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f"""
-                <h3 style="display:flex; align-items:center; gap:10px;">
-                    <img src="data:image/png;base64,{BRANDING_TEXT}" style="height:50px;">
-                    Branding Concept:
-                </h3>
-                """,
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f"<p style='color:#919DC1; font-size:18px; line-height:1.6;'>{result['explanation']}</p>",
-                unsafe_allow_html=True,
-            )
+            render_heading("suggested_name", "Suggested name:")
+            slots["name"] = st.empty()
+            render_heading("slogan_text", "Suggested slogan:")
+            slots["slogan"] = st.empty()
+            render_heading("branding_text", "Branding Concept:")
+            slots["explanation"] = st.empty()
 
         with col2:
-            st.markdown(
-                f"""
-                <h3 style="display:flex; align-items:center; gap:10px;">
-                    <img src="data:image/png;base64,{SLOGAN_IMAGE}" style="height:50px;">
-                    Logo Mark:
-                </h3>
-                """,
-                unsafe_allow_html=True,
-            )
-            st.image(slogan_img)
-
-            st.markdown(
-                f"""
-                <h3 style="display:flex; align-items:center; gap:10px;">
-                    <img src="data:image/png;base64,{PALLETES_IMAGE}" style="height:50px;">
-                    Pallete Visual:
-                </h3>
-                """,
-                unsafe_allow_html=True,
-            )
-            st.image(palette_img)
+            render_heading("slogan_image", "Logo Mark:")
+            slots["logo"] = st.empty()
+            render_heading("palettes_image", "Pallete Visual:")
+            palette_slot = st.empty()
+
+        with st.spinner("Generating..."), telemetry.trace("app.generate") as trace:
+            generate = generate_remote if BRANDING_API_URL else generate_local
+            palette_img, palette_text, palette_colors = generate(slots)
+        st.session_state.last_trace = trace.trace
+
+        with palette_slot.container():
+            st.image(encode_image(palette_img))
             st.markdown(f"**Palette name:** {palette_text}")
             st.markdown(f"**Colors:** {', '.join(palette_colors)}")
 
     else:
-        st.warning("Please enter a description before generating.")
\ No newline at end of file
+        st.warning("Please enter a description before generating.")
+
+with st.sidebar.expander("Result cache"):
+    if BRANDING_API_URL:
+        st.write(f"Generating through {BRANDING_API_URL}")
+    stats = result_cache_stats()
+    st.write(f"Hit rate: {stats['memory']['hit_rate']:.0%} ({stats['memory']['hits']} hits, {stats['memory']['misses']} misses)")
+    if stats["disk"] is not None:
+        st.write(f"Shared entries on disk: {stats['disk']['entries']}")
+
+if st.sidebar.checkbox("Debug", help="Show stage timings and metrics for the last generation."):
+    with st.sidebar.expander("Last generation", expanded=True):
+        spans = telemetry.recent_spans(st.session_state.get("last_trace")) if st.session_state.get("last_trace") else []
+        if spans:
+            st.dataframe(
+                [{k: v for k, v in s.items() if k not in ("trace", "span", "parent")} for s in spans],
+                hide_index=True,
+            )
+        else:
+            st.caption("Nothing recorded yet." if telemetry.TELEMETRY_ENABLED else "Telemetry is off (TELEMETRY=0).")
+    with st.sidebar.expander("Metrics"):
+        st.json(telemetry.registry.summary())
+        st.code(telemetry.render_prometheus(), language="text")
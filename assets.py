@@ -1,23 +1,119 @@
-LOGO_BASE64 = """
-iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAACXBIWXMAAA+/AAAPvwGfsDKnAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAAGV9JREFUeJztWmeYVeW1ftfup58z58yZ3hvMDB1GBGlSBUFAVDTqTdTcRBNjyVWvGk1RYhJr9Fqv3mjUiAULBKX3NsAAM8MAU2gDU8+c3sve3/0xgFiSi7lR7vNc3uc5f/Y+a3/vevda3/6+tT7gAi7gAi7gAi7g/y3oPI3LT50x86VQ0H9DwO9PJBOJ1Zqm/bitrc31XRPhvusBAWDcpEuf8/u8t/zk/odDl0yZ/qAgCHNtafYPzgeX8yJAb2dHTWZeXkBvMCSmz5n3TF5xSSDg9+WeDy7C+RiU5/kqRVZkADI49DFNC0uybDsfXM5LBKiqynxeTzMACQzpZqutSNO088LlvEQAEaVsafZynJqECWDngwdwniJAFCUV9PnYDEgSEX8+uJwPATgQxKDXp+7fW4fGut3wezwSAHHgwIFZ3zWZ72QdcNVVV+mcefnPxmKxecePHF4xcvTYKVZbmpNx5JJE0RkKBLTjh9vCzQea4tFoRB8KhV4rKin/aOXypeu/bW7fugALb7jhEa/bc9fsBdcYBg4aHCciiTGcSKRSS2SRrwFoLIAUgCTAOpr3N73QuLfu3zauWZmRTCbfVxTlloaGhvC3xe9bFWD6rNlPxKORn9/760VQdLrTl48SaB8DmwPg7Lw/SWAHGWgKgKatG9b+1/tvvvEHWafbuWvHjrHfFsd/ugAvvvpq9YvPPot4PO7kOG7lpGkzhPKB1Ud4ScgQBcGgMaQITCAipFJaiuMg8DyHpKqlOBAviGJMEvhj4PiB61Z8GtixeaOZiK4goo4hQ4Ywp9PZ9Nxzz8X/WXz/1wI89cfnZ7z8wrMVoixfJvL8uGg0qieiHo7j2oeOHFWZlZmlQBTCZqPJbDGZwQsidHqFxROp9ngi4TTpdbpEIuHv9biPS4I4WOA45u5zRYKhkCEejTCfz6ftr9/XxnFciaqqAgAt3ekMpVKppbn5+euXvPfeGwDU71yAm2655V9dfe7HQgG/Od2ZWTtpytRhpeVlXTqD6Xqn3XEJIzykgR2PRuIlOp2scEQcYwyMIZpMJZYD/FxZErhYLP5fkWicNxiUH4iSlCLGNqpMG02MDP5QyA0CpZnNAaapWmdHp9fl6q2ur6trbWpqzDrc1pqWTCS6Sssqlh87evjupqam0LcuwLU33nhxX3fv+wMqB2ZfPu9KVlhY5AOQBuB1EFYQwyMMyAVonaqpo3mOs5+2VTVtE09cBwNbqDLtCIG7nifcAKJbGWNHieAGaEQkHutkTHtakXW3cEAZEbUByCSwkwzUDWAcGF4LBf1rardvf2rxX97MdLtc8bKBA3//8QcfPPatCXDrT3/23qEDTfPvvPff+QEDK09fDgHsOQYaQcA0AD0A+gBUnf4DI7SDoZ6AcQB4MNwPDgwMvyaAZ0AXgBIAR0D0AGPaDALdAsB7iiMPsFaAigHqBLHfEqP5DGwmCIu1ZCpv+bJPxrz60guCXm/YaDabFmzYsOGcouFcBeCqqqtfrqoedNN9v/glZzSZzjhGGg6AaDLARICSp1wWT9mpAFoYwUAM+QxYxRF7hzHuboBVAQigfzkuAXgKID/A7gNgYUCUAB2A46fu2xjRk8SYAOAOALsZWC+BZgP4C3HaS417G37/1B9+d0kw4G8RRXFyXV1d1z9FgFGjal7Pzcu/4pE/PGEVRckPMAuABIAkAMPfMEsB8AOwA+QH054HRwPBMO/UfQ0AB0a1jNiHBNwEoOIs+ygYQiCkA1gDYDOAHwLEg7F6EIaDwcc43MsxjGHAzwCs7Onuln9x790zEonESa/HU9nc3Bz8pgJwU6ZPv1mS5DuPtLaA5/msrJwc8xPPPt+q0+k9AEbjmy2hNwHsOEBXAVDOuh5moDc5sCIGTP+SDTv162PAYgCjCKhhQD0BZgD5jNHjxLFOMDwEwAuGZhAmAzB1dXTg57ffpkmKrCbi8T1ZuXnU3LT/N62trSvwpS/GFwSYOHXqyEggsEyUpIxBQ0ccbj10YG1PV+e/PvrkH3cMGDAABFz8Ze/iiSQ+W7UWFA+hoXE/DjU3w2rUwefzs0gkzNJsNpZSVT4SjcGo1yGhMsiiEBMFLgZOsPiDIXLabQgEgwiHo7CajYjFolA1LZ5IqoLZZOAJpCZVlanghYLcLE+PJ+gbNWywfsasmabCopI9APIBFJwWFqDAji2bHIt+/bA4ZsJEMIZde3bVVuh0upTP45nb0tKy+TT/Myuxa7///dnH29rWTpg63fTDn929Z+CgQfu3rFv7/dGXTOicOWtWJvVPUmdE8/m8ePrpZ/Ds00/iYEsbvOEEDnd7UFI+EKpsTiV1Npo3/ypOduRxHVEepswCpHR2Vjqw2n/1wmtUr6pYe2NEI0ePQUqxIgwZVy+4EuMnTujtjfNRP9OZp02bjksnTw31xEiKckbOnJ7R4QrGbJLAO9oONek+fm+xvHtnbUF+YZE1Pd3JAMQACAS4snPzEsePHTPV1+2mH999D82ce6Vl57bNu0OBwMMja0YHDre17jgjQGFhoeLu6V166WUzTXOvuY7jOC5tw6oVQxv37Un95re/swi84AUhhVP5/vEnS/HrB/8dXd4IlLwqcCYHIhCQmZ2DDk8IzoxMbmBFGW3Y1YiOXjdAHARBZNfMnhowmc3WxZ9uUERZQXZWJhpajqMgLwf/9qMbEi3tPX3vrtzqtNhshp98/xp20uXDknXbFUFSQiTIsSTj04cPH8KikDXZnitcOW82Wpr2Y8m7f0EgGKQRI0dGibguALkMrLuotCx96YcfUCQUMg2vGb16/JRp1Sfb2+nQ/obL7Hb7Crfb3SkAgM1m/5Wsk3OvuPpaCUBc0zR53YpP1Vlz5oIRrzKCgwAZAD5btlR77flnOF1eFUSL80wqaKoGl8ePjHQbPP4gjp78fAKuKM7XBpUXccvWbbVEojHY0yxwefxwefy46aqZUCQp/OjzbyiBUDRj7tRxkEQBT732LqVSKgyKEu7zBkzFuVkAkbZj7wFx4kXDMHfqJfh0Yy3C1mKUWez460dL4Pf59fc+8KAOoFYCDcjOzomMrLnIsHPbFlz5vRtm6A3G5pnzF/zoUGPDB7IiLwGQz//q5Zf1rXv3fDJh6vRIeWXVcgBl9bt3YtPa1cJtd/xctdvTROr/VGn1e+t6/rDoUZMuuxyi7atbdwIQDEcRTyQAAKLAY0TVAAQjUdq2Zz/iiSR4joM/GEZpYS4WXj4Ja7fv1T7bWCvnZqRzM8ZfhE276rF1z36kVJVpTIMgCFKGw4aOHhfAQD+9cR4kQcR/vPkh/MEQbrlmDlMlEzt2/AQdObCPS0tPl0rLyvQEJIk4o6wobMPa1WSyWILFZQO2WKzWX/Z0d/a0NR/Kyy8u3sq7jh6dHI1Gb5w264qXnZmZ/wJAXL18Kc8Th2tvuJEHAFXTugG03nPXnWUpEqFkV3zFeeCLdS2DXgen3YpDR9rh9X/+JeI4DrMmjoYkinhv+XoEQmEaXzMUKVXDqq27EAxH+sUkIp0skaYxeP1BTLhoKKaPr8G7y9djc10Dplw8HOXF+Xh76WpqOXaCZIsdWsiDA/V7+dnzrhR4jlIM4K1p9uDSD9/XqamUPHrchCoAbllRlNrNm3TQtC4uqaqjdTp9pGro0DsA7AbQc6ChgQ2sqoaqaoglkh0cOH7n9m0VfrcLptyypCgIkMQvlhN5Yxq0RBRaPAIiQjQeR3tnLxj7XJb8bCfGDK/G2m112FC7F9kZDlSVFWHzrnrUH2r7iqCRWBxGvYIfLLgMwVAUT7z0BtweD4bmWbFrbyPeWbYG4UgURIRp4y7C+Kkz4ff5aMPaNRoRpyWTqQ5FkW0VlVU4ergNmqYBgLN8YPU2IkpyHDeYszscM9IcDo4BtwHQe/r6MrweN+UWFCKZSiZlScxRWWrfW2+/3cJLCsoGVIlpVhMSyVT/W2dAwtOJRNADjQGRo3sRbKlFKhr5/K3zHIryshGNJbFx5z4kUylkOx3wB8PYe6AVKfXrN3Njh1djWGUZ3vx4FbZuXIt49xHEkhq2bNiAw9s+RcLTiZyMdMyfPh71Bw+jzRWBLCvYumVTOKUxvySJRfFEIuzMykYsGkV3ZwcAWi7wXMThzBBkRbEI7t5ezmg0bifgAQC5HncfACArOwscx1MoEvulUSdXWw2GqaygSDvR7eLCkWg/w0RYC7XVcelXPgR9aQ0AwL/5Lfi2vYek6xiMBVVQVQ0GRcHRE52nQxscx6Ozt+9rnQYAh9WCipJ8NLUehS8QghD3Q40EkHXT81CDPbDOvAvu5U8j2LAGKMzHB59twNgRg1BZWuh/oWmHqbWlNY0DOtz+wG5ZFEYU5hcwAOT3eCLZuXmTGBCOxaINoUAgwUmS5CgdUHkJACMABHze/jdLvD8Wj/3VoJMfJuDyw0fatB5/9Izz1eXFYTHm4zi9BUp2BRgYkq5jsAyaDGPVRMQ9nUjEYgDRmbzujxh2ZpL8MogI+dkZkGURW+saEQhH4LBZ4D9+EIbqSeAUPcT0IrCoH7kjJ4OTdGhvb8eVMyZoXl8g/vqSz8wOZwZFwsFEJBFvSjOZBukVxcdJkgoAsVhMD6CLiL2bm19QqdPpCzhN07iA39cLQATQGY1GEwCgV3SSyWCcyxjrBZE/FokQEVi63eq+fu405vUHDAGvB0gloIa9IBDE9ELAmgUhLQcAYLeaIYni1zp7GrIkgiMCz3EwGw040dWLjp7+6OBA6PN4ocYjYMk4Et2tABEgGxHNHArRZIdZZPho1Sauq88jO2zmcK8nwERB5A2KclUypdZ6/H6LLIoEAKlUUgVgZIx+5Hb1tobDoRQnyXJCFKUMBrwEoFen00kAkEzGFVXTenmOy4wlk22MsVRJbkZywqgh9neWrqFYIgHZYIQaDYKlEjj7G5B0HYPOYocvGkcs/vXVK0WWkZvlBEDQGIOqafAHQ1+YNFOqChAHEmWED26GmFkKLRqEFuyDFg0i4e+FLymA53kEgiE1Fk9olSU5nMlsVX2RyIvJVHJ0us3GeI7jAcBkNvMAZBC9aTRbSgxGo8BFY7H2Y4fbThAwH8BgSdGlAMDv8yKlppzeQKBOFnl3ZlaWeLStVVy7vQ7lRXlaJBpnmSXVUEw2zfXhIhY/cQha2ItQ/UpEj9RByK2CpmpfcZwDQ2VxLrIz7DjZ1Yt4IgGDTgERQY19/RZeduQh5e9BzzsPIlT7PjRwcC19HII1E4LFiWQyhSEDytjQyjJjY30j4yS53abXX23U6yQAvLuvv+tuslgBQAVjN/rc7kQykeoVdIrCa6pWCGLbidHJ7JzccQDQ2tpGw2ou3mc1myvBtNKs3Lx4545tsl7gEsc7usV5U8dFdIq86d1YdIrX1SMG//oYU2UjkdEBXeFQEPfVrltZQS46G7eidtkmKFmlcOSXwmQ0oqOjE6FjDZBsmeAVI4joTCQQESRHPsAJSPYehb+vHcFD28HrjNBlFkOURFacm00tR08gHA6qaiwo3HzTPaWn44gxhq7ODgiCgHRnBgDYAXij0YjVbLV0CIwxbywWpb7u3rAjI2OqzeFoNJkt1ccPtzKTQV+dSqV4gef5Sy+d3Lt7+9a8aPcR8Rf3P/DukhUbBu9par2suqwoee3cWYFPN243d/a4T43JSJZEEBHiiSRsFhNmjK/BocPtCJnyYS4yQadG4D60C92MAE6Akl0OvcUOg16BLxgCUxnS02wIRyKIxOKQ0rIhpWV/NaKIo+aj7dDrFXWgQ5IPp6ejZvTnm1YGqG2trXxRaRkkWe5P0XgiGI1EbCpjq7lEPL4WADpPtlcDuIMAqaKykg7sb+QikTDPc1wfAXvHjJ9gz83LDxxrbmSLnnx+QWdP34AfXzfnRF62U3v1veVmjzcQlQRe5YgoJyMdAs9D0zTMnXIJrphyCT5ZvQV7D7Ri9LAqjJswETFrPoTcaujyqqDPHYCqqirYrWZ4fAGk2ywYMqAUgVAYkVj8LGcJJoPuzKJBEkUtkUwizWJmJZk2uXbzekyeNQ8czwOAxhhj7j4Xf+L4MVRUVp+yooCnry/BcRwmT521jdM07SPiuORbr768C8BdAEqHjrroeDKZxOaNG8JMY3bGUMITf8fPfn7PFkmSub5DO7lxg4t7P1mzJXd97V7VYtK7U6qqy3Kmc/k5Gayztw/V5UV44LYbcLyzB3/64FNkOe24fu40nOxyYdOuhjPzQ0l+NsaNHIRjHd3w+oOYPv4iOGwW1B9qg6Z9vkAqzs9GaUEeC0ViPM9xGFZV7reaDRpjDMFQgOo3fobho2rwvesWnjYhAmm127YxIsJF48afjgnznp3b02VFWf/HJ37bwLvd7qAzPT0jHovdUFhSejQ9K/tXWdk5c7asW6N0dXRIl0yarDLGPpZE/id2pzM1ZNjwtrpdOwu2rFtlUlOqS29x6BVFNpUX50dPdPUIiiTR7TfOh8VkxItvf4xgOIzvzZkKRRLx4arNCIT6u1w2iwmXXzoGXn8Ae5paMWb4IFw8rAort+yCLxBEmtWsRmNxzmYxYdbE0TjZ7dKOnOjkBg8oZfOnj4tsrWs09Xn9nNOig3ryALKzMvHQbx6FIAinQz+qaqr43FOPU0FRCSZMm0EAEA4Fgy89/WQiGglf4/F4XDwAKIqy3mAwLqjdsqmgsnrw9DSHwywrOmxaswqlZWVccUlJDoiWEajcke40jRw54qHePk/B0UMNRZHe4xwPpvZ6gvLCK2bQ/OkT8O6n67Fi005MH1+D6eNq8P7KDdjffARMYxAEAbMvHYPKskJ8smYLTEYDbr76chw+0YkVm3aiojAvrjGW9PiD0pxLx6KqvCj04cpNgiQKdOv35lJxbha9sniZlEpEUWxiOLpvG8ZNmIi773sAkiSdSX0CxH176mjZR0to4Q9uPuRwZngS8bjjhSd/L5VUlG9Zv2bN08BZJbHS0tL0NIej1u/zFUyaNkOdNO2yk68880RWNBpRnnvlT3VGo6GcAYs4RicYsccBqMFgsOuttxcP21+/V/R0n4TGGFK8jIysHIwaNgiBaBI7G1uQn5uJ4yd7UJSbgbHDqrBu+264vX4MKiuAUZGwYcduyDzHZB4Bl9tn1isiWYx65upzp+KJpGgxG5HucAC8iGMnu6ETAC0Zw/CRNViw8FoUFBZ9ZXJUVRV33PpDOJ1ZB26+8662lgMH5rz1yosRUVZeX79m1U/O5MnZRiNGjBAtdvtvXN3dt8ZjMbPeYEAkHKbBQ4d1LHryiflM435BwCQAG8BQDkL52fYnTnagsXE/BKQQ8PvR1dODRDwOgecRicZgNhpABMSSKiwmI0wmEwBCR4/riDPN2uPMyhoVjSUEm8VYK0mSL6bSFKvJyIs8IRgMwuPzQxBFlBYXIb+gEDz/t89UvPXGn8LvvvVnQ0l5RUcw4M8AaI/b1XvrwYMH95z9v79VFqeqqqpRAwcNuaJ+b51AjN2zYOF1iX+5+Yer+9ei7DL0V4ZPV2859Fdbz+WUR/DUuEYQ6sFoMcCuB1AFUCMDe5sDu56Bqv+H5/xNbNm04ejjix4xM8ZunTxjFpdXUbrq/ttu836to+fywFmzZj/c1tbyq8sunxO7+ce36U7lWhD9lSLC5/2Bv1cuDwHUw8CyiCEMjv0OoCIw3AbAC2KLGCibGO7EP3Z2qQ+AY39DvevBe+5OpFKpOW1tbXv+J6NzOpfT2tqycfToMcmdO7ZN27VjuzZx8rQeURQMjOCi/k2UiP5I+DriGkC7ANIA5HNgLzHCywR6EKBLGfACMe0JgHuAgDn4+yJq+OpL6wbwAYCK9WtW6d/58xviqJEjr1ixYkXtufh2zgeTWltbNufm59tdPT2jc3PzQ0UlJW4CMgGEAOhxqmh6Nhiwh4ADAI0Gabs4xn7AiMYS6FECdmqg6zhG1SB6BoDzS+YpAOFTz3WjP+KMZwkQJ+BJEFvlcXvufu2VF5UDjY27a0aOGP7YY48dOle/vlGoJWKxDwDcbrVZrejv6/nRL8KXcQKg9QQ2HoABTJ1LjNdp/S2wIMDmgLgAx9hiEEr7Tc7qKzK0gGBkgJVA6wEMAJgVoNSpvuMnTMV9Bw82PlC3e9d9rc2HjjnS0m9e/Je31y3+Jg59UwHs6emjAj6/WjVocAv6Jy3WH/mUBJjIgEgsGv1zb09PeSIRn9/ZcfI/VyxfVjtj1uz7M7Oyh3Z3dry2/OMP37vlp7f/yGyyXKsoOl4URaYxrZ3nBZtep+8GUQcjdhEBqzmA4vHY9HAoeDAYDOs7O9p7Vvx16Sd1u3dH0+z2344dN3FERWXlgkd++dCSb+j3GXyT9jiNGlVzeOyEiRm33n5HjJ3q8xEoeaCp0fTck497IpHwm1ZbWk52Tk5p/Z66rcFgMFI9aMggWacUHWhsOBiNRnmLxZKjNxhLfF5PQFaUjIA/kASYUdO0L3DhOC4mSRKXTCb7MrNyRFEU24+3H1sBTdspCMLOpqam7n/U6X9IgPLy8oWKovz5hdde70t3ZtgAdMdiEccbr74aWrNyRSQej93S3Nz8rR9r+2fjnFPAbLYsqrl4jGpLs3ub9jdoO7ZuTd+8fl2n1+t5nOf5N5qbm7++0Pd/HOcsgE6nC69bvZLbV7fbml9Y1NPT1X3z9u3bVuE8nvO9gAu4gAu4gAu4gP8V/htC610nLAQTNwAAAABJRU5ErkJggg==
 """
+Interface icons and image encoding for the Streamlit app.
 
-SUGGESTED_NAME = """
-iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAACXBIWXMAAA+/AAAPvwGfsDKnAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAAGqxJREFUeJzFe3l8VEXW9lP39u0t3Z3uzh6yJ509gSSQoGHLAEEEF1Bh0BG38WV03H39uY3IjDrq5+s4bu8o7groKIKIKFuEALIEQsiedDpk35PuTqf37nvr/SOLLElMAsz3/NdVp54653TdqlOnqgj+g0hLS9O4XC5dwqyInL7Wfldfj4VJyYlKrytpP+K0OS2slO247qbZba9t+LTzSvSfkJEQ6hcZ/KylzVRB7fwXlZWVVnIlOhoC0el02QzDLJApxdcEhKvTRZzIJlVIByISA2N728zfBYZrcwlL1AWfnfxfma80URukmNfT2i92Oz1UoZbV97b1b45MC6mK0sbv2bhxo+dSlLn6+rn3GRt631aFqoX+ZmMnALmEk8y67A7IykpLGxhw3QYg2kcj09/y+O+SdZnhN7AihgEgADgOigEQXAPAQwm5h1B6LYDVAAgAr8Pqcu/fXPS018Hf1ttumXm2tLU3OMq/VKqQvL/n2wPbh3gmjPj4+GsJQ3ZOuyrKnrByxrqBVuMjRW8UzuKk3GuXzQGr/7zsPred3yCWiJoaqrpXP/nZmhsIIc8DUAMABe1nQH6hwFxK8C2huA4EdlD4AZAP0dQDiAFQApBYgPoSYEt/ny2hvLA+Y8+nJ/SCQIM0Qcq9XU19/2UwGCy/pVdiYuJ8MGR/TH6CJzo/4RAoFglefn/BE98vppQ+f8kOWHHX0t85Bhzvp+TGxGQvS/6S47hvQOiLAFKHZQhoKaUIBmFOAcITIPgnKMl3Oz29rIj1Z0VMGyh5ljB0DaVYQoETBAgHEApgAIACFDtBqG/F4fp5X71SYBPLOEtvpzGutbXVMZZuyenJOVTA4aiFOi4mPxEAvAD537bjTclV/y5exErZrCk7YOltS1Ws4N4eGKWds3htNi+Rce8AiAJwy4gQpQM2q8tUd6qZPfRN6fG2um5OKpekKbWyULvF2cpyrIr3CJzD5uoSiVi1f4RaI/BCUXCExpaVn7Q4LDHwU7lS2g/gUQA8ABZAd5uhR/nuA1ulgkDv0Ov1X4ymX0Ze9nS30VYUmhMpjr8hDQC6QXGIUiH/6MsFIrfVVVJVVjlHNBXjH/2fOx6tK2l7YdHaWT4RycEtlKIIwEMAJADgtLlxel9NX/nhet/+blu3qXfgc0JJgUgkqi0vrejCKN/wggULRC21LVEsy+pkcsmKr17ed8Juda2MTgtRhcYGnMpbk+VRaGRXAWgNifbLZEWMQ3DzzGj6RSdFR3osjhP+qSHi+OvTMNSfBATL63+srrH3WtMopQ8Ag5POpLBkxbwnFX4+L9/0WB6RysUeAE4ASgCw9NlQsKnYWnnsrCVtTrReO01zzxuPfnx2sn0MIy4uThKZEnJdT4vpJpZlblJpfQpS58V6Boz26xrK2vrrK1tC29vb7Re0CWAY5pAyzNc/+5EFfgzLDNpI0OexuHt+eWVvAqeQ7jhzpHgFAExqBCQkJLwokolm3/psvpcQwgHgAHAelxcFm06h8lhDH3jh/tPHz2w9ffzMpGbq0WAwGFwGg2ErgK0pKSmKdnPvLX5hvn9SaRVvsx7ZY+3t7d5z5WNiYnxZlt0v9ZP7z3pgnj/DjgwQCgrf2h1lHq/Ta2Z4993DFRMdASQ9I3Vj5uKEedffPzf+3IqzZe3Y/lahWx2kfH/X5v2PYJJL1OVCWFiYTKnxPSRWSVJzHpkv5eTic6u9fbVdn51+7+gdlNIH6+rq3huumNAIyP1d9rfJV0cvWvrHq5TDZZRSFH5dQot2VfUqtYr8XZv3n7l85kwOKSkpYlYpPk4IUrMfmMucazwF6kDoM/odFW+xYlFjdUXVB+e2HdcBG+gGpuq+4t0Mg0XX3DN7eLQ4ea8g2fziHntXY9++zubeNccPnXJefrMmDIaRi36gPJ8286H5VKyS/lpDyWYwtKO7tGOTtcMikWqlN2BwNRnBuA5oe67mPWO7efG6f6wAIUw/QPs8Lu+0zS/uIVK5uPDYwVMrrohJEweJj4//l9vqzM55LK9LppUHD5X3EtB9lNB58Ahc1b9PDxBCfig7Xvb9hQSjLiMAsHxF3vSTP1WtWf3UYp4VMQcAdAm8ELPlpb2cXCH97Ov3dy27UlZNFPHJif/DcOyd2Q8vUCpDfdVDxV0UMFGQ3wPEU79fL+VdXq3X631qNI5RHfDugQ3BFqezKO+2rDa/UNU3AK4GaPy2fxZaLb32d7761847r5BNE0bmglnvMMCjGX+cPeAb7luFwdFMAQQSQAfA6rY4pzUV6GWEkFfr6+sNo/GM+gm8/eev7lJp5M1zVky3A/g9ABz6pqS6rNBQVVFW+fAVsmnC0Ol0f7J2WO5PuDGtUJsQqKIUmRcJUZDaHeUCYRnB43C/MhbXRSNgzsLseIaQDXe+tCySEAQAQE+LyfjzlmIYe01rL6slU4BOp1tJCHk7dFbYxxHzYjMxmvEAHWg1MZ0lrVICPDjepukiB2iCVYfjZ4YPhET7bQMQTCnF1tcPKKbPj3v5wqjrPw2dTreYELIlKk9XmrJm5j0AVKOIURBsO/PxiU6GMEVV5VWfjsd53icQHx8/veZkk99D7676iVKsBoATu6pbupqMB/Z9d2jUTcd/CnFxcVcRhnwfszjRGbs0KWsMsZOg5Nu2Yw2POvsdQRKVz90YnBfGxHkOkCrEr4bpAm3TdAHLAcDr9uLQ16dDWHBPXx4zpoaUq6Zn8/2un8OujpbELk2SXiRA0E4o+UCgwhzBw6+v+6GSB8Xn5SdLCn+Le+QTeOz1Oxa67d4l826ZMTKsju4ob3M5vZtLSkraxyKYmZf9RPrsGZbE1CR7QlLSrqz5OXlTsHFMxMfHJ8LuPRKcGSZKuDH9wmoHKH0dAnZS0GcJSE7DvhpW8PAyQsh5f9oBukH0xJv3XJOYmOh3bvmIAw59U3ajTCURdJnhAACBF3BkW5mfc8D10ljKpc2ecael3fz/YvITfWKvSf5JOU25aKDDVJCUkvTtjJwZuks1PikpKRLAXnmgoiVpdaYAcs7ehWCrQPAKCLkLBOsAsA6TXdR0wMAIXuGvtbW1I3/airuXvrQ+f/dA5dGG7yhoT25e9tfDdSwAbNiwgdEbarenz4sVJeZEAgD0p5od5Yfrz1aUVb44loJqueo5zkccm752lkgdrU0Ky4k2MCxTaO+1rXCaHfdHJken+Kv8Crq7uycdKkdHRwexHHvEN1KrnvnA3BCGZdihqjMAXgNFPgFWAZAN+oMcKnqzsN9tdXndLvdtZrPZO+TEkO5m4/aVj+ZxS+7KEfEegVYebUgNCwv7squrq48BgC1btsy0GG3i5Kujh3dyroItp5pt/Y6N4ykpVUsFr8MjtnZZDgIAGMRE5yfclPv0ImP89amCw2S/0SN421NnpD6TkpIiHo/rXCRmJ/op/FUlymm+kZl/yvUd2tb2AHgOhDYDeB0EKUPiFhC6sbuiQ2vrGsiS+Sn+1tjYOOJwpVo8m1JKAiM0AICcZckMADgcjpWDKgOImzFtvYhjEZkczAOA1+2VdBh646RS6d7xFHX1u/5CKRxVX5bkUoFSDOYHQFjGP2J+HJ23fokQmhXR67a7n6cc2lMzUm/Hb2zBQ0ND5cRO9nJyLiBjXS5hxayHUvIOBbYA+Asouf4c8ZMAPUp5/LFuZ0UsGBwqPXr6k3P5zH2OXgCoL22lACzqQGW9QiNr8/GV3jHigKaqzqDACE0/JxFxAHC2tN1NKczl5eU14ylbW1tbK9FIn+1vMnKGH6vcOH/JkYjkYn3S6hlvzHluiSV4epjGY/d8npyWXKHT6eaNxpeVlcUpVcptLMdGZf1pDhVJRQWA8DdC6M0EeBhDKTcAFgqUAIgHyDVtxxsZe69VxrHcRVGqIAilAOixHeUlAKQAAtPnxwXbLE5daGionImKipLyPM2MTg/1HW5UV9xCJHJx7XjGD6P8eOkbUl/Znqaf68S91V0uDKa2qwedQbUAXpdp5f5Jq2YwGeuu2ivxlSoJIYXx8fE7k5KSzp0oGQ/r3S32kSzMfmR+v1QtfZYQ4gswLwAIHpGisAIQCJABwNfr9NC6nRVOELxfWVl5UU7CYDBYGIYxOAZc0wGIASgjk0MIKFi5XD6LkUgkqQIvMIFRGjrID1vVicYWu8V5dCIOAADe7r1ZJBV1l31a5LW2938HIAkAAUj4OYob/BOC0q5+arEmIjf2CVbCpgpUqE1MTfw4Ojo6KH3W9K95N5+XfGvWB3J/nyJBoK8CmHlRZwQKDJ01AED97hpCBcpQnj43ln5ShfhYf6+NNfdYAQBh8QEEAOQKaTYTEqvNBQD/ELVlkB8Sq8kRxXGMeaIOqKystPIufpng5SX6HRWPUzryJfx6nEUQRwEZAe6Lvzk9N++l66LCcqP3UC9uEEvEbU6LMz9lVeaH/omBd1CQ4VOicWHvtgrNhwy8wAtP6vX63rHkXE7PjwDQUd9DAUATpCSEgDrt7nBRu6FPDQC+/goFANgtTpvL7vallI5JOBpqamqK02al/a1P3/2C4afqPt3SpBMgZAkAE4B+AMEgOEGBDwnAEhF5MnHF9JC4pSkLO041O3xjtHbVNPW9k+mzdkc5I1ZIeyXg3h1PjnppFQBYzU4CAAzLdPqo5b5UEGYwAWG+0wFAppIYAHh7WkxFAMAwjGkyygBA+cnyl0RS0Z7GfbUac4PxGgr6AQg2YfDARAqKxQAoQHZTiidA8IhIJuLC58YoVNPUQZPpq6eiw9Fb1QmP1XV7cXHxbx2cugDA2GlpGfodrNLKpbxHUDLmLqsbAGQKSRAAkdfDLwIAQRBsk1FoCJSl7BpWLDIW/+tIj8toF0DxIIBqgP6CwWHNAXQ5AP8L2nYDmFCfglc4XPb5yW5CyM7a2trdvyXv9Xp5AKA8HZmTOKnI6/XyEoaIGM1QmQoABsz20wDAMCPlk0J5ebnJ6/IsF3jBv2pr6b2U0v8GIUUAycWgA9jzGhC0YzC6UwHw+Q16JwU21e+tCaO8EEEI+e+J6MRxnBcACDMyrZhtZmc7KFiGE4sIAFBe6AQAmY90eKt54T80YdTV1Z3gZOJX+qq7uPqfqu8BpXecU23DYGbWDoLtoOgHMAODa/R4aAVoscfqWtNSWD+NFbNv19TU6CeiD6WUAICIY9uGiqRypSSMYYmbcdhcPQDgtHtCh4SMQ0JTdgAAVJ6pWC9WSU41FugTzU1GHoBx0AhIQPA9AbaCYjkGl8zfgh2AFiAzSj44eoR3e81Oq3P9RHURBCEAADRByuF5xmPusZp5j2Bk5EqpGwAGTDYHACi1ci0AEOacNXxqEBwm+zJGxFjLPi3yeJ0eLwG6APIMKBIpsBZDofMEIKdAbUdx87sDLf3zCCHPnD17tn+iiohl4jAAUGhl7qEiqdvp0YplXBdj73dWAIDV6JABgFI7fFcBORPtYCzU19d3825+pbvfKTn1zpEWUHIMoC9j7H+dYvCw9bwyCvxEgN62o02Pc3JxY21t7SejNR4Lboc7ihDQ8IQgKQA4rU6j0+YmDqurkhEE4SwAdDb1UQCQKSRQBygg8IIuKipKPR7xRKDX6/dTSl8eaDNntRxruAuDwdFoaSo9gLMYnAuG690AagmwsOtM22JTQy/jsjrXYJLnj9pg1Q2BEVpIFRIHAGdDeWcTAFBKKxgApQDQ3WQamSIVGnkrAEYqlV7yKACA0NDQ50UyrlS/o8xnoMPsxOAkOGgEQTso2TwU4saCohLAcBZXDCCR9/Bi/fflgk+QYnddXd2JyfZv7h6I8g1U1JDBVUba02ZKBgBCyHFGr9ef5SQiS/2ZNgcG99xC2tyYYACglC68VOMB4ODBg163zbUcgK38s1NKr4sfAOCmwJuEYj8IvRWU9FJgEwiiAPie2/7s7upOl9nptnVaJxUpAoMpNUGgkbOXpw5/dsbqo41mEce26/X6NgYAPC5vQV97v8xqsgcAYOJnRjAAQBhyOy5ct6cIg8HQCh5/sHUPsBWbiswU5G4A11LgWlDyNCjVE+APuCAWcJrsrU2H6wMECG/p9fq20dnHhspffpePWiYk5kS6AUAQqLrjbF+IRCbaDfyaE/wOAGqKmh0AEBzjxyjUcovAC8FxcXGXZRQAQHV19XdUoG/2VHRGdxU3f0YodlGQ20HoOhDcPEoTWvdD5TQIcItF4len0CWxGO3Lk7IjmxiGiAHAUNwCp93N2gfcm4EhB7jd7u8JAX+6oJYAKCaE2LPyE00AQAi5rKdBKpXqCc5HXFOxudjTW9slENDvAUQPVZ8X05sb+0jn6VYIXn59ZWWl8WK28ZEzd+b1DEhS3q1Zw/wo+bmWF0u5rtra2oPAkAMaGxvNDMPubChtE1tNjnQA8jkr08MYhngZhlmVkJAQPXoXk0dxcbHHaXFcRxjCGH6ofEjwCm4MzvaHAFiH5SilqN1eDk7GmTwezztT6ctqtj2alZ/o8hvK9djMjqbSAwbB7fT8E0OT8EhanOf5f1AKZt/nRfUAupVauXH2damEUsoxIublqZt8Merr6w2EIXcNtPWLKr883U0o2QhgNoCR/Ufn6VZYmk1wuVy3npvknCiy52YuoQJyl9yVMxxiW3/ZUa4UiUWsRCJ5f1huxAF6vf4wgFOn99dGuR2eQAABebdmsWIpB97Lr4qLi8uYssWjoLqy+ivCko86T7dEd5W33UmAPmDwSovg9lrqdlQ4CCGbDDWGPVOgZ112z7/mr87wKjSDgZ3b4VEc31mhEgT+tfLy8pGt/nmHo4IgPOtxeaVHtpfZAUCpkSP/zhwBFIQQ8o8L5S8VLofrAU4urirfckrW32z2IcAjgps/WfbFKRUIsQK4fyq88fHxD4nEIn7hH369C31kWymoQHmn3X3eZHreEmc0GuvDIkMXNpS1x2blJxKJXIzwhEBSsr/W4LS5M0OmBaG7q+fgVJQaDWaz2avyUW6VKqQ3NRUa/DvPtCU0Fxrme2yu7oDp/nNP7j3ZMVnO1MzUdBHLbLn/zZuCfHylIgAwdlraN72wm/O4vP9lMBiKzpW/aI1XqzRHAdzX2dDbmbEwoZAQEpZ0VbRw5uc6H6fNPdfPz+9AX19f85StvgAmk8kWoPF/j+d5vVQjV0uV0i+U1OfmA9sO9EyWKyoqSq3W+pSseHiBKio1BACshNINf7/1cynvERr1ev2TF7a5yAF9fX19Wo3W1NduWR0YrokLjNJ65AqJNjBSe7DyyNkYVsQuVylVn5tMpqlkjEZFT08PbzQayzsa2r5pNbT80tjYOOm7hllZWRwrZvbNX5Uhn7U0WQmKL0CZe/dtOvlQm6EnT8JJF3R2dg5c2G7Ub1qv17+r1MqLvn6twN3TZKoGgKScyLybHl1Q7fXyGpVGURQTE+M7Wtv/H1iwYIFI6is6MGfF9Mz5t2R0ggp5IKjoaOo5cnjrmauCIjRrxzrhHjPM1fr6bWNFZK3+VLMuNTf2I4mcmxEc42+PTAr2O7mnWi6WiK4LiQvd1tXSddlGwlQQFxcnEfmgcOaSxJTFa2fdxzDYRyl5x9bvuOHdh771OqzOp07+UvLhWO3Hzb2npqbGuj3uY+HxgZJ1/1jBDWWLaO3JpqrtbxYuHjDaDaBkWXV1dd1lt2wCSElJCfZ4PJ8A2Pja7kfqedb1GijJd9rdwsdPf4/ACG3dlre/TxyPY9xlraKiol4mlS3vbOzjXrtjc6nH5dUCCEmYFbno/jdXfuoX6iuwHFOl0+lWXk7DJgKdTjfP4/F8EZEc+Oqre+/L4xl3MSjJd1hd+OipnUQil568963M1N/imdBl6YSEhHSxjDvmP83Xfftfl76l9lesB9BLKfX/8f1j3xz/oWJJQLha36LvWlZfX999ydaNg6ioKLVYLH6BsMS2/uu722VKyXoAfgDgGHDh/Se+c7Ms2XRg19F7JsI34fcC8fHxiQB2BYSrw9Y+v7Q3IEJTA+BqAlTbra6MHe8ebqg71RKu0Mg+SJgZ/dcP//5l15QsHANhYWEymUx2LyEka8md2cfzbp15P855lmPqGsBHT+00OW2u9aeLSie8d5jwXr+vr683ODh4E8OSaw9+XRISGKYJD4rSSgGEcGIRUufEaLLyE3mb2ZF9dEfpHdNzkxbFJUc111c3NU3O1F9BKSWd3rp5lk7n7RzH3Z0yN6b4sQ9vnRmdFvo4gMBhudqTzdj2z0IkXhX18K4tBe+NQ3kRpvJmiM3Ny36/t6P/7tTcaPsND873UahlvyoNnHA53Orqow0xv2wvN9r6nXKL0fZ55uIES/Humo01NTVNGOPq2icNn0gPbDzgc2LbielBkdrV2hDVjf7TfGlLWfuSdW/fvAYEj+DXOwJwO7348YOjcFpdlrzbMtfdN++FryZrzJQfTWVmp8+lIN8IXiFwwe+z9Lkr0ztFImb+BWLe3jbzpva63qWNVR2iMz/XNXMSUbLXw/fYzI4mpdZHoQlURLTqu05pgn391YGKZFCUR6WHOqbPi80NjNSUE4p/U0IeBBAybDcFmssLDdFFP1bRxOzIT2dfE/nnVSkb3JgCLunZXFxcnCQgTLPB2Gm5LyBMrVq0NrsvbW6MP2FICyjCMfhPEww+WTkFgpkEaKGE3Oayu//qsrt/x7LMz3K1zIcAORSwkcF9uhKDuYE2gAQDVApAAop9ZQcNgWWHDenaENWJjPz0VX+e/5eWcVS8sg4YRlpamobh8BQFfQiU9M+5ebol9/rUMLlSeoACSwHwIPRnULKYAGcokIbBS5rCkA7DepwFEDFUZwJoM0BinVZXy5a/793Lu/lrdbMimOkL4m6/J2f9scuh+2V9OhsXFyfhOG6VNlT5bG9rf5guK5yNnTGtASyemr8y4y8gmDk0EjIwGIPwADgQtBCQjygV7gJIGICfuhqNUQ3l7dEl+/VnmvVdJylPv318y+Mn1s1cd0lviC/EFXs8nZaWpgmKVf+huapLx0lEC31U0miP21uZNDtaJ1NKTBIJZwyM1KQ0VXftrTvZdCJtge4ZY4elr6Gs7bg2xDcyMFLjbq/vfm7/d0cO4Qo+xLqSr8cvQmxsbHhGXuKsiiP1Nl12WIalx97fbujpFsvFxqV3zw7a+kbBd1NJf10K/g8oE3BCOIln1QAAAABJRU5ErkJggg==
+The icons live in static/ and are served by Streamlit's static file
+server (enabled in .streamlit/config.toml), so pages reference them by
+URL instead of inlining them as base64 on every rerun. Their bytes are
+read lazily, once per process. The former base64 constants
+(LOGO_BASE64, SUGGESTED_NAME, ...) are still available for old callers.
 """
+import base64
+import hashlib
+import math
+import os
+from functools import lru_cache
+from io import BytesIO
 
-SLOGAN_TEXT = """
-iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAABHNCSVQICAgIfAhkiAAAAAlwSFlzAAAB2AAAAdgB+lymcgAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAAA8QSURBVHic3ZtrcF3Vdcd/a59zz31Iunrbiiw/sKUr28JgMGMD4RkKFEga0mJS2pJ2EmAy0JJpkiadQolDGSAhQ8MEKDSESZimBEoGWkoMqQM2JsBA/cI2lmz5gfBD2LKsx5Xu45yzVz/cK8DGD0m5N57p/8u95+y911p77b3XXnvtdYQCpOPiP7+OXHq+37elByDSOK81zA0N2KE9fRKrTLi17W3+vjUbiCYrIvWtc/y9a98BcJLNjcZLJv2+zu2feHaiEa/ptAVBf/c2NzlzZv6D9ZsAcCJupOmM04O9b69TVWuS0xpMNFkbHNiyDSfiek0LT/P3rltvrVWv+YzTgoOdXTbI5CJNZy70929+17GBuo2pJf7+rt+6yWlZL+a+sG718gNMAm7rkiuSkWB0ox3eN90kGl+XaM0md+qpFzuxqjm2d+PTbsO8OqdmxvnkR3ZHGue3OjXTzw+zQzvVifre1I5znIqmRcFgz0qcaMSb2nGOqZi6KBh8f5VTOyfl1s2+GJTItCUxzR7qAkad2lPa3Lo5F2PDPE4s6zXOW2wqp54VDu9ebWpmzYrUz/kMqnlT1ZSM1LddJI4bd3LNr3rVLUswJkJy2m9NzaxzRXAdzBnh0N75o0OHRlpbWz/b3d29aqIKkPZ5C/4J69+WvOIHgyZW/wToTYCPyAMonwM9FVgFTAVSCrch9ItyF2Cx5q9wwhZU7gaGReWfFZYi9nzEHER1iiLfN5afqeEHoFeC/JsKK4zqnRbiIPcIeglwOfAkaAhyPchLqGYRrlblGTDVIvZy4BCKIOSCwZ1/k1517+PieD2dG9d0THgGqAYLnYrGwMTqakBvLb7/ANXbAVAGED4D+r4itwl8EWWRwvNG5DF17N2oLAJ+AQQq+iNgBMRFNQHcIHC6Gn0HCBAeVdUFovxUlbUibAa9Fzgo8KLC1SAjCCtQvQDhoKK/FJEvgI0U5atF5E1U/9OtPuWHTsNcDT7Y2DDRzgO4Jl7XhBsLUDYjLCy+n/lhDaEG2IjQK8r3gBzCvaLMVNXngL2gz6PmShVNCiiQRNmJyHJE70O1DkijdAM3FevswDAL5QzgAOAoXKXQJ4KHchmwSlVOFWHpEXKvUTQqwj3AcjKHkiJm/qQUYEf69jtVTdOLnQ8Bp1imgACjQCsqC4AdAmtUuRWIg+4GMSB/BDYU5V2MfAolgRAFvQHFK9Kr/JiCBZiNfshnyhhPgUaUXoHtCheJKIBflC0G5IEzpUDj1woJUz1jcTi8Lz0ZBRiTqJ+KE6kW2AQYlJ3Ae0UhKXSUOGgfUKmwFEgUBJLpwDRF+3DkbkQaUeqAAdAdSrGLhQ4cC3L4o+4AmhRaiy9WI2wodj4sKkCAIeASgQvFcR2MiTAJGJsb6lc/GypME3gIYZTCEtgt0PMxORv4aKQAXBAL+rBRcweWbwO1CI+CrgI5T6Af2AGYEwkikEbIgZxSVMRWEf0aSBLlLOBVUVYClcUmSYqz1Y4c2KZBbpIzwI1XYoNRUblN4UvAdOAJYERhBkeMkKiGRQE3O6FNIeKo6MPAclH5PCpng1yF8CjCHmA2MMBHs+FoGFXoRRkBhhD+TkW+rSrLUE2qcAOQVeGSI9pZEb1bre/jeInJKMDV/NCAxBtURR9E5WcitkeRbwFRYA8wRUM/kn33uUF//8akBhmj+ZE+9Ufjxqt4Gydaofn0PhvmOyJ1c/7LqZjSFW2/4l4nOeMbKvQLrAFOP0KRI/7edbHczpc1TH+A5gaHjFc5y4Z+hny6XzG3mnjNNA0yAwI9iSW33BFpnD+j2FYBv7i8XkHlKyZWWyW6PTsZBRgTq6kX14uBXgFaq8h3gG3AOqAZdHDkte/v8XvXJioWffk3btPFbZ4JU9Fo9CwvOWsu0Ypmz5UOLxJZEgaZ63J73p45uvany1B5RpRRhVOBgxTW7yjK2vyuV036rYexwejSeGVVs+cwv7KmZbpHbqbnRc6Ies7p9TPOq5EgcxEm0px+/Yctmk8HwBpRXgYiAq7AHwJD4fDe19Xa+GQU4IaZQ/0myO4HeRxBgX9FuRShBZXHND9U7R/svjYy/dzH/veRP7vx8OYbj6T3THv73CVB/45vWn/4S45X+Q7oeyBtCi8JxBAuyu5cqU689o0tbyx/7pi0Nm4E2NjW1vZ1EXk+u33FI/F5V9eqcB0wCCQU+gV2uvWpS4PB9+1kFGBMrKYRr2o2ypOoLAduUKFLkJsQe6HNp68FJd/z5tPjouhWDAFoduhFhXZEhkT0HoHTgIuAtB3sGQhH9m8fn4CmB0DEuQxYisqPKexYEYFG4DI0xLjRyS0Bmx951Y7sFzu8+08Qe6HCNUZ0raI/FiQWDvSgiLU23zkuijafAxDXO1eRZahuUpV/AJqBParcguMlJF7XOB5yYRjuArH53vU1GuQvQLQN+DSFJQWqo/m96w6o9VdOvPvg2iD3kONVfmXw5e82Iea/ozPPe0TcmNj+7U9IVdPn8r3rQ2/K/J9vfu3Z9ydCOEzvuz2SqL8dpLIo7D6FdSI8rqq+ZAf6x0Onu7t7KJVKfTfs375s+JVl/+M2pEINshslXtehmYF3/X1rezXItlhrvzYpBXR3d29vbW2dboy5AidSb3MDA+GuDbvC0PdjVVP7JDrtJ5tfe3breAmKhqECTuW0B0D+HTgHqAWaBD4rqveh4VeJJMa9bW3duvXO9vb250yi8S9zPW/scCsbWzTduzo8tOtda+2m6urq19esWXM8Z+uYcKGgZeApALZs/qh027ZJUIx75IcJB3tuNom671A8VyiEBp5VkT8WJ5pAg3AiZLu6ut6hq+sbExfo+DihhzZR2PxwFsCpmf4A4FFwq5HC3r0UaAGMRCqqSs17MnBLTVCiVRWaGwZ/9BfE65uBq4pFYy5sVMN8WvPDH4yX5ty5cxeo6lxAVLUGyInIQBiGA67rvtfZ2bnrWG07Ojoqfd+fYq2tdl33sAH3fX9/yRWgueERAHVii4AzjygeFfROxCyTWG39eOi1tLTEwzC8S0QOsxmqijFmmrV2XiqVWg98c+vWrb8ZK587d+7l1tpv+b4vwG5jTMZa+/H21nGcX5ZcAcaritn8MBjn1COKhkV5S0XuFBHV/NDgeOjt3r07A3z+WOVtbW3zRORB4Nft7e03dXV1Pd7W1na/ql5gjLmus7PzuAa85DaAIJP/2NM7QG/xf2XhMCOPaBhkcbxoKdht27ZtS3Nz8+XAr1T1oVQq9aCIXOu67qUn6jyUQQHqJmIAmhm4Xwr0m4pFIehTwIUSiVYaETkmkQli5cqVgeM4N4lICNwM3LN58+Zx+RmlV0B+aBTAxJI3KHwK2FUoIA3yRdAFIAY3UVFKvlu2bNlnrV1RfPzVeNuVXAHiJRMAGuReBFkJzCoUUDPGU1GrQXa01LyNMV0A6XS690R1x1D6XaA4AxB3Fuh5R6sjiEGk9PYHchNtUHIhTKQiCiBu5NPHrShOyZU/hoaGhnHbl9KPgvpB8d9RXV2FA9ggjw0n5AqXC6U3giYWHft3jCpJjOsh9ngxwt8JYRievBkgjHXs6GtcCrFGRJxy2AAAgiAYtwJKbwTD4hJQfAph68M7quzUIFOraodLzXsyKP0MMMUDh4YfHIX+FmCDuPFq8ZLVpeY9hoksgdLPAHEKV2vGaRl7RSEkHgKzEOo0yAyqDQ+VmvcYgiAY98CWfh2GOR9A0QFgNR9dizkU7hleFjdebaI1dSXnPQmUYQkYA6C5keeA8+DDy9EQmAJ6KWF+lCAzqausUqMMM8D3AYxX+acKbwBj4WoHiIGkMZE4jlOS0+DRUFVVdRIdIdfzANRPPyGwmMKt7hg8YIQgM6h+ZqTkvIvwff/k2QAbZAv3Al7Vl/lo9MewBmULkURNOXcBx3HG7WSV/iwwFg+w+XUU8glyAMXfuYhepP7IIc0eOlhq3h/KYMzJU4CqHwKIuC3AC2Pvix7g+yrmPokkqk2iYWqpeY9heHj45CkAq4XIoz/6AnClfJgXoH0oWVG9hyCfsaN9444KTxQndQaIFkOvkYq/UOE/KCRHANKAMFuFZ3C8RDlnwERQtl3AZvr+USyX8VFMEEBFuRrrZ+z/Vxtg86NZAJNovAchz+GpMXGQLTheQrzqmqNT+N1xUneBsZigDUaepeD8fNwp8UBPR7WQ51kmuK47bgWULSZo3IovKBz1WKY2yIufGVfYutwoX1Q49NfIJ+mHApvEcT2J10wqtXU8mMgSKP3laJDOKiCOu+QoxY7CbGyQtUFuoNS8x9DX13cS/QC3Yuz0dzQhLLAfE4mbSHxSeX2lRuk9wWIsUMNgk34yTm8EjPoj/TY7VLYZMBGU7WpMHHe+HJkHrKxVeEoiFXUmUT/lqAR+zyi9EYxWFe78bLgJiFDINgdlQIQG4G81yAyX0xWeCMpwPZ4rnP6MmQn6NGPLQKhRqEX1ehHHkViybI7QRFB6BZiCDbCZ/gcUuVo/TK2nV+DnCD/C8RKoTiqzs9QovQ3wc3kAJ15/h8CK4ncIDhBR+Goh7V4QMc7xKf1+UDYbEAzvvRmkHlhULBrLCdqj/sgBmx0sW1h8Iij9DCgmSTmVTX8PevbhpbJBkH+RaLK+TMfhCZ8vyuYKi5jCh1da+FhC4QBoRNG7BDFqw+B4dCYDVY0DVFVVjXt5lfFihEFRfoKQAaSY2V34skv9vPrpoZLzLnztQhiGM05UcQxl2AWMAOjQvjtUuJZCntDH0YW1oXFLmym6aNGiCHB+QQRzzXjblSMgkgEwyab7gbFO7qdwDgBoVYhhs32l5JtOp28p8nsL+Hp7e3v7eNqV3gg6TheAv2+DAwwp8j0KuYJGoMdmDjmaTxuLea1ELE0qlbpRVe8Crg/D8BpgUFVfSaVSf3CixuWIypi5C89ZbTP952C8Fd7Mc88Q47pB/45X3OSMxUH/1qnYYOPUpLN45cqV4zaEqVTqRgpfnYwAiIgDnKKqi4Fea+2t3d3dbwK0t7c3q+pDFDJM36EwKw4LwBhjXuns7HypbGGp9vb2s4DT3Oazzvb3rd8hGmhk2uJpQfbAk52vv/jGBMmZtra2vzbGxFXVULhiOwDstdZu6+7u3ny0Rh0dHXVBECxU1TkcPtgahuGL27dvf///ACdFcxTFSdUOAAAAAElFTkSuQmCC
-"""
+from caching import TTLCache
 
-BRANDING_TEXT = """
-iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAABHNCSVQICAgIfAhkiAAAAAlwSFlzAAAB2AAAAdgB+lymcgAAABl0RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAAB4dSURBVHic5Zp5fFzVke+/de69vaq1S5ZkSbbl3cYGA8Z4AbMZA5lsJASSkGXIxiTDzEvIZCazZCGTycbLMtlImHnJJANJhhAIhCGEYBx2YjC2AeNV3i1rV6u71du9p94ft2XLstmcz+d93vu8+kfqe885t6rOqapfVR3hT6CFCxdGlp930fX79+7q2LenO1hyzvK2HS++sHHewtM7Dx/a3zvY3589Z+V5ix5f/+Bzzc0tqfZpXdOf/ePjB6pr62sam5q79u7esX/O/EWzt2/dsr++vqnNuMakh0fS02fOqu7eue3FZasubH3q0XX3ua7bW19f/8z69ev9P4Xfk5Gc6sQPfOBj07bteGFTf29PbV194+jZ564qzpwzv6mqKrWnvXN686FD+++uqam7OAj87MG93U82t7S9fdfOl54aGhzItbZ1rBkZGhoVI6a6utYtFPLbu2bNXRKJRrY1t0xtFxGnVCyOHOk5VPrWVz97bzGf//hpZy7b/8fHHp538ODB/P8VCjh76bLvjKaHP/bBj32Sq679AMaY8VeK0IsyBegW8BSqVbhflKXALMAHDDAExIAqoAhEK2sUUT4vwkuB1a+sXT5vzrwly+xgz6FsbnTo9E2bNu09Vb4nk3n1IScnLxq5dP5pZ3D1ez80UXgAQWmp/D9TIQX0i/JOQuEB3Mq3GwmFh2PCb0C4Flit8CvQVoAVl19pLrvqfVXxqurnL7jggvF1/mQ6ZQWU8vlY1+y5rzRk/HTVArNfw5JFlK8KPI1yO8JaQFQ1BWCMYeq8ReaN7//LZC5ffGz+/Pmtp8r7RDplBQQ2COLx+MhrGPpazOxZ4IcI1yn8JeBNHqAa/p06Y07mrz59U9A8tXNze3t7/PXwfDI6ZQWkqmsDxESB9Cl/XSmgPEDoB24gNInjyHEc4skq8kMDex1jyrFotMqvapxyzkVX1CxesvSPH/7BD05Q1uuhU1bAWC57oDA2lgfKwCFAX+cSfRj2VI76wlcY9/DsufP3PfbAXdP6Dh/wHGMGG2qq5bRlqwOvqnqh//zO7Z/7nJ6yHO6pTqyqSqWymXQ/oUd/JQFORmWgDqX5Fcb0ITwDnPl3n7/Z++JnP1X4ydf+MeaXS41BEAgwfvxn1E/Z+BHg+69bCP4EBZTL5VJtXcMMIHIK01/p2CrCNpQIymXAvqbmFv3m936SLJVLnxvoPVJ0I96nBDk40H/wxn/9yhdubm6ZuvipR9edkhynrAAxYlREAMvLm1KWcLdreS3OUCkgDKPMIzxZo8AM4BGBn3mRyF+0dXTOVuGzAnuaprTcsnrNG7w7b//xCb7jtdKp244Xifjlcp4QwEymAOFJYASo47UCLiECtFbGe4BB+ZrAoArfFxgUeJcoa1H+Q4VbBvv7/s2q7ThVOU5ZAUZEIpFIFaEHn0iPCdyDcjbQ/ifw8zDwa+AGhQsR/k6FbQp3AKhylcCFK8+/+ON+2a87VTlO2QRKhWJB1foc8wHdW7dsvP+eO392TSweX3Wq6/q+X8jlMv2JeNUyL+JdmB4e2pfNZodbWts+jwgXr33Tl08/e1lShLsU1o2N5bY6juk61e+dsgIc13FFjEto5zejJLpmz/v4ytWXeKqvNyKGVCwWekBMNBrt8P3y8OBA3+MLFi2ZH4vFzxgaHHg6kxnZO3v+wusFcsAfRFmVqq6RIPBHT1WOU1aA63reQN+Rl1T5W4R/EWFxLJ7gvIvWnspyPqG/GM8hHq38XQMcVPi6wEXAW4CdQEPlneZy2YIN7P95HHD40P4DbR0dTSL8CnBeZpgCJY4lOq/ER6NCv8ABYBnginC/WhwRPgGMVCLEaRPmBdnMqGcc51RC8dEPvyy1tbUlauct+Xz5yJ568X3PpOodtf6o5kbTyarq5VPaOpNAHqg5yfTDlfUngx3lxKigQFpCh3omcEChG8uFCDHCUFqNUnvcLGHg4SeeeD4/llsxd+7cWxBpI5Zo1bHsCNBjmqdtKq18+793f+UjLwvXjypg4aq1p5fyo2tMdsRobWMtw73bTePUr/lH9jWJE9nl1E6JS7yqzQ73Pm+qG7xCUKo3xigTdj8IAh767a/TI0NDQ/FEotUYJwbguC5rrnhzznHcPFB36MA+Z9MzT00UBJRaVbXlcmnAGKfOdd3VE/j0IMwIV19yOYlkFSLcvuFQf2T2tGlvf9YYXxM1K01Nw2z1S1lbLL4gqbrLNd13beThn75vzpJzfk9upABENZKwJBJ/2PnHJ+47qoC5yy+8vzywf61UN2S0sU2AIvHqHjtwqCn1nn8KTH1LOyJRFf25qMwDFrn3fS9tVasnKLHYvWv7I7+87UcrXc+boaohTlKIJxLpC9f+Wc5x3Dag9OQjD7Hud7+ZaDaCgqKIyMuCmmg0xjmrVh9JJKp+qnDJGVMaZjw4PGzdREpjH/jn0xCeB+7A8nGEOjs6GGR+9JnFEku1W9gn0WSreJFmHRm4cc7SVet2bHhsjTtvydLVdqR3rSy/UkhUVxM6pEH80iIe/TlS12wQiQFlUXlnhZdh48XqUAkIj+9vFfpmz1nwzh/efm+WEBzVARtQhhEuAqoVdgg0vv3d19W//d3XnUzGV3NmD6OUET4J7C0F1qYcMeJ6oUmptIDeNG5g6sUcjKP2zEu/bhI1HyXMNp+R/Oh8nr5n9eyzVi0zNhL7IA1ThUT1+EdcYDo2QBUEGUd6E/F7KorNFYKAZw7236PQIfBmhJ2EScqoCt8D6hAuBbYhPCUwE6jn9WeOw4Q1g3MR1gAZYHoi4tYZUNd1x0VuGp9gi/kX/dERX4wjxov8M9BWke0c4tVRbZpmJOJdbRgdyYtxT4ijagOLiFrrF1E7mWG/v+gnh0Yz6bOmNl0h0I/QB3QJ3AI8IspfAAngP4EqlOWE2P61FFEmUr7C+FmEyhWgGpBSYLND+aLguBPHAvqciJkZnTI1fBEEk9fMSj77ex3py7okqxrAGsJdKQD9QIf4/g5VnQeSQsSvMDHuvSMNMa+YTCTqBsYKTzclY+cJ/NIq38nlMn9vrTYUS/kfG5yGSDRyLWjWBvZ5Y0wnIieLGCcl1/OIxeIvV/XJOCIadRz1Axs4cBdwBWBBlkgkjLwKyHEK0EMgz2p1/RsMdq9L4JdAYsCdIjqmKu8BBMfMQ4RgLIskqxHHmRi6TM630bjn4hppUbgGyzWHD+77zvvffun4mD+fML4KWPRaBR+nlrZ2fnrXQy/3OjVSKD4+kknPjhkiClcyCY8U+g9bVM3xFicNwFrJZx4lmz7kSrkwZtP9Dxgoqsp7j40zoIqXqhHEnGCzxhh29/T2JDzvSwL/JsKBtvZp1/77L+57n+dF1/jl4nP5QnFPVVVqrYgkX0lQVS2KSIRJ+CAeT7zclJzCM/WJ2IKpjQ1NO2InLJ/zM+mBSE1DZ1FEMSbgWLSKKmwlWXcexbG9rg3sqEnE30qY1OSAJNCnsBmRNUEhnzGxeLXIcQ7aFjIjPVO7uupEuFmUvwVEhO92Tp+VUeGLAhehXEmIBF9WEIQDKJ2ThX8VsgIhTlBQEQhrkx6h38m7qZppggYCDmIyhJGpBRCBhZobVnFjRSN1LQc03V9L/75DhE2M/4nYd4pxVoLixJOThVdgW6qmvnW0WOJgLnOlFa5W4WaUW1BuF+WTKAuAPk4OkxVYB2yvFD9edqtfhlIAFi1uOTIYFPP5fkG3TVinEUAVR60NVPVxjuUZMHAgp337LKNHfuravn3fdRKp63XT7+fguC9hg1na2HEfpbESqqCKqo6IMUIIeQVYMJTJZKY0lrLTq6vvE+VugetU+EfC5sdWhXY5EQYD/BFhI8rVhN78ZNB4nNIo0QocnqzAQjmwTyyaUrd67EhtzRiy7ITZqvvFmE42PXgZavs1kmgkN5KhlK8W+Pn2F1983N21a1cRmD979uyVEviLRSSppcJLZIb2YJxbFP2hOGYpyplANzAFSLbUVieb62pTz+zv/9g5nc3zFG4DnlJlkwjLTiLRYVG+i2GVKh8B9hGejuoJY4YJy2cl4EGBxSp0Hn0rvISSAc4BYhFjLsz5AQPFwE0cU8yxTxvTqTYoaT77VXEcBz9opJQ/CDyxY8eOh3gFzdPe3h5PJJOj3tylZc0Ou37vvgLlUmriGONFNJmqUdeYIOK5Y2XjppprayUaT0hvJqfxaIyp9bV2V09vvy0V8jU1tZ1V0Uh+30gm0tFQ71VFHLtnMO0kPa8Y90wpG5DKpYdGq1zTP2qiXe01KXGMcHAkY51iZodjvNpUdU1LdczL7d7TPRBNpjrzI4Mykk5j49U5MRLVUtGVWCIr1Q0xqW12/E0Piyx9c+O2n3xp8GRynlQBc9718S7ZueExTfe1kqjOm2jsfm2ff4UYJ6ZetI9yqbEmETOmVNBsZrTYWp3we/oHklXxqF06d5aue+gBx9a3SmNTSyZtxarj1pRHBnEdt0w86RnXpT0eKR3MjkXU8Yi7js37vgkKeYtfFieZEqyl2igjAdgje1WHetSZtsBMq6/duqd/cJBU46r2KVPoy45psVCwRKJWSwXPlAqP2/zoIh3qqWG4NzwUyZpf2DPeesOuH/19/2RZT54Ob3viVs2OtMrMM4/o9MXr1ThXA1KJhc2IyabVVonIfhrEHsBO85rmf2XpaXM6fr/pxbVBId+YWLA8KMw924uKxEqDfcRcF6+63kNQWyxk+qPR6mhF/wrGzabxHNc48SS2VLS2VKCUrDEJDYKxJ34j5d69JjF7yW27y1xB9Yx5nuPm9wd+gmRcSGLEdQ8RBJut6qWAK11AbqhbNz9cT27katP9mAXeNVnUEzx0V1dXp/FL36JzocjspVUi5rQTT4pGgACoQ7Sglq+rtW/Y3dt/KcbZye5nWjSwZWntijnROCYaw4knlLCMLuK6URAQCW1WFROJYbywriHGEXFdEWNQq6a85Q9iR/ooty9cjHHigFi147mJBQ5i7TjYMkCAyHN48Zi0zq7Rw9uHZSy9sPGN7//O4HOPHxeWT8i+vFTNFYgRmXH6SQ/HJOXtAHaI8DkVloCsUxsMaWMHfvfmqP/UvZSP7CXI54Iw/FY4DoKin0lbrBVV8MeyqA3hqp/LUBrsRRwHm89QWPcz/O4tODMWgXvSwo8BOuC4YskYqmcBBtf7bzP/vDrKxZRsfKRh8uQTTCDI52Y5iZoikfirlbFKQDtaaX0LPaieB3hy2gXIrg2Utm2g9NLTmLopjqmbglPbhLUaqOtFvYYpFAJLUCrhpWqwQZnS8AAUx3AdQ7ZnL0FPN5JIYeYtx7bPexV2jqMUxypVV9HUASJYL9oE7H1FBRhxajQaS0u4yMRE5IBCRMIwCPAC0ESofVDG+/UWxzU6dzl0LenTvv1qx9LNms+Jnx6EUsER1yPYpWjgI65HAGCcMIZFE5RjSWx1M9I+H6qbxpHe66X4Uf5F+hEpB0MHhycPOkEBKuKYSLweZBfodMKLC78Ezhehg/DY3wV6LcjUCVP7NazrzQAKKLeJF5svU+esGB8w2ZHIsUfdQFNF6SdDRmkm1R0VeiWsLXjA/sr7iWMsR9Nj1pOsfVuioaWG3btfWQFGgwHyuUOgMxV+JKK7QT5LWJj8FEgU9LMg43NLKtwpyBxRPUuFXwn8BhgvQoxTucJsmhDwtAP7QDcBa0BOBod3V8ZPdEgHEd0qKisIkeKvK0WSicI/gbIF4cOEPuKtoqTz3S+cUIs4sQTleiXVoNatazxsXO80rHzZiSesU137GfEiHwVuorJB4kW2O1XVJbF6mShxp7buTjeZWo1yK0jFVPQQQg+IK57XLY5TRqRT4WviOL1grsS4vooIImXC9GbURGO7xXGbCKvEDoiKG/0trjeEyqVizK8U+TbC+0A6AAQZdGvqek0i/hzChxF6neq6fSpSJhKrsnXtMyaLe4JxzZkz52PAd06yG//vU6L6DTs2PfPfEx+daALRaE6TdcXImvdGj9eP3WFzo180iZrrEVmO9R+SQu6nxKs/qcJssfYJNdIKMoNy6ZuiEmgk8lcoVYj6IDkpF76hjjMV4/75uAmp6k7NDNxgvFgn8arPqSKUcjfhRBaLE/mgYF9QpYgx52rg/9zt3/cVv3Hah8VxPyiqT1sNhsVxLkft45I+/Hda1fRWdaN/ZVS3BSMDN5pUzWrc6CdKT95zQHp2nZCcnaAAi+dJJD4eBscIU8ztAi+aSOJHhCWnWwVt0FjVj4ERlH0qXAhsBL5INP5+VY41LFUfUGETkdgNhG0tgECUbwj2Hm1s/zLIcuDHIrqNaPymCm8vKcwDhhHegtVWv3PhgxI6uD8oLBHwQP4StRltnn0H0GSEmxR2mpbOW0VxLNzs1LW8Jejdf0IsPdEHJJKNJlWXIMzueitPp1dKThmQJ0HfU/mtQAphhip3EjZKb+KY8H0gtyJmmiD/cFR4ZZuKXqVCg4pZD9KK8kWQM1H5MiHIcoDFCnco3IByk4h8T4QRwuLGJQgbReQ6sO9F5DYNM873q3Ixys+xsllVNgp8mnhyoxZzx2oCL3cCGO6t1kjsFuDNQIfCgFQY9zc+WGV79pwH4C1/I1LfKkCvHTzcFzzzwJXql8VM6cQ9+zJAn1CrNthw/4c0MwSRGN6ZlwaSrPmuFYbsjk232/0vRjUIepz2uaPOgnP/ERTKJVt6+PZ6SoWy+uWtkTffkBThTqDkb3wor9mhWVgtm875P3RmLoqo6n/Z/oN+ef3PR0Rknpl55u3ekov2q/IAomuAbmu53DR2XE0kdsGrKyCavNhZvHoBMKTKvRIebQFwOuY5kqoPxyVrICyh1Ui8qs10LUbEIM2daWAfyFliJGpmLIJyCWC/JFK/UOFKgZlmalePRGN9iMyX+taj4VJFjGmZsRG/nDEtM5aLsKDyKuLMPD2i6f7NWsrvc6bOehdKFfCsVNVtdk+/4BpFYiZZe0ghgrAGla+L6GEx/JfUN2+mXEzNmjUrWqmBAJOiwKxZs6JOLJF13/rX/2oi0WaQa09Q0CvTGKF9Vk14FqD8ToRqhZWESVQPIUqbjM17QB8FWcXxGAJCkPWownzCBkseeJwQic6trJshzAm2K/ofglwDzBLkW4rtKP/+P68MDu++aOfOnU+PL3pcNtjY2HgBIgsiZ1w4C+RiQvDiVhb3J48/CXkcf2usD9iBsAKYflQhYdtsMvDZjlJC5HwqiHACHSQETysI0V8/Si/CUo5drjTht+VelFERuR44hLAOuA5IMtxbEA1qBg7u+834wseZgDROvcG0dp2hsIewvd3hP/fwAPnROJFY0l1yMeNdGB08jD2yFyJRTMNUpL4FoIwNysHOjQnKxTJupNaZd87R0BPseR4d7vUQwZ23bIx4VQRwyI6M+juemQtgGqdiOucXK7w5wa7nSpoeaBVjjFm4EonEfKBO0/1NQffmUPK2mZiWGf2gO7HBpXb7BjfIpg+ZWLzLWXT+YqAfZIY0tD1ltz19XCQ4vtybGV5lGtufIExyfOBuLWRSOjaa1MwQqD02tpRHi2Nouh/NZwBeBHop5hM60o9mh10tF4/PX/0SNjMU2KHeES1ktSKkaODXaHYEzQypjg4cITzeDqD2yN68ZoatFscE44xvmqvpPjQ7jGaHQUwRiIGs0OKYGwwc8slnpmLc2sr4GuBztHXtwI2sbGtrO3r6jvqAmcsvXeFk+34ffccnA1H5Xyo6B+SyCewXCO37+KOrbENkB+hFhLY/UhGgmeNNRoEHQeKg53EC6dNg8qDnhxsjL4AOEvqNyc66SGhqr+Xu4TYxrFflHUBP6a5vBcRTX93++EO3wYQT4Hp81JkybY8I/2SFd00Q3obMkJkk/DAq30SkH/RNIUPyKCEWaJ0k/LOCfB04/QThhW5R/hWkEfQC0D7QH4B1CJsfE4UsAM8T1iJeS468G0NEleuBTSC73fnLF4hf+rOjch9VVO++08x5Vx1RlW+MryywyY4O5W1uZJkYx0hTB2JMIMKtQanQL5mRGzEmQaL6YROJ5RS9HFVj+/aBteBFBp3Gjq+AnqXojZodLjE6NKZIXBrbxohEvwkyBbU3aO++QDMjd5GqKZqWrg9UWNhvR4eayY046hc3OlPnZjBmNRCoXy4xOhCaWLIGiR7bG80Oo8W8lXhqpiRSEKbL54KWSNZ93ObSn0FVEFEXYNaVHzyXXc8uko65423UgyD3K3pR+dE7ztDsCJKswb3gmsckVXsz8NfaveV6f+uTRdQeceYsXSSnrWoA+inla/1HfulpuVjEi2TMVX9zI9AM+pL/3LoZ9vCuBNYWzemrv+otXPE+lC67f+uT5cfvXozjvsnpOt0xLTM3gxpgkb/utqKOjRYkXrXYaZ7uEo1vB5J2+4b2YMczADgLV+DOOXufQrPm0vHy+l+AiMGLEVnzHhDTCXpEkPtMx+wviBf15i5atGg7bBGAOWct+4xpnv4Jb8WbPIVbDdQrXHv0mAndgnxK1baAfBkoCfJ1FbpQ/XNgL0KAMgvl14L5khX7PwSuAV4ETRN2bjYI8g9W7NtE5S9QXhKxn7bIKkE+gbAH5TnCK3Go8GVRnQXyYWCvKhsrwKx+ggntFeVphbWEGGA/MJUwhT4EWkvY78wQhtce/6nfoLn0s9vW//cbQxNw3I86U7ueE5U7EP20HrvimlX0X1D3brDfqwCUH6jwNKr/guIQXmk9A6UHWKNCNdhfVxKW2xFWoKZWlfcbtT1q+DdRqVHkr8XoZlXzQ4FWhO8Tgpy3iPJ9K/qgIN8AaQW+qcosEd4Wnk4SQKDKtwSZquj7ULYi+juQNwJ5Rb8PrJZQGTmOYYtWZ/rCcvnRO88GMPPmzWtgdChO88yzVPTbwFRU0SC4T6W4gGJ+gaj/AliDyiUE/nyx+h8EtluDwKL2fJTPSqbwNlsufVdU71DhXtQ+D3q1Hcv32MA9W23pHWrkQRv4W7RYPkeL+atVWQ88YUuFB7H6UaxGXDErgmJhoSD34Afb/czobtR+BBus1qDcD0yxpWK3PzLYDfbdqL1WA//bqkEvyjvU9zeU04OPSRB8SGCxlgqPa1COAFbVbgaQ5mkeNmiZs+Sc02XOwkUfplz8Af8fktu54IeuetEm0zanTNcZBhEH1c0EwV4c502IWOOXPo9Ki3XdDyHioaoEvmCDI1LI/kAjiWswZi5otxZydxNNvFuMM0WD8tMS+Dtwo1eLiKv59H2I24brnYVomsDfifHOBKwp5H6ijjdTvcjqkzEqNuhVkTHEHC1piWDV9/dinE7kaH0SCfxdeJFBNe4yVR3BBs+I464AjaraLYI0INKhe7f80t+/dY/MOW/tF8kOfURWXrW30kwoEtYB2hBdh8oZHGtz5whvcxaBrcBpld9jhLbZBbigo4S3yxoAE/YMjgNGPmGeEQO2EBY9Xq0P8VrIEuYa412jEsdyk6DyfQX+XZ9ff5kUcn8wDB5Yp7nROopjZwEPAd9k/EqZyqUV4QNU/hPYXlnEBdkBHKksXgR5iRCooMgBwva3ASxK+ajwyqMiPMCxG1+nTxI+RwimJlPmJM+yINvGf1QuSWjlRw9oofJqDOVewo0awwbX6dChNsZGNhhd+sayOC52w33rRbkb+BvQMY7V1B82cDmi84AzQe5V4WrQVUAHyi2q8gXQy4GiojcibAfOBp5U+GlFoftRrkXYpcobTiKkanjxegshpLbjggh6V0VZ48mIVjbkLtB5gm5V+JKGleiSot9G6QVJqfAz0HchnE944u7j4Eu+lAomCHhUAObOnXsVIrdpXauLX+7GizYjYjQ3skXyuV4a2y5BsWSHN2lQyktt24XY8oiODmySSLyBZN0SLWS7JTf0IjUtK3GcJLmRLbiRGo1VzaaQ3cbo0Hapaz4HN9pMuXCYSKwda3M4bg1+eUizQ1ukqn4JIg7WFnC9OgrZnVhbIlFzGuVCD15kCkGQJju4SeM1s8WLtpBPv6jWFqSqfhnl/AGy6V3UNq9AbYHRoU1YP09d2yUE5VGyg5skVtWu2eF5NHc8teOiFSuP4ulZ77xhtdO9cQmjQ1FNNpxrRwd2G6yvIkaqm2bpaP8uUbXqRhIST7WQGewGIFHTgvXLFHLhBYSa5jlkhvZg/TKpuk6K+WFKhQyAphpnMpY+hONEJBqv1bFsr0nWduho/y5VEalpmqOZ/l0ka1rxixkp5NMka9sIykUtl7ImWdOhowO7jq5VGD0k5VKBWKoRY1zG0kfU8aJSVTdNR3p3ioiq48VMsmaqjg6ELaFU/RQnWf3blx753S8A/jd/GUW2cW53HAAAAABJRU5ErkJggg==
-"""
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+# Where Streamlit serves static/ (relative to the app's base URL)
+STATIC_URL = os.getenv("STATIC_URL", "app/static/")
+
+ICONS = {
+    "logo": "logo.png",
+    "suggested_name": "suggested_name.png",
+    "slogan_text": "slogan_text.png",
+    "branding_text": "branding_text.png",
+    "slogan_image": "slogan_image.png",
+    "palettes_image": "palettes_image.png",
+}
+
+# Module attributes kept for backward compatibility (base64 strings)
+_LEGACY_NAMES = {
+    "LOGO_BASE64": "logo",
+    "SUGGESTED_NAME": "suggested_name",
+    "SLOGAN_TEXT": "slogan_text",
+    "BRANDING_TEXT": "branding_text",
+    "SLOGAN_IMAGE": "slogan_image",
+    "PALLETES_IMAGE": "palettes_image",
+}
+
+# Generated logos and palettes, re-encoded once for display
+IMAGE_FORMAT = os.getenv("IMAGE_FORMAT", "WEBP").upper()
+IMAGE_QUALITY = int(os.getenv("IMAGE_QUALITY", "85"))
+IMAGE_CACHE_SIZE = int(os.getenv("IMAGE_CACHE_SIZE", "64"))
+
+_encoded = TTLCache(maxsize=IMAGE_CACHE_SIZE, ttl=math.inf)
+
+
+def icon_url(name: str) -> str:
+    """Return the URL an icon is served at, e.g. "app/static/logo.png"."""
+    return STATIC_URL + ICONS[name]
+
+
+@lru_cache(maxsize=None)
+def icon_bytes(name: str) -> bytes:
+    """Return an icon's PNG bytes, read from static/ on first use."""
+    with open(os.path.join(STATIC_DIR, ICONS[name]), "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def icon_base64(name: str) -> str:
+    """Return an icon as a base64 string (for callers that still need data URIs)."""
+    return base64.b64encode(icon_bytes(name)).decode("ascii")
+
+
+def __getattr__(name: str):
+    if name in _LEGACY_NAMES:
+        return icon_base64(_LEGACY_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def encode_image(image, format: str = IMAGE_FORMAT) -> bytes:
+    """
+    Re-encode an image into compact bytes, memoised by content.
+
+    Args:
+        image (PIL.Image.Image | bytes): The image, or its encoded bytes.
+        format (str): "WEBP" or "PNG" (PNG if Pillow lacks WebP support).
+
+    Returns:
+        bytes: The encoded image. Bytes that cannot be decoded are
+        returned unchanged.
+    """
+    from PIL import Image, UnidentifiedImageError, features
+
+    if format == "WEBP" and not features.check("webp"):
+        format = "PNG"
+    if isinstance(image, bytes):
+        digest = hashlib.sha1(image)
+    else:
+        digest = hashlib.sha1(f"{image.mode}:{image.size}".encode())
+        digest.update(image.tobytes())
+    key = (digest.hexdigest(), format)
+    data = _encoded.get(key)
+    if data is not None:
+        return data
+
+    if isinstance(image, bytes):
+        try:
+            image = Image.open(BytesIO(image))
+        except UnidentifiedImageError:
+            return image
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+    buffer = BytesIO()
+    if format == "WEBP":
+        image.save(buffer, format="WEBP", quality=IMAGE_QUALITY, method=4)
+    else:
+        image.save(buffer, format="PNG", optimize=True)
+    data = buffer.getvalue()
+    _encoded.set(key, data)
+    return data
 
-SLOGAN_IMAGE = """
-iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAACXBIWXMAAA+/AAAPvwGfsDKnAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAAGPVJREFUeJzdm2mYXVWV93/rnHOHukPdqlvzlDmpFJkTAiQkYZJmCIhAizQYZWgUB1DBARW6aaR5RUEFTbAR0Qd8UAZRaQWRIXMIhBAyVJJKKmNVap7urao7nnPW++FWBiEpfOu1o+3/S92za+9113/tdfbea+11hSEsffRnc9evXXPOm2+sDgLlRUUlxY5rG7G+voOTT5lSemDf3o0TJk3OE9GukvLyQH8stguMomQiUb1186Z9Pp/vt1u2bBnkJOHue7+9YNOmDZft37MnPxTOn9zZ3tYO4PP5fUUlJZ6W5qYtQCwQCCTmnHbGhDUrl68CvNNnzVnU0XpoxcqVK58GXEtVjc987tbXf/7YI4uqR43eXFxc/OsLL/3IhOKS0rM6Otpf8ft8H3Zsp2rMuAmnGiJje/t6u+2sU2p5fB2VlVXFBw/sfxuYW1Rcug5YcDLI33DTpx/5/W9/fXNZeUV6xqw5YlnWge7Ojremz5o9p7p61Pye3p4DLc1NTWPGjjutqmb0aa7rJqPFJZW1dXXzTNMq3lm/9brz/+mC+7KZ9ESZPXv2talU6okHfvRorLyi4ofAF4AI0AsUAAKgEBMIAJ5jdOkFAvff82/m1s2bYtu3by8+GQaYNm1a7IwzF+Z/5gu3O6DtKnKnKHcA44FWFb1JVO4C5gM9qKxG9FLAAJy2lkPc9rlPybgJk+40EonEFdGiYru8oqIQ+Lch8gCFh8kDacm1ewD3GF0KAV9BYdQyLct7ErgD4DiO2dXVuRFIgvhFuUfhl7lnEoL8Epg41D2K6GXkyAOY5ZVVZklZmXR1tJ1lVdWMKsik057jfA/98bj2dHe5ruv6HNftSQ0mtuYXFsyzTPMggGV5JvgDeX3tbS0FFVXVu7Zu2fI/TD0Hx3EOdba3T9nbuEs6Ozt+9dJvf/fU1ddd94jX4w3E43077Kyzvqi4+BOZbPaAxzLLk8kUY8eNbwkEg2MPyxBEUqnUVCsW62v3eX0OYB2Wv/zVl8233ljn9Mfje2w7m7btbH5bS0tHOFIwI5kYTKaSyWJ/Xl7Qse2e0rLyvgmTJr8zdlTdVX966cWTYoBoNHq3ZVnf/bev3Z6wbfvDwA33fOOrAvS7rju3sqo66DjOO6qa9Pn9eU0H9pdGo0Vj739oGeH8fABcdbFtu4B58+f/fv6CBe47O/a4m3bsWf+HV1Z1T548WW+5/fZTTgqbk4CJEyfeP2nSJP32gz/Qd3bs0Xd27NF58890aidPThqGYRaoqynQ7ylM3rlzW1QV54cPPrjjb634XwuWZT0JcKi5+dhmQRWjq7Mj5bpOAuQ2INLX22uDGseV9L8UhmG0AGQzmSNtHo9HPB7PgBEKh2sikYIj211iYABVlcrKyry/jbp/fdTX1/eJiPr8/iNtlsejpmnFjVQy5TFMU4EU4Hb3dO0AiEQikRPI+98IFyAYDB5psCwL0zJjhuPY4YH+/jagD9Di4pJpQG6F/AfBnDlzPKoqwVD42GZXVbsN13WtQChUBJQDZnd311YAVf2HMUBvb28AIBw+YgC7u7PzQCqZPGSYpmnZmUwSaATShYXRCQCGYRT+bdT968Pn8wUAstnscoV+YHtRScnomprRJZbjOIPJZNIHTABwHKcDyBMRaxiZACz84Q8/ktpevzj++vJGq6KM4IyZp/e+/KeXxXXVP2FCpW/06Imx115bKZZlhBeeOS/d0nIg3bC7WSzLCC2Yf4bd1tFkd3T0Bk8/bUHf68tfI53OGsGgL3/BgkUDGzeut7u6+v3jxkUCc+bU9Tz77FOG12sXXX314tS2bU0Dmza1BmfOHOOpqSoceOnlB+rr63tOpKeq+gCCodBogTAwfaC/v6e7q7PeCoXDA5l0ugRIAAGfz18M4Lpu+3DkT//8Z5cOrFr12cLLPvyCv7bW8paX/ku2pa3eV1pqh+bP+7intHRRalfD64HJk08NTJ92CZYZSDfu/Wlebe2c4Ixpl5j5Eb9bXlHvrame7aYzW+Jr1u4u+dcbTs+rrf28iLHfV1f3rYKF85aIx/s5hB+ULLnGFXgYxUwtnHdL4O2NX+t+5tfnD2zaJMBk4IoT6ZrNZi3TNEmnU0Xk4oVsNpsJV9bUzLIGBwbeBMa5rhswDEMN0zBERA3DaBzOAH2vr7g4dOocQqfOPh/IE3hDZ8pvIxdf+J1c1Kh3y8UXzlC4SZA/Kc43i6/+2FeBK4F9gAPMEpEvIro1ct65DyFME9E7wej3ja55GaUHuAmXK0W4HeFBEeL+svJf+xcv3pbatevG2PJVj4vPd+Zwunq93kHHcdi+bcuehWefNxvwJwYTkkwkMtb8s855e+2K16/51ZM//+O0GTPPPXSwKVNeUfHGyhUruocTKl5v1E2lEuRC4gqFGtD7BeICaxX5hoIX4UHQNGqsAvKGZmA8ypuKsQR1bkDkUYR1qnwO5POg04FliriC/hSDTajcheoNCpUi+nUX41DFbV/6bmLbjowdi2WG07WsrKyzs7Mz/ubatbMjkcjLBdGSmmw2c8rY8RPazXc3vr2+uLh4R0dH+/SG7fWZXbsbliUGB2/t7Ox0hhNaGIlcK16vXXjxRTVAGogO/csDjNecIX4DXAIs5mgeQUAfEEO2gy5FZCro0lx8xjeADtBnQT4mwjzgCUECoDcrvCXwFUSuF+VWkI7Eli3FTl9fpqu19YET6bp//373rHPP3dEX6/Nu2bQplRgciJSUlv88MRC/TU406INQd9ppe32jakaPuvee/wZOAyrIeUOE3MGjA6h8z7C9CL9BuQIYC2xGZHuwY+/lsUHErKx6VTzeSoRZKG8CLQiXADFV7hGDSSg3A11D8rJN/353b2L7znDD1q3jRsLjA1f6E0FTqY5sS6sDnAUg8GuFheQSDwbvJ/8OiIvq7eQ8ZqOxe9vovqU/mOEySGsqP53sji0eddGCjPcTn1lnWOZE4HTgGZQdIvw7SgG5xboY+IMgeb7qmrOSOxqGXbCHw4gNYIRCPisaHY/wE4EuVb7Cn6fLBobk+8nN2AxQE8gCA3Zf35yO/7iHW5YUUX7RFc4anekreem/3B8te81bbeXND33ixibQHwjyIRWuOkZuqyD7Fb1AVV/qf2PdE246vWjEPEY6UJPJrkxz83aUqCrf4Cj5LLAciJEjD7kZM4c+e4Ci2MuvYORH+OjiKKVGr3mn+TifvsRjzKzLo/vlVx1gN8gXFaYOjUsA7yJEFJ0usATh+dDcuf9ihsMjPrWO2AMwzbSnpGQcUENuZc/LbXfaBHwc8JE7dYU4mls8AmfvLsZF05i4nMK+I+1VE0vTmxuafMC5x3TvJLdtzkD5mag+o4bcrcokJ51Oqm1nR0pjxB5gFeT71XVsBRtoEuXmIRe/EYgh1ANejkMeoDAEDY0J+gcdegljD6ni9Md8lbXlx3ZNkvOghIp8EhFTRX6PMkpAsR00m02PlMeIDSC+PI/h9eaJch9wjyvcp7AAkeeBdpQp5F6H1PHGZ8/5CMmUy3UPOuxKlaqFyzPbinllXRJzyWeP7epFZRnoU6K6DNVryBklX+BnzsBAzPD7g8f7jr8EI34F0k1NB1ANYMg0VB8Q+B1CE6o35nrIFtDR5F6BLEfXiCTgBqZOCZbf9iVan3qCLyx5WXwVZaR8BlV3fZPA1CkclqGqL4roVSDHbnNrUGlU0c8AXW4iER8pjxEbwAoGg2ZRdCqqPlFuVuHjKJcpssJAfYrOA3oR2lFKAEdgh+bC7mKA/EULyV+0EE2nEY8HjCMOmQZeAK0Q4Y5jvrYDkTWozkZ0mojcmG1u/lexrPEj5THiV8Dw+wJOb2+ziP5Mhe+hBIEfCzpFYRbCeoQMShmwCVincApD5I+F+HzHkm9Q5A1ywc3hqzYld45oQ/UKlE3qyqWoftQ/ceJZYhgj385HOjATi8fMSKRYVe5A+S7QAtwssAV4A+V0lCTwuORIHz4knQgpYDdQLujZHN02Y+RyFTNAqxD9lBjsEEOXAwXJXbvXurY9bCwwHEZsOU9RtMxNJvtRHkK4EziAylIVvRIIgz4EUg3ckGpqo+/lzYRmVxCYMQUxzfeKs8ltcxPf056KrWwIOgO9E/MX1P3RihQsR7lboUCQe1U16p8w/guDW7a2jZTHiA1gd3XFvRUVIYSvqfIwwiwR/SzwFMomRL6qjlPa8tDPGVj5IqouvS+AGSmj5s4vZfy1tSZHZ9l6ry7Zrn4O3vWA3+7Yi/j8qc7H4hdEr7z6wpIll69H9RcKtyL0pw8e2EgmHX2vfv/jBjBD4Ro3nekHWSqi3wB2CVzlwidEeEBdl9bvP0z/qtWYJfMxq89BLNRIvJQ68PW78qq+/lVCc089rmy7p4cDX70TV0fjnf5N23UMvy+yze1+9knJtDbXVn3lljOAZwXt9NWM+rQdi484FhjxGuD09aWMPH8Y9IsCXwIeV3hM4FKArieeIr56Deaoj2JUfRhPafFAePaoTjf8sTxP1SwO3Xc/iW3175PrJpMcuOM/1KUGs+ZyVE2r4KyihFUzL25WXkD/6tcL25c9uhtYqMgSN50eFDFGHNWOfBfw+Uo1mejDZLHCJ4GHh+S58bVv9nc//zxG1WUY0TmYYWvAzTiB+DuxUk+hD6P8CozCKg59+ztkOzpyAoV2dR3n4J334yQCYlZfjuE18I8LaHx9byC1L1EQXrDYNqLT6f3jSxPjK1aXAwFUcZLJEVemjNgAdjyeVUdtHNYCo4A44GTbO3e2L10aMisXqFl8BgBOvx2ye20DlGxPhvz5xYTmX48zkKL5P+9Pq+1sRinpfu55M9vZimfStYCBayvJxkHRjKK2ktibtPJOX4L4S2hbuozMvn1v2T29hwyv1z+MqsPifcvxX4rSmpp7fZWV0ch55+0GxgFv49hu839++xQ3GxqQso/6RP7cM32lPvWPCUj/xjjZPgvxht3s/rUe1CgXId227Memb+ancNL5uYF6dKw6iiBoRvBNrCO7dx2DW7aVeYqi5U5XV6yrvf37I+Ex4kXQSacNVzBA+xH5PaqL25b+tDW1rztjTfx8GDnGuQzwRr22M+hY6c1HT61W+emG9jfQ/dwz2vdi0LJGXSpOqhRBj+V+BOoqokI2FqXgshuSvb/5r7zMoSYwzZMfDOG6eW7/QCtQjOq01qVPP963YtVoc+x1Pow/r5YREc10ZSy73/7zL88zU6WfvPEl8UdwE2nLqpraY+SZqeORPzLGb2p4Smh14tD4bmvUh0AV05cXHmbIsBiRAaZMmeJF1WNF8qtVeaz39ZX39K998VPWmI+JeN+/Jauj71ulfdX+DcHa4J7e9dmLPJOuzarapN5+PCpu1ieGHNcGRp6Rdgaz9fF34wvNsBXKm3lph+RVuW4qe9yI8y/BSD0gBJDctXuN29NV1/PU008aRacZRn7dBw4Ur5HwVvhfc5PurNhbfVM0o4MYo0z/1EtVB5tINzyN5BmqcqQYq/XwWDfpetVhKtCT7cpYqQPJYjyBjGIet8bpL8GIDJBKpYIAeRPGn7H/zu9+wk4G8E6+SLFk2HdRTGnyhMxkpjV1XrY7Yw296J7wnEibBs98y8g/xXW7N0l276tpcXUHwpMgx95RHvakKLlJMMTN9uEmO0fCA0ZoAMMwQgCD2+r9brzLDM6/viXTYaMZ1zfMsKTaWpHpyRYdaREOqKPL4xv6St2UFhplCz+JJ1/dtj/5tfetPShLQE+U7lKER3DtNKav6AR9PpjLSAaJSGjogxrVVx1It3sqRd8ny37Pcx7yZ7tOGqUIuABYrcgfJTjuUXP0tTsRU+1Df7hUBw+uguNuCGlgLco1mHlR7GHXzWExIgO4rhsAkPAkF9/YMe/5dxzYTi66Gw4+cm7cCEwW9FagQUJjO42afwYnI87BZxapkzq8wvcBh8NeL7BA0M1uJt4khhkaCQ8YOgdcd9NNt7hZ97L161a/bVhW17lnn/2LZcuWnTDENE1zUFURzGMt7wq8oLnY/701w/tBykH95DK8MXJlrcLQtTw5j5kqqGUWzsxKusNw2l7D2f+UmmOve0oMYzZQR+7WyQBaVYxS8UUnarrzA4/CF110UX4kWvTU3sbdxX29vYfGT5iUam468Hnjw5dd/qP1q1c/fPqZC4LnXXDRwKjRY+7ZvmPnhmGtZlnNgCqGQ85F16D6Tc1dkR17U9sI+hxQBGoo8mOUTUOk+4Fj69YOh8T9QNYsO3+nWTCjT/sbDLf1xctAxgL/Tc7DACpQnYzaA2KYH+RtWL68LSCLL/nIlZ3XfvKGM/c07romm83eYzTubqjx+/N03oJFlTd99tZvnTF/QbzlUHP1uHHjRp1IWH19fRvegn1kY6DcoMg7iNxHbhYHhpT8FsjbIP+MstJFLjfQBQgfAn0CZRVQDRyePVfQn6F6NxBQkUpjzNUFRqQOt3N1yG7+3S/JXcMFgSMTJIYvgunfOxz52trayobt20ZV19RwyUeuvGTxZVeUigjFxSWzrIrK6nA6nYLcBQeBYLAEwOv11gEHTyTUJ96r0smWp932V/+PFExNqTrLUZ2v6c7l7kDjy2Zk6pdVcXWw8evqpFNGZNrTjpvd5/bvvN0IT75RTE+12gN/EjO0QN1sPbFtyzQT65Wyc34CTitO5pBYgVONghk73YGDE+l563rXX7TJzfT/wQyNvQ3X2auiWdSutUoXvED9xhMawHGciYZhiCoOYBqmKYFg0E0mE3usjs727dHC6KnkSkewTCsN5Nm2PWz199atazZO/dhvLnC6N9xk73y40cgfe6Gb7n2adHcbnsgUJ91b7w7u3SKqeRIcNdrNxH6n/Y3vqHhdUaPBjW19jLyKSvEV7tKed1eDowQqiujf9Zzbs36DEZpQ57ruOgZ27TQi0y/G8ASd5hfeEH/RaHdw3zpNHFhB4dwqo3LRLfUvfPmV4XQVkSIAy+M5EvwVFkYNMcRrVZRXjDdN8+jFgpAHYJrmB143bXv68j1wOG2947ET99z1nuctD+f+vvue9gZgxY9zn49NljQ8cny5DcAvPkhNGNo9ROTwAkoymTwU64vFjLbWlr5M5ujVUjKRYKjziE9Xf28wDKMXIJvJ9JFbtHsiBQUVxaUlE6xAIDjK4/EccffDBrBte8R5tr83OI7TaxgGjmPb5LbeaH+8v727qyNlOK6Tr7lLTQDS6dThyOofxgNM0+wDsCzP4UPVQDAULA4Eg5OMVDLpt7NZZaie1rbtQY/H6zQ2No44yfD3Bp/PFwPIZDKxoaaQnc06qVQqz7BtJzgwOBBj6Ozu9+cVGabxD0MeYMuWLUkRobik5Mi9eyaTcR3bDhmqbsTr8UbIna8JhkJkMxkf/x/5wr9TuIFA0AY6XXU/Nzg4MAgEDHKr4pEzfSRSsMZ1XbO2tvb8v5Wm/6+YMmXKcatQDmP8+PFVgFTW1DypatxiiPEFv99foKoeSwzDdRw7Te5cXjN33pmVlc89nW5pbnp6xowZrZPqTgnv29O4Kh6LxcsrKidGi4qm7txev11VI6FQeIyLugPx+AYReWjXrl0vnQzC3/veY9Gt2996vn7r5rq+3t5gNpsNTpo0CcC1LE+8MBr19PZ0N/h8vkxZecWE1paWQ2VlZffV1k2ZK7i/AjAMUy3LGrAc227JZrPFDF1M+v3+sgeXPnaZoNcM9MeX9PV0r39744Yn5syZe0c4P3+RqvtYKFLwpinGtxKJhOdQU9OtS7//nQcTicEngJKTYYBXX/vdi6Zlnv6lr9/1E1wd7/V6z00MDq51XCcVDuef197etiaZSPRVVVVdXBAt2hItLn7bMq2vcUwW3LazCeCQVVZR0Wpn7Umi/EKFKxB2i7rPAITC4b5wKLynevSY58j9arRVkTmCXg+YoVBoQ21d3Y+mTJ/hWfnaK4mTQR6QvXt2zzj7vH+itrbuRoZ+DQrMIVeVlh47fsI0cgWbSm5iZ75Hhu3z5wU9Hl+zMTg4+Kvurk5ZsfyVueSummKCfGuIcKEKPtDVQwN9grsWoX/oeSyQ5zqO5ffnfWBI+teCYRhWe3tbL7nMECBvIUdqkfbo0UTPILnoMQO8crj/9m1brY62VtJ25tty9tlnWwob2lrbZhYVF21OZzKvXn/TzZ/2+nxt727YuKysomx8aXnFzQf27V25euXra8+Yv+iWZDKhe3bv3FwzeuzpHq93cMMba5v64/EvNzQ0vH4yDDBp0qT7DMO4Y9F558cO7tv7ekFh4QLXcfM7Otq3VlVVVxaXlBVmsukdo0aPnQpsa9y1849Tps/8YvOBA12NjQ2+vbt3ly8859wV5zz8gw8JwDPPPGPee++985PJZH55efXAhZdcetovfv6Td23b9s2YNWdmPB737d/bmBCRwomTJk9s3N3QaJqmPXPO3KLN77z9rKqurK+vH3GVxkjwvYceueqnj/6oMpvN1tSMGTOtvaWlOZPJJGonn1J6qPng5vzCwtSY0WPDa1ev3FBeXhUeNW7svHfeWt9QN2VGxSlTp7x27913rQD4v8/WDD6TPU7PAAAAAElFTkSuQmCC
-"""
 
-PALLETES_IMAGE = """
-iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAACXBIWXMAAA+/AAAPvwGfsDKnAAAAGXRFWHRTb2Z0d2FyZQB3d3cuaW5rc2NhcGUub3Jnm+48GgAAEj9JREFUeJzdmndgVFX2xz/3vUlmJo1UeiAxnUAoUn6wrLJiRVEUQVdEQUCKwCIIBEEEpC4IKCpFERVEVHRRAZWmlF0ECS2NJAOkEUhCElImmcm8eff3xxAWkaKSGN3Pn5nzzj3nm/vuuffcJ/gf49lnn3VLSkqKKioqimnQoEGsh5d37Lm8M4qvv3+YVu2o1jTH2aqqqsSYmLiNmzZ9elTUd8A3y5IVq7vu3vZ1x5Sk46FeXt732Oy2aEUoDpPZVNy0eYsgd3f3ci8fH3x9/Tw0zSFSkxIPFeSf66hpmpvU9eg/pQBzX319bErikTuzMzM72qqqGvsHBh7v3K271rZ9x1YNGzb6wT8wsBlCBANWEGbQVRD/EUKkVjuqB04dP6YsIzWlmdPpjPxTCNCjRw9DXl7eXX7+/k8ritq75S1hbm3bd3TGxLU9HR4RkSKE0gs4BTiAdoAThC6gUkq9WCjKVillr4QfDxgWzZqOzVal67o+xmKxfPWHFiAiIiJGUZTBQojHwiKiKh9+7O8hHTp1KTcazUYEiUALwAfIBcIBI4AQFEkpvUB8AzTRNK31/BkvHks48EMnIcRSo9E44/jx41YAQ30ldz169e7TX+ra4vPnC/3btr91y5BR47x9fHwkAhNQDFQAXUGUgjQAsa4nxQWB9JaQAaIQeOC0JWPP5LEjLQ5HdRPgjrS0tL2Xj/WHmgGdOnW6091oeldzas2fGDRU9LjznnJVVSuFwA+EE7gANAIUQOO//0CbQEpdUiaEsACtgaIvPv24cN27K9s4HI6tUsohFoul7Mox/xAChIeHBzVp2uyLgvxzXe++/0GeGjYCDw/PCgFOCQ0ACeiAevlzUiIRolSAJ8h0wBcIcOrO/7z9xtK22zZ/GRAcGrpqxzffjLjo42fUuwBRUVF/MXt4bHM6nR4TXnyZTl27O0AWAk0vt5NSknBgP8ePHib0lnD+dve9xYA/kA9UASFImW632ctfXzSv/cH9+zST0fjU4cOHP77e+PW6BoSHh3cAvlYV1X3mgiWER0dnC2gu5X+Tdzqd7P1+J59/9CE5WadRVJURY8brgC+IEpB+uBa/lIryspYvTx6vZWVlntU1rdfh5OTjN4qhXgSQUgohhPT29nnXZrd5xc+YWxoeFW1C0kJeNlOPHjrI6hVvoOs6WnU1np5e8oVpM0S7jp0BJEhvoBAwF+YXNHp+xKAya0VFvq7rd1sslsJfEsvv+gr07ts3OiggaGXmqZN/yc3OKhdC+A4ZNcZ6f59HPS+3KyzIZ8Vrr3IyPY1ej/Tn2KEDXCguYtrsBTRp1rzGrBJX3ffJzcn8fNywwR2cTud5o9F4T2JiYskvjel3ESAkJMS3VZu2Hxfmn+v5+FPPlDZq3OQ1o9nUOzCoYceGjRpfstN1nc2bPmPD+6vp3P12but5N6uXLSGoUSMmvjQDT0/vGtOaaXIiPSVl7aypE5+3VpRnaJrW69SpU6W/JrY6FyAyMrKXm5vbugZ+fn7xL89JCouMPgHyYa5Y0UuKi3h1zkzO5Z1h8OjnUVWVtxbOpXO37owc9wKq+hNzm5Asz83JCpw9fcoAqTszi8+fb5ucnFzxa+OrSwHUyMjI2cDk8MhofcqsOcX+AUHuuMraTzh66CBLF8whKrYNA4aO4HRGOm8umsu9vfswePhzCHF5mGIPUu4rLS0Z/sJzz5orK8qTCwoKeuTl5VX+liDrRIDY2FgvXdc/cTr1+3r37cdTQ0dgMFx9vd306UesX/MOfQcMomev3iQdOcRbi+bxyONP8vhTgy83zUeyFUEnm90WPmHEEGtebk6epml//bXT/nJqvQqEhoY2Eoqyw2Q0Rv9j0lQ6df3LVe00TeONRfM5dHA//5g6k6hWrTmW8CMrlyzgicHD6NPv8RpTCexCYkAwWNc1x8JZ09WK8jIncN/NJA+1LEBMTEwTo9F0MDgkpPELU2cQ2LCRDTBdaWerqmL2S/HyTE62mDhjHs2CW3Ds0EFWLJ7PwGEjefCRfjWmZ0CcBPkXBCYpJa//c56WeCSh2m63d7ZYLGduNuZaE6B3794t8gvOH+vQubPvqOcnnVZV1RsIvNKuvLTMOXPKBCoqytX4VxYQENSQxCOHWLF4Pv2eeKomeRuu420AyNsuPirXrHozb+93OwMv1vmU2ohbqQ0ncXFxnhXWyiPtO3ZSnpsQn6CqajCu3Zl2uV1FRXnxzCnjVafuVCfNmk9AUEMyT2awYvEC7rr/IfoPHASuk54VaIXr4EOVrSp/3epVZVs+39g0LDJ6anp6+r7aiBtqYRG82KzY5B8QELly7admg5vBBFQDjbkosECU2uxVXi9PfF7VgTGTp2H28KTw3FnmvzSZW7t0ZcwL8QghNFzlUUgp2ffdDuf2b7ZWWNJSfYDz1Xb78NTU1H/dbMyXc9OvwIULZauEEPdPmTmv0uBuyECKFiBde3mBTUqc1dX2BrOnTqayqpKJM+Zi9vCkvKyUpXNnEBUTy3PjJ9WUukvxfLv5i5yVry8ObhbccnWjZs3Wb9uyJeFmY70aNyuAsFfbnmgREloWHhWdhaQtSKSUUqCUgvR1ahoLZ71E/rmzTH5lAWYPT+x2O28smI2HpycTpk6/cpNTBXJhYX5BOyA4Nzvzm4yMjDpJHm5yDYiLi/NwapoxpnWcGQgDdIksEUIIhPQFeHPxAjLSTjBu6kwa+PoB8MGKZRSfL2DqrPkYTeZL/oTgeynFPBCD23XqHHnxz0E3E+ONuCkBbDabL0DTZs01IYUTKTWBMOFqXjg/2/Ch88C+vYydMp2GjZsAsGPrlxz98QfiZ84lsGHDGlcXQK5A4i6EnAK89cXGj5IAp67re68ydK3xq16BuLg4z+jYNrNLSopisk6d2qaqqs3pdNKseTBSSCsICfggKTy4f5/3R++9Yxo9aRotQsMASEtJYuPaNYx+IZ6omNgat/9GiDIkz0rEPgHDz+Rmj08+djSueYuQDbt2bMup3ZR/yi8WoGvXrtGaUz+Uk53p6enh+YPJZBprt9tbtu/UxRbXoeNZIATIR3AhO/NU8JJ5r/Bgvydo3f5WAEqKzvP20oX06tOXHnfeA1CEIANJG6QEyTyEbFlZVfnezPgJZdV2+w+lJUWD6iDnn/CLymBERESMm5v7vra3dvQbO+nFeQ28G4RKwT2a5sw0GAyhICWCHCShZWWlyvPPDlZDwiPcR46PVxECTdNYNPNFDKrKnMXLpKoaCnCVu0Bgl6ufJ57Udd1r3vQppCQet1dWWsPS09Nveqd3I264BsTGxnqZzeavI6JjfCa9NOu0j0+D0dLVrztnMKhtQE8CipC0kVLfPmdafIXZ09P8zKhxKhdPcV9uWKcVnM2TE6fNQlUNGq4NjkCyCQgFMQLw2rJpo+PQgf1S0xyP/h7Jw40FUL19fDabzOYWk6bPMribjAVCyB0IugpXR2YPiG7ABSTzP9+w/s6crNONR4yPx2g2IxAy9fhR+7ebvzCMi39JBAQFAbgBFiAPQR8gFCAvN/vHd5e/qQFvJCUlba7DnH/CdQW486671peXl9/+wrQZZ3z9/NYiRXOp01pKPpcQDCIKwXSEOH8yI+3FDR+822DgsFE0ax4sAcrLS8XqN5cY+/R/nA6duoBrh5iHK+k2F4cpRbB+1bIlUd4+3hcqKysn12XCV3LNRTAsLCw8Jzu73wMP99sfG9feBjyIkBsFIgZ4CFgKugMpplZVWT1enTuTLt1vp8tfb7c5dd0kpeSDFcto2LAxAwYNrXHrxmXtbiE5LgXWPTu29T125LCbycvr7tzc3Kq6TPhKrimAp6fnYw5Ncz75zLC2wL+QZAIDJWwSgmVS8iKINgArX1uM3W539n96KLouTQD7dm0jJfEYry5fjfLfnV7NomsFzkpBZG52lmnF64s1AfOOJyQcqLNMr8E1X4HgkNC/NvD1dbgb3RcC3RGyHYJ+QImUfMjFKbz3u53le7/bIYeOGa96eHqqAIX559jw3jsMGDyMZs2Dr3Rdc8MTnnnKYpoRP1738PBI9fLymlknGd6Aa86A7KzMPAEGECMlTBNSqQS5EvDD1aVx5OXmrFm1bPGQex/qS0Sr1q67Kil5f8UyYmLb8MDDj17NtZKTlWn65qtNbP96s1Og7HE47A+lpaU56ijH63JNAby9vc+cLyhw+/i9d0Y/PmjoUClkd1wrv4qU23XJgreW/HOdn3+A+mD/J5xIqQLs27mN3KzTvLbq/SuamVBWWsrCV14iLSUZv4DAVM3hmJOWlraea9zb/R5c8xUozM/fDiAMhnXStWpXIWWxDg+D+HT3zm83pyYlNRs4fLRULx7nykqK+XTtGgaPGM3FkvcTLOknSDp2lOCWLcfv27O7VVpa2ofUY/JwHQF8fHz2qwZD2fc7tulAQ6SYpyP7KPB8SXHRyrffeM3cs9cDzvDIaJcjIVj95lJuiYjkjrvvu5pLW6s2bY+YPTz0/LPnRtZNOr+eawqQkJDgMBnNW86eyTXNmTLxMYGuKEI5BMiX48cne/v4yH5PPq06dV0A/Hv3LmlJS728uXE5OmAzmUyRIbeEl6sGtfGVBvXFdTdC5eWlywD8GzV+XwoxXCBGbv3is+rcrMy2z4z6hyoU1xJSabWyce0a8fjAZy6/u7tyHB9Ad2qap8lsPlTLefxmriuAxWLZ7+HplbXv+x1GXdMnWSsr5ny+Yf193Xr0JCy61SW7f330Af6BgTz0aH+AMlz/8Z+NlZx4PDf9RIqhMD9/ea1mcRPc8DBUVWldUmm1+qamJm14f9XyJjabjUefHHTp96xTFvbs+Jbho8dfUFRDAq7K8jO/uq7bP1m7JtzNzS23SZMmtdrYvBluKIAQYp2iKM51q1eI7Vs3q30HPO3w8vYBXLe5H769nFu7dDsb07p1CshbAY+r+fn4gzXGxKOHDXa7fcj333+vXc2mPrihACdOnCjyaeB35ERykiEsMkrvfsddbjW/7d3xLXlnchwjx00wS+h22WOngEwAu93OW0sWsvGjtVLX9ZEWi2VbrWdxE/yinmBZack2RVEYMHSkUrPCl5Ve4PP1H8gnhww3+PkHXPQjShByEYgLhQX5wRvWrikc9fTfSUk8Vn3/w33jMzIyVtZZJr+RG7bEQkJCfN3c3Md263GHs3nLkEunms/WvScDgoKqu3TrnpmRmhKedPzotr27d6Y3bdp8tCX9hLPg3Dn9lvCIqtt63vVJWHDTwcOHD/9N19d1zQ1bYu3atVsKYszcN95WPL28JCAyUpNZOONFpHRt4lSDodipaenu7u7Zt4RFlJ5ITf5E1/WDV/su74/GdQWIjIy8xd0gMlDclP+7rcfp/gMGBriZvX1mThyLVl29u6K8bJzD4bD8li8z/ihcTwDlb12js0IaKw1QPTYfzrA95u7mLsKiW2sn09McdltVw5rvbf/MqNf6YWi/1v+2VcuYlweaf+zZjl73dDSk7E5SEtLSTkY3bt5i4v59e+v0wuL34qoCTB4U++2BE1qPuUM8hK+XaAl8ZnLjK81RPSg9x6nbqqofOXv27NV2e386flYFxjwRu2t/qvNvi4Z76I38hBSI7RIZqUPfT3Y7SqxVcnna8YR6aV7UBZf2AVFRUd5xbaLX5xXpHeYPMyc3C1RAYpXIe4HQLT84lpVadX8U5Zt6jLfWUQAiIyN7Sil3G93kln8+67GrkZ8SCygIfIAzwLdF5XKUEOgGg+FgvUZcyyhRUVFDgG0hjZUvN0z1mgI8DJzA9QW267ITHth52JGt6/Lkn7nkXQ1FSnkboAy51zgBgQEplwgIqrRJM64yaQM2V9n1UC+zcr5+w619FOAowIkc/VMk7yPE2KMnnQEf7KiusTGVWeWDVhvCapOJ9RZpHaEIIQ4CqKqMBWZfsMqUBR9XyU5RlwqEPe2MNstlI+r0rr4+UMrLy48IgX6hQjZCsOydrfZWPh6C9uGuOw7gYFN/w0wAIWSdfatTXyh5eXmVUpJ5+qyszMjVx+467FD793AvVFybZH/grlKrrnoY0e9r6/1j/YZb+wiA/7s1er+fN7GlVs4G+hC8eKSn+VyxM/ntr+0JDo0BpVbSK8vFmO9+TNlZ3wHXNgaAojLnnpJy0VlViRx6n7l0xFJrcnaB7gUc797Bc8r6r47k1XOcdYZrBnQI711coXzpYVQqqzV9W7VDX26xWLZTz7c2vyud2kV3i4qK8r6x5f8W/w/95cDBNFt1ewAAAABJRU5ErkJggg==
-"""
\ No newline at end of file
+def cache_stats():
+    """Return hit/miss statistics of the encoded image cache."""
+    return _encoded.stats()
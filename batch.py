@@ -0,0 +1,235 @@
+"""
+Generate branding suggestions for many business descriptions at once.
+
+Usage:
+    python batch.py descriptions.csv -o results.jsonl
+    python batch.py descriptions.jsonl -o results.jsonl --checkpoint done.txt
+
+Input records need a "description" field and may carry an "id" (the line
+number is used otherwise). Results are appended to the output as JSONL,
+and completed IDs to the checkpoint, so an interrupted run can resume.
+"""
+import argparse
+import asyncio
+import csv
+import itertools
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import http_client
+import telemetry
+from agent import generate_from_context, get_cached_result, get_db, retrieve_contexts
+from colormagic_api import search_palettes
+from pollinations_api import fetch_logo_bytes, logo_cache_path
+
+logger = logging.getLogger(__name__)
+
+
+def read_records(path: str, id_field: str = "id", text_field: str = "description"):
+    """
+    Stream records from a CSV or JSONL file.
+
+    Args:
+        path (str): Input file (".csv", otherwise read as JSONL).
+        id_field (str): Column holding the record ID.
+        text_field (str): Column holding the business description.
+
+    Yields:
+        dict: {"id": str, "description": str}
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+
+        for number, row in enumerate(rows, start=1):
+            yield {
+                "id": str(row.get(id_field) or number),
+                "description": row.get(text_field) or "",
+            }
+
+
+def load_checkpoint(path: str):
+    """Return the set of record IDs already completed."""
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        return {line.strip() for line in f if line.strip()}
+
+
+async def fetch_assets(results, concurrency: int = 8):
+    """
+    Fetch the logo and palette for each branding result with bounded concurrency.
+
+    Args:
+        results (list[dict]): Branding results from `generate_branding`.
+        concurrency (int): Results processed at the same time.
+
+    Returns:
+        list[dict]: Asset references per result (logo file path, palette).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(result):
+        async with semaphore:
+            assets = {}
+            try:
+                await fetch_logo_bytes(result["logo_mark"])
+                assets["logo_path"] = logo_cache_path(result["logo_mark"])
+            except Exception as e:
+                assets["logo_error"] = str(e)
+            try:
+                palettes = await search_palettes(result["color"].lower())
+                if palettes:
+                    assets["palette_name"] = palettes[0]["text"]
+                    assets["palette_colors"] = palettes[0]["colors"]
+            except Exception as e:
+                assets["palette_error"] = str(e)
+            return assets
+
+    return await asyncio.gather(*(fetch(result) for result in results))
+
+
+def _skip_completed(records, done, stats):
+    for record in records:
+        if record["id"] in done:
+            stats["skipped"] += 1
+            continue
+        yield record
+
+
+def generate_branding_batch(
+    records,
+    output_path: str,
+    checkpoint_path: str = None,
+    batch_size: int = 32,
+    llm_workers: int = 2,
+    asset_concurrency: int = 8,
+    with_assets: bool = True,
+    use_cache: bool = True,
+):
+    """
+    Generate branding for a stream of records and append the results as JSONL.
+
+    Records are processed in batches: each batch is embedded in one call
+    and searched as one FAISS matrix query, LLM calls run on a bounded
+    thread pool and asset fetches with bounded async concurrency.
+
+    Args:
+        records (Iterable[dict]): Records with "id" and "description".
+        output_path (str): JSONL file results are appended to.
+        checkpoint_path (str | None): File of completed IDs, skipped on resume.
+        batch_size (int): Records per retrieval batch.
+        llm_workers (int): Concurrent Ollama generations.
+        asset_concurrency (int): Concurrent logo/palette fetches.
+        with_assets (bool): Also fetch the logo and palette for each result.
+        use_cache (bool): Reuse cached results for repeated descriptions.
+
+    Returns:
+        dict: Totals (processed, skipped, failed, seconds, records_per_second).
+    """
+    done = load_checkpoint(checkpoint_path)
+    stats = {"processed": 0, "skipped": 0, "failed": 0}
+    started = time.perf_counter()
+
+    # Build or update the index before timing the first batch
+    get_db()
+
+    pending = _skip_completed(records, done, stats)
+
+    with open(output_path, "a", encoding="utf-8") as output, \
+            open(checkpoint_path or os.devnull, "a", encoding="utf-8") as checkpoint, \
+            ThreadPoolExecutor(max_workers=llm_workers, thread_name_prefix="llm") as pool:
+        while True:
+            batch = list(itertools.islice(pending, batch_size))
+            if not batch:
+                break
+
+            results = [None] * len(batch)
+            if use_cache:
+                for i, record in enumerate(batch):
+                    entry = get_cached_result(record["description"])
+                    if entry is not None:
+                        results[i] = dict(entry["result"])
+
+            misses = [i for i, result in enumerate(results) if result is None]
+            contexts = retrieve_contexts([batch[i]["description"] for i in misses])
+            futures = {
+                i: pool.submit(generate_from_context, batch[i]["description"], context)
+                for i, context in zip(misses, contexts)
+            }
+
+            errors = {}
+            for i, future in futures.items():
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    errors[i] = str(e)
+
+            succeeded = [i for i in range(len(batch)) if i not in errors]
+            assets = {}
+            if with_assets and succeeded:
+                fetched = http_client.run(fetch_assets([results[i] for i in succeeded], asset_concurrency))
+                assets = dict(zip(succeeded, fetched))
+
+            for i, record in enumerate(batch):
+                line = {"id": record["id"], "description": record["description"]}
+                if i in errors:
+                    line["error"] = errors[i]
+                    stats["failed"] += 1
+                else:
+                    line.update(results[i])
+                    if with_assets:
+                        line["assets"] = assets[i]
+                    checkpoint.write(record["id"] + "\n")
+                output.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+            output.flush()
+            checkpoint.flush()
+            stats["processed"] += len(batch)
+
+            elapsed = time.perf_counter() - started
+            logger.info("📦 %d records in %.1fs (%.2f records/s)", stats["processed"], elapsed, stats["processed"] / elapsed)
+
+    stats["seconds"] = time.perf_counter() - started
+    stats["records_per_second"] = stats["processed"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate branding suggestions in batch.")
+    parser.add_argument("input", help="CSV or JSONL file with a 'description' field")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file to append results to")
+    parser.add_argument("--checkpoint", help="file of completed IDs (default: <output>.done)")
+    parser.add_argument("--id-field", default="id")
+    parser.add_argument("--text-field", default="description")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--llm-workers", type=int, default=2)
+    parser.add_argument("--asset-concurrency", type=int, default=8)
+    parser.add_argument("--no-assets", action="store_true", help="skip logo and palette fetching")
+    parser.add_argument("--fresh", action="store_true", help="ignore cached results")
+    args = parser.parse_args(argv)
+    telemetry.setup()
+
+    stats = generate_branding_batch(
+        read_records(args.input, args.id_field, args.text_field),
+        args.output,
+        checkpoint_path=args.checkpoint or args.output + ".done",
+        batch_size=args.batch_size,
+        llm_workers=args.llm_workers,
+        asset_concurrency=args.asset_concurrency,
+        with_assets=not args.no_assets,
+        use_cache=not args.fresh,
+    )
+    print(
+        f"✅ {stats['processed']} processed, {stats['skipped']} skipped, {stats['failed']} failed "
+        f"in {stats['seconds']:.1f}s ({stats['records_per_second']:.2f} records/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
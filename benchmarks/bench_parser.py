@@ -0,0 +1,103 @@
+"""
+Regression check and micro-benchmark for `agent.parse_llm_response`.
+
+Usage:
+    python benchmarks/bench_parser.py [--iterations 2000]
+
+Every response in parser_corpus.jsonl is parsed in one go and streamed in
+token-sized chunks; both must produce the expected fields. Throughput is
+then reported for each mode.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent import BrandingParser, parse_llm_response  # noqa: E402
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parser_corpus.jsonl")
+
+
+def load_corpus(path: str = CORPUS_PATH):
+    """Return the list of {"response", "expected"} records."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def as_dict(parsed):
+    name, slogan, concept, logo_mark, color = parsed
+    return {"name": name, "slogan": slogan, "logo_mark": logo_mark, "color": color, "explanation": concept}
+
+
+def stream_parse(response: str, chunk_size: int = 4):
+    """Parse a response fed in small chunks, as it arrives from the LLM."""
+    parser = BrandingParser()
+    for start in range(0, len(response), chunk_size):
+        parser.feed(response[start:start + chunk_size])
+    parser.close()
+    return parser.fields
+
+
+def check(corpus):
+    """
+    Parse the corpus in both modes.
+
+    Returns:
+        list[str]: Descriptions of every mismatch (empty if all pass).
+    """
+    failures = []
+    for number, case in enumerate(corpus, start=1):
+        expected = case["expected"]
+        whole = as_dict(parse_llm_response(case["response"]))
+        streamed = stream_parse(case["response"])
+        if whole != expected:
+            failures.append(f"#{number} (whole): {whole} != {expected}")
+        if streamed != expected:
+            failures.append(f"#{number} (stream): {streamed} != {expected}")
+    return failures
+
+
+def bench(corpus, iterations: int):
+    """
+    Time both parsing modes over the corpus.
+
+    Returns:
+        dict: Responses per second and MB/s for each mode.
+    """
+    responses = [case["response"] for case in corpus]
+    size = sum(len(r.encode("utf-8")) for r in responses)
+    results = {}
+    for mode, parse in (("whole", parse_llm_response), ("stream", stream_parse)):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            for response in responses:
+                parse(response)
+        elapsed = time.perf_counter() - started
+        results[mode] = {
+            "responses_per_second": iterations * len(responses) / elapsed,
+            "mb_per_second": iterations * size / elapsed / 1e6,
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus()
+    failures = check(corpus)
+    for failure in failures:
+        print("❌", failure)
+    if failures:
+        sys.exit(1)
+
+    print(f"✅ {len(corpus)} responses parsed correctly")
+    print(json.dumps(bench(corpus, args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
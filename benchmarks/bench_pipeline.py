@@ -0,0 +1,383 @@
+"""
+Offline benchmark suite for the branding pipeline.
+
+Usage:
+    python benchmarks/bench_pipeline.py [-o results.json] [--compare baseline.json]
+    python benchmarks/bench_pipeline.py --sections index --sizes 1000,10000 --index flat,hnsw
+
+Sections (each runs in its own process, so timings start cold and peak
+RSS is per section):
+    cold_start  importing agent.py and server.py
+    index       SQLite docstore fill, FAISS build, load and retrieval
+                latency on synthetic corpora (1k/10k/100k chunks by default)
+    parse       parse_llm_response throughput (see bench_parser.py)
+    e2e         vectorstore build/load over docs/, retrieval, logo and
+                palette generation, and end-to-end API latency under
+                concurrent load, all against the stub servers in stubs.py
+                with configurable latency and failure injection
+
+Results are written as JSON; --compare prints the relative change of
+every number against an earlier run.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from langchain_core.embeddings import Embeddings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+SECTIONS = ("cold_start", "index", "parse", "e2e")
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process, in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def summarize(samples):
+    """
+    Summarise latencies given in seconds.
+
+    Returns:
+        dict: count, mean and p50/p95/p99/max in milliseconds.
+    """
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def bench_cold_start(runs: int = 5):
+    """Time fresh interpreter imports of the entry modules."""
+    results = {}
+    for module in ("agent", "server", "assets"):
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, "-c", f"import {module}"], cwd=ROOT, check=True)
+            samples.append(time.perf_counter() - started)
+        results[f"import_{module}"] = summarize(samples)
+    return results
+
+
+class HashEmbeddings(Embeddings):
+    """Local stand-in for the embeddings model (no HTTP), for the synthetic corpora."""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+
+    def embed_query(self, text: str):
+        import numpy as np
+
+        rng = np.random.default_rng(abs(hash(text)) % 2**32)
+        return rng.standard_normal(self.dimension, dtype=np.float32).tolist()
+
+    def embed_documents(self, texts):
+        return [self.embed_query(t) for t in texts]
+
+
+def bench_index(size: int, dimension: int, index_types, queries: int = 200, k: int = 3):
+    """
+    Fill a docstore with `size` random chunks, then build, load and query
+    each index type over it.
+    """
+    import numpy as np
+    from langchain_core.documents import Document
+
+    import faiss_store
+
+    workdir = tempfile.mkdtemp(prefix="branding-index-")
+    try:
+        docstore = faiss_store.SQLiteDocstore(os.path.join(workdir, faiss_store.DOCSTORE_FILE))
+        rng = np.random.default_rng(0)
+        ids = [f"chunk-{i}" for i in range(size)]
+
+        started = time.perf_counter()
+        for start in range(0, size, 5000):
+            batch = ids[start:start + 5000]
+            docs = [Document(page_content=f"Synthetic reference chunk {i}.", metadata={"source": "synthetic"}) for i in batch]
+            docstore.add_documents(batch, docs, rng.standard_normal((len(batch), dimension), dtype=np.float32))
+        results = {"chunks": size, "dimension": dimension, "docstore_fill_s": time.perf_counter() - started}
+
+        embeddings = HashEmbeddings(dimension)
+        sample = rng.standard_normal((queries, dimension), dtype=np.float32)
+        for index_type in index_types:
+            started = time.perf_counter()
+            factory = faiss_store.rebuild_index(workdir, index_type, ids)
+            build_s = time.perf_counter() - started
+
+            started = time.perf_counter()
+            db = faiss_store.load(workdir, embeddings)
+            load_s = time.perf_counter() - started
+
+            latencies = []
+            for vector in sample:
+                started = time.perf_counter()
+                db.similarity_search_by_vector(vector.tolist(), k=k)
+                latencies.append(time.perf_counter() - started)
+
+            results[index_type] = {
+                "factory": factory,
+                "build_s": build_s,
+                "load_s": load_s,
+                "retrieval": summarize(latencies),
+                "index_bytes": os.path.getsize(os.path.join(faiss_store.current_generation(workdir), faiss_store.INDEX_FILE)),
+            }
+        return results
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def bench_parse(iterations: int):
+    """Parser throughput, whole and streamed."""
+    import bench_parser
+
+    corpus = bench_parser.load_corpus()
+    failures = bench_parser.check(corpus)
+    if failures:
+        raise AssertionError(f"parser regressions: {failures}")
+    return bench_parser.bench(corpus, iterations)
+
+
+async def bench_e2e(args):
+    """Run the pipeline and the API server against the stubs."""
+    import httpx
+    from aiohttp import web
+
+    import stubs
+
+    fake = stubs.Stubs(
+        token_delay=args.token_delay,
+        image_delay=args.image_delay,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+    )
+    stub_runner, stub_url = await stubs.start(fake)
+    workdir = stubs.isolate(stub_url)
+    results = {"stubs": {
+        "token_delay": args.token_delay,
+        "image_delay": args.image_delay,
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "failure_rate": args.failure_rate,
+    }}
+
+    # Imported late: the modules read their endpoints from the environment
+    import agent
+    import server
+    from colormagic_api import PALETTE_KEYWORDS, generate_slogan_palette, search_palettes
+    from pollinations_api import generate_logo_image
+
+    try:
+        # Injected failures only apply to the measured requests
+        fake.failure_rate = 0.0
+        started = time.perf_counter()
+        await asyncio.to_thread(agent.get_vectorstore)
+        results["vectorstore_build_s"] = time.perf_counter() - started
+        started = time.perf_counter()
+        await asyncio.to_thread(agent.get_vectorstore)
+        results["vectorstore_load_s"] = time.perf_counter() - started
+        await asyncio.to_thread(agent.get_db)
+        fake.failure_rate = args.failure_rate
+
+        async def timed(label, calls):
+            samples, errors = [], 0
+            for call in calls:
+                started = time.perf_counter()
+                try:
+                    await call()
+                except Exception:
+                    errors += 1
+                samples.append(time.perf_counter() - started)
+            results[label] = {**summarize(samples), "errors": errors}
+
+        topics = [f"benchmark business number {i}" for i in range(args.component_calls)]
+        await timed("retrieval", [lambda t=t: asyncio.to_thread(agent.retrieve_contexts, [t]) for t in topics])
+        await timed("generate_logo_image", [lambda t=t: generate_logo_image(t) for t in topics])
+        await timed("generate_slogan_palette", [lambda t=t: generate_slogan_palette("Made for you", t) for t in topics])
+        keywords = [PALETTE_KEYWORDS[i % len(PALETTE_KEYWORDS)] for i in range(args.component_calls)]
+        await timed("palette_search_local", [lambda q=q: search_palettes(q, backend="local") for q in keywords])
+
+        service = server.BrandingService(queue_size=args.requests, concurrency=args.ollama_concurrency)
+        runner = web.AppRunner(server.create_app(service))
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        api_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        samples, statuses = [], {}
+
+        async def one(client, i):
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post("/branding", json={"description": f"Load test shop {i}", "fresh": True})
+                    status = str(response.status_code)
+                except httpx.HTTPError as e:
+                    status = type(e).__name__
+                samples.append(time.perf_counter() - started)
+                statuses[status] = statuses.get(status, 0) + 1
+
+        try:
+            async with httpx.AsyncClient(base_url=api_url, timeout=600) as client:
+                started = time.perf_counter()
+                await asyncio.gather(*(one(client, i) for i in range(args.requests)))
+                elapsed = time.perf_counter() - started
+        finally:
+            await runner.cleanup()
+
+        results["api"] = {
+            **summarize(samples),
+            "concurrency": args.concurrency,
+            "ollama_concurrency": args.ollama_concurrency,
+            "requests_per_second": args.requests / elapsed,
+            "statuses": statuses,
+            "server": service.stats,
+        }
+        results["stub_calls"] = dict(fake.calls)
+        return results
+    finally:
+        await stub_runner.cleanup()
+        os.chdir(ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def run_section(args):
+    """Run one section in this process and return its results."""
+    if args.section == "cold_start":
+        results = bench_cold_start(args.cold_start_runs)
+    elif args.section == "index":
+        results = {
+            str(size): bench_index(size, args.dimension, args.index.split(","), args.queries)
+            for size in map(int, args.sizes.split(","))
+        }
+    elif args.section == "parse":
+        results = bench_parse(args.parse_iterations)
+    else:
+        results = asyncio.run(bench_e2e(args))
+    results["peak_rss_mb"] = peak_rss_mb()
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(data, prefix=""):
+    """Flatten nested results into {"a.b.c": number}."""
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, path + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def compare(current: dict, baseline: dict):
+    """Print the relative change of every number shared with a baseline run."""
+    old, new = flatten(baseline["results"]), flatten(current["results"])
+    print(f"Compared with {baseline['meta'].get('commit')} → {current['meta'].get('commit')}:")
+    for key in sorted(old.keys() & new.keys()):
+        if old[key]:
+            change = (new[key] - old[key]) / abs(old[key]) * 100
+            print(f"  {key:60} {old[key]:>12.3f} → {new[key]:>12.3f}  ({change:+.1f}%)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", default=",".join(SECTIONS), help="comma-separated sections to run")
+    parser.add_argument("-o", "--output", help="write the JSON results here (default: stdout)")
+    parser.add_argument("--compare", help="earlier JSON results to compare against")
+    parser.add_argument("--cold-start-runs", type=int, default=5)
+    parser.add_argument("--sizes", default="1000,10000,100000", help="synthetic corpus sizes (chunks)")
+    parser.add_argument("--dimension", type=int, default=768, help="synthetic vector dimension")
+    parser.add_argument("--index", default="flat,ivf-flat,hnsw", help="index types to build")
+    parser.add_argument("--queries", type=int, default=200, help="retrieval queries per index")
+    parser.add_argument("--parse-iterations", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=100, help="API requests in the load test")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent API clients")
+    parser.add_argument("--ollama-concurrency", type=int, default=4)
+    parser.add_argument("--component-calls", type=int, default=20, help="calls per component benchmark")
+    parser.add_argument("--token-delay", type=float, default=0.005, help="stub seconds per LLM token")
+    parser.add_argument("--image-delay", type=float, default=0.05, help="stub seconds per logo")
+    parser.add_argument("--latency", type=float, default=0.01, help="stub seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.01, help="stub random extra latency")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="stub fraction of 503 responses")
+    parser.add_argument("--section", choices=SECTIONS, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.section:
+        # Child process: run one section and report it as the last stdout line
+        print(json.dumps(run_section(args)))
+        return
+
+    results = {}
+    for section in args.sections.split(","):
+        print(f"⏱️ Running {section}...", file=sys.stderr)
+        child = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--section", section, *(argv if argv is not None else sys.argv[1:])],
+            stdout=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+        results[section] = json.loads(child.stdout.strip().splitlines()[-1])
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "args": {k: v for k, v in vars(args).items() if k not in ("section", "output", "compare")},
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Results written to {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+End-to-end check of server.py and the thin client against stub upstreams.
+
+Usage:
+    python benchmarks/check_server.py
+
+Runs the stub Ollama/Pollinations/ColorMagic servers and the branding API
+in one process, in a scratch directory (a copy of docs/ and fresh caches),
+and checks that identical requests are coalesced, a full queue answers
+503 with Retry-After, assets come back as URLs the client can download,
+metrics are exported and bad input is rejected.
+"""
+import asyncio
+import os
+import shutil
+import sys
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import stubs  # noqa: E402
+
+
+async def run_checks():
+    fake = stubs.Stubs()
+    stub_runner, stub_url = await stubs.start(fake)
+    workdir = stubs.isolate(stub_url)
+
+    # Imported late: the modules read their endpoints from the environment
+    from aiohttp import web
+
+    import server
+    from branding_client import request_branding
+
+    service = server.BrandingService(queue_size=2, concurrency=1)
+    runner = web.AppRunner(server.create_app(service))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    api_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    failures = []
+
+    def expect(condition, message):
+        print(("✅ " if condition else "❌ ") + message)
+        if not condition:
+            failures.append(message)
+
+    try:
+        async with httpx.AsyncClient(base_url=api_url, timeout=60) as client:
+            while not (await client.get("/healthz")).json()["ready"]:
+                await asyncio.sleep(0.1)
+
+            # Coalescing: identical fresh requests share one generation
+            before = fake.calls["generate"]
+            body = {"description": "A small bakery with sourdough", "fresh": True, "assets": False}
+            responses = await asyncio.gather(*(client.post("/branding", json=body) for _ in range(5)))
+            names = {r.json()["name"] for r in responses if r.status_code == 200}
+            expect(all(r.status_code == 200 for r in responses), "identical requests succeed")
+            expect(fake.calls["generate"] - before == 1, f"5 identical requests → {fake.calls['generate'] - before} generation(s)")
+            expect(len(names) == 1, "coalesced requests get the same result")
+
+            # Backpressure: 1 running + 2 queued, the rest are rejected
+            fake.token_delay = 0.01
+            bodies = [{"description": f"Shop number {i}", "fresh": True, "assets": False} for i in range(6)]
+            responses = await asyncio.gather(*(client.post("/branding", json=b) for b in bodies))
+            statuses = sorted(r.status_code for r in responses)
+            busy = [r for r in responses if r.status_code == 503]
+            expect(busy and all(r.headers.get("Retry-After") for r in busy), f"full queue answers 503 + Retry-After ({statuses})")
+            expect(statuses.count(200) >= 3, "queued requests still complete")
+            fake.token_delay = 0.0
+
+            # Cache hits skip the queue
+            response = await client.post("/branding", json={"description": "A small bakery with sourdough", "assets": False})
+            expect(response.status_code == 200 and service.stats["cached"] >= 1, "cached results are served without queueing")
+
+            # Thin client: assets come back as URLs it can download
+            result, logo, (palette_png, palette_name, colors) = await request_branding("A cosy bookshop café", base_url=api_url)
+            expect(logo is not None and logo[:4] == b"\x89PNG", "logo downloaded through /logos")
+            expect(palette_png[:4] == b"\x89PNG" and len(colors) == 5, f"palette '{palette_name}' rendered through /palettes/render")
+            expect(result["assets"]["logo_url"].startswith("/logos/"), "result references assets by URL")
+
+            # Metrics
+            response = await client.get("/metrics")
+            expect(
+                response.status_code == 200 and 'branding_stage_seconds_count{stage="llm"}' in response.text,
+                "stage timings exported at /metrics",
+            )
+            expect("llm_time_to_first_token_seconds_count" in response.text, "time to first token exported")
+
+            # Input validation
+            expect((await client.post("/branding", json={})).status_code == 400, "missing description → 400")
+            expect((await client.get("/logos/../../etc")).status_code == 404, "unknown logo → 404")
+            expect((await client.get("/palettes/render", params={"colors": "red"})).status_code == 400, "bad colors → 400")
+    finally:
+        await runner.cleanup()
+        await stub_runner.cleanup()
+        os.chdir(ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return failures
+
+
+def main():
+    failures = asyncio.run(run_checks())
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
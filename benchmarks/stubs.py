@@ -0,0 +1,214 @@
+"""
+Stub Ollama, Pollinations and ColorMagic servers for local checks.
+
+Usage:
+    python benchmarks/stubs.py [--port 11500]
+
+Then point the app at it:
+    OLLAMA_BASE_URL=http://localhost:11500
+    POLLINATIONS_IMAGE_URL=http://localhost:11500/prompt/
+    COLORMAGIC_SEARCH_URL=http://localhost:11500/api/palette/search
+
+Answers are deterministic: embeddings are derived from a hash of the
+text, generations follow the branding prompt's format, logos are small
+PNGs and every palette search returns the same five colors. Latency and
+failures (503s) can be injected to exercise timeouts and retries.
+"""
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import shutil
+import tempfile
+from collections import Counter
+
+from aiohttp import web
+from PIL import Image
+
+EMBEDDING_DIMENSION = 64
+
+_DESCRIPTION_RE = re.compile(r"User description:\s*(.*?)\s*Reference keywords", re.DOTALL)
+
+RESPONSE_TEMPLATE = """**Brand Name:** {name}
+**Slogan:** Made for {topic}
+**Logo Mark: a simple {topic} mark**
+**Color:** {color}
+**Branding Concept:** A calm, trustworthy identity for {topic}.
+It keeps the palette restrained and the type clean."""
+
+COLORS = ("mint", "warm", "pastel", "blue", "elegant")
+
+
+def _seed(text: str) -> int:
+    return int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:16], 16)
+
+
+def fake_embedding(text: str, dimension: int = EMBEDDING_DIMENSION):
+    """Deterministic unit-ish vector for a text."""
+    rng = random.Random(_seed(text))
+    return [rng.gauss(0, 1) for _ in range(dimension)]
+
+
+def fake_response(prompt: str) -> str:
+    """A branding answer in the prompt's format, varying with the description."""
+    match = _DESCRIPTION_RE.search(prompt)
+    topic = " ".join((match.group(1) if match else prompt).split()[:6]) or "your business"
+    seed = _seed(topic)
+    return RESPONSE_TEMPLATE.format(name=f"Brand{seed % 10_000:04d}", topic=topic, color=COLORS[seed % len(COLORS)])
+
+
+def tokenize(text: str):
+    """Split text into small, token-like chunks (keeping whitespace)."""
+    return re.findall(r"\s*\S{1,4}|\s+", text)
+
+
+class Stubs:
+    """
+    The stub endpoints and their call counters.
+
+    Args:
+        token_delay (float): Seconds between streamed tokens.
+        image_delay (float): Seconds before a logo is returned.
+        latency (float): Seconds added before every response.
+        jitter (float): Random extra latency, up to this many seconds.
+        failure_rate (float): Fraction of requests answered with 503.
+        seed (int): Seed for jitter and failure injection.
+    """
+
+    def __init__(
+        self,
+        token_delay: float = 0.0,
+        image_delay: float = 0.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.token_delay = token_delay
+        self.image_delay = image_delay
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.calls = Counter()
+        self._random = random.Random(seed)
+
+    @web.middleware
+    async def _inject(self, request: web.Request, handler):
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            self.calls["failed"] += 1
+            return web.json_response({"error": "injected failure"}, status=503)
+        return await handler(request)
+
+    async def generate(self, request: web.Request):
+        self.calls["generate"] += 1
+        body = await request.json()
+        model = body.get("model", "stub")
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        for token in tokenize(fake_response(body.get("prompt", ""))):
+            if self.token_delay:
+                await asyncio.sleep(self.token_delay)
+            await response.write((json.dumps({"model": model, "response": token, "done": False}) + "\n").encode())
+        await response.write((json.dumps({"model": model, "response": "", "done": True}) + "\n").encode())
+        await response.write_eof()
+        return response
+
+    async def embeddings(self, request: web.Request):
+        self.calls["embeddings"] += 1
+        body = await request.json()
+        return web.json_response({"embedding": fake_embedding(body.get("prompt", ""))})
+
+    async def image(self, request: web.Request):
+        self.calls["image"] += 1
+        if self.image_delay:
+            await asyncio.sleep(self.image_delay)
+        seed = _seed(request.match_info["prompt"])
+        img = Image.new("RGB", (64, 64), color=(seed % 256, seed // 256 % 256, seed // 65536 % 256))
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+        return web.Response(body=buffer.getvalue(), content_type="image/png")
+
+    async def palettes(self, request: web.Request):
+        self.calls["palettes"] += 1
+        query = request.query.get("q", "")
+        return web.json_response([
+            {"text": f"Stub {query} palette", "colors": ["#2e4057", "#66a182", "#caffb9", "#aef78e", "#ffffff"]},
+        ])
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._inject])
+        app.router.add_post("/api/generate", self.generate)
+        app.router.add_post("/api/embeddings", self.embeddings)
+        app.router.add_get("/prompt/{prompt}", self.image)
+        app.router.add_get("/api/palette/search", self.palettes)
+        return app
+
+
+def stub_env(base_url: str):
+    """Environment variables pointing the app's clients at the stubs."""
+    return {
+        "OLLAMA_BASE_URL": base_url,
+        "POLLINATIONS_IMAGE_URL": f"{base_url}/prompt/",
+        "COLORMAGIC_SEARCH_URL": f"{base_url}/api/palette/search",
+    }
+
+
+def isolate(base_url: str):
+    """
+    Switch to a scratch copy of docs/ with fresh caches, pointed at the stubs.
+
+    Must run before agent and the API modules are imported, since they
+    read their endpoints and paths at import time.
+
+    Returns:
+        str: The scratch directory (the new working directory).
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    workdir = tempfile.mkdtemp(prefix="branding-stubs-")
+    shutil.copytree(os.path.join(root, "docs"), os.path.join(workdir, "docs"))
+    os.chdir(workdir)
+    os.environ.update(stub_env(base_url))
+    os.environ.update({"RESULT_CACHE_PATH": "", "LOGO_CACHE_DIR": os.path.join(workdir, "cache", "logos")})
+    return workdir
+
+
+async def start(stubs: Stubs, host: str = "127.0.0.1", port: int = 0):
+    """
+    Serve the stubs on the running loop.
+
+    Returns:
+        tuple: (aiohttp.web.AppRunner, base_url) — call `runner.cleanup()` to stop.
+    """
+    runner = web.AppRunner(stubs.app())
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://{host}:{port}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11500)
+    parser.add_argument("--token-delay", type=float, default=0.0)
+    parser.add_argument("--image-delay", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    stubs = Stubs(args.token_delay, args.image_delay, args.latency, args.jitter, args.failure_rate)
+    print(json.dumps(stub_env(f"http://{args.host}:{args.port}"), indent=2))
+    web.run_app(stubs.app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
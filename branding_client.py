@@ -0,0 +1,67 @@
+"""
+Client for the headless branding API (see server.py).
+
+Set BRANDING_API_URL (e.g. http://localhost:8080) to make app.py a thin
+client of a running server instead of generating in-process.
+"""
+import asyncio
+import os
+from urllib.parse import urljoin
+
+import httpx
+
+import http_client
+
+BRANDING_API_URL = os.getenv("BRANDING_API_URL", "")
+# Longer than the server's SERVER_REQUEST_TIMEOUT (300s), so a slow generation ends with its 504
+BRANDING_API_TIMEOUT = float(os.getenv("BRANDING_API_TIMEOUT", "330"))
+
+
+async def request_branding(description: str, use_cache: bool = True, base_url: str = BRANDING_API_URL):
+    """
+    Generate branding through the API and download its assets.
+
+    A busy server (503) is retried with backoff, honouring Retry-After.
+    Nothing else is: a timeout or a failed generation would otherwise
+    start the generation again on the server.
+
+    Args:
+        description (str): The brand/business description.
+        use_cache (bool): Allow the server to reuse a previous result.
+        base_url (str): Server address.
+
+    Returns:
+        tuple: (result, logo, palette)
+            - result (dict): Branding information with the "assets" references.
+            - logo (bytes | None): The logo image, or None if it failed.
+            - palette (tuple): (image bytes, palette_name, palette_colors).
+    Raises:
+        httpx.HTTPStatusError: If the server rejects the request.
+    """
+    resp = await http_client.request(
+        "POST",
+        urljoin(base_url, "/branding"),
+        json={"description": description, "fresh": not use_cache},
+        timeout=BRANDING_API_TIMEOUT,
+        retry_statuses={503},
+        retry_errors=(httpx.ConnectError,),
+    )
+    resp.raise_for_status()
+    result = resp.json()
+    assets = result["assets"]
+
+    async def download(path):
+        if not path:
+            return None
+        r = await http_client.get(urljoin(base_url, path), timeout=60)
+        r.raise_for_status()
+        return r.content
+
+    logo, palette_image = await asyncio.gather(
+        download(assets.get("logo_url")), download(assets["palette_url"]), return_exceptions=True
+    )
+    if isinstance(palette_image, Exception):
+        raise palette_image
+    if isinstance(logo, Exception):
+        logo = None
+    return result, logo, (palette_image, assets["palette_name"], assets["palette_colors"])
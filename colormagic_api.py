@@ -1,67 +1,231 @@
-import httpx
+import json
+import logging
+import os
+import sys
+from functools import lru_cache
+
+import http_client
+import palette_engine
+import telemetry
+from caching import TTLCache
 from PIL import Image, ImageDraw, ImageFont
 
+logger = logging.getLogger(__name__)
 
-async def generate_slogan_palette(slogan: str, query: str):
+SEARCH_URL = os.getenv("COLORMAGIC_SEARCH_URL", "https://colormagic.app/api/palette/search")
+
+# "colormagic" searches the API; "local" uses the bundled palettes (palette_engine.py), offline
+PALETTE_BACKENDS = ("colormagic", "local")
+PALETTE_BACKEND = os.getenv("PALETTE_BACKEND", "colormagic").lower()
+
+# Color words the branding prompt allows the LLM to answer with
+PALETTE_KEYWORDS = (
+    "white", "black", "green", "red", "mint", "bright", "light", "spring", "aqua", "soft",
+    "summer", "orange", "coastal", "cream", "warm", "pink", "blue", "neutral", "elegant",
+    "pastel", "vibrant",
+)
+
+# Optional offline search results, keyed by query, loaded into the cache on first use.
+# Generate the file with `python colormagic_api.py data/palettes.json`, then point
+# PALETTE_PREWARM_PATH at it; pre-warming is off by default.
+PALETTE_PREWARM_PATH = os.getenv("PALETTE_PREWARM_PATH", "")
+PALETTE_CACHE_TTL = float(os.getenv("PALETTE_CACHE_TTL", "86400"))
+
+PALETTE_SIZE = (600, 400)
+
+_search_cache = TTLCache(maxsize=512, ttl=PALETTE_CACHE_TTL)
+_prewarmed = False
+
+
+def normalize_query(query: str) -> str:
+    """Normalise a color keyword (case, whitespace, stray markdown) for cache lookups."""
+    return " ".join(query.lower().split()).strip(" .*_\"'")
+
+
+def load_prewarm(path: str = PALETTE_PREWARM_PATH) -> int:
     """
-    Fetch a color palette from the ColorMagic API and create
-    an image with the slogan displayed on top of it.
+    Load offline palette search results into the cache.
+
+    Pre-warmed entries expire after PALETTE_CACHE_TTL like any other, so
+    stale palettes are refreshed from ColorMagic.
 
     Args:
-        slogan (str): The slogan text to overlay on the palette.
-        query (str): Keyword to search for a matching palette.
+        path (str): JSON file mapping queries to ColorMagic search results
+            (written by `dump_prewarm`). Empty disables pre-warming.
 
     Returns:
-        tuple: (PIL.Image, palette_name, palette_colors)
-            - PIL.Image: Image with palette background and slogan text.
-            - palette_name (str): The palette description returned by the API.
-            - palette_colors (list[str]): List of hex color codes.
+        int: Number of queries loaded.
     """
+    global _prewarmed
+    _prewarmed = True
+    if not path:
+        return 0
     try:
-        url = f"https://colormagic.app/api/palette/search?q={query}"
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            palettes = resp.json()
+        with open(path, encoding="utf-8") as f:
+            results = json.load(f)
+    except (OSError, ValueError):
+        return 0
 
-        if not palettes:
-            raise ValueError("No palette found.")
+    for query, palettes in results.items():
+        _search_cache.set(normalize_query(query), palettes)
+    return len(results)
 
-        # Use the first palette from results
-        palette = palettes[0]["colors"]
-        text = palettes[0]["text"]
 
-        width, height = 600, 400
-        block_width = width // len(palette)
-        img = Image.new("RGB", (width, height), color="white")
-        draw = ImageDraw.Draw(img)
+async def search_palettes(query: str, backend: str = None):
+    """
+    Search ColorMagic for palettes, served from the TTL/LRU cache when possible.
+
+    With the "local" backend the bundled palettes are searched instead,
+    without any network call.
+
+    Args:
+        query (str): Keyword to search for.
+        backend (str | None): "colormagic" or "local" (default: PALETTE_BACKEND).
+
+    Returns:
+        list[dict]: Search results, each with "text" and "colors".
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    backend = backend or PALETTE_BACKEND
+    if backend not in PALETTE_BACKENDS:
+        raise ValueError(f"Unknown palette backend '{backend}' (expected one of {', '.join(PALETTE_BACKENDS)})")
+    if backend == "local":
+        return palette_engine.search(normalize_query(query))
+
+    if not _prewarmed:
+        load_prewarm()
+
+    key = normalize_query(query)
+    palettes = _search_cache.get(key)
+    if palettes is None:
+        resp = await http_client.get(SEARCH_URL, params={"q": key}, timeout=30)
+        resp.raise_for_status()
+        palettes = resp.json()
+        if palettes:
+            _search_cache.set(key, palettes)
+    return palettes
+
+
+def cache_stats():
+    """Return hit/miss counters of the palette search cache."""
+    return _search_cache.stats()
+
+
+@lru_cache(maxsize=1)
+def _load_font():
+    # Load font (fallback to default if missing)
+    try:
+        return ImageFont.truetype("arial.ttf", 32)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=128)
+def _palette_background(colors: tuple) -> bytes:
+    """Render the palette blocks once and keep the raw RGB bytes."""
+    width, height = PALETTE_SIZE
+    block_width = width // len(colors)
+    img = Image.new("RGB", (width, height), color="white")
+    draw = ImageDraw.Draw(img)
 
-        # Draw palette blocks side by side
-        for i, color in enumerate(palette):
-            draw.rectangle(
-                [i * block_width, 0, (i + 1) * block_width, height],
-                fill=color
-            )
+    # Draw palette blocks side by side
+    for i, color in enumerate(colors):
+        draw.rectangle(
+            [i * block_width, 0, (i + 1) * block_width, height],
+            fill=color
+        )
+    return img.tobytes()
 
-        # Load font (fallback to default if missing)
-        try:
-            font = ImageFont.truetype("arial.ttf", 32)
-        except:
-            font = ImageFont.load_default()
 
-        # Center the slogan text
+def render_palette(slogan: str, palette):
+    """
+    Draw the slogan over a (cached) palette background.
+
+    Args:
+        slogan (str): The slogan text to overlay.
+        palette (list[str]): Hex color codes.
+
+    Returns:
+        PIL.Image: A fresh image the caller may modify.
+    """
+    width, height = PALETTE_SIZE
+    with telemetry.span("render.palette"):
+        img = Image.frombytes("RGB", PALETTE_SIZE, _palette_background(tuple(palette)))
+        draw = ImageDraw.Draw(img)
+        font = _load_font()
+
+        # Center the slogan text, in black or white, whichever reads best on the blocks behind it
         bbox = draw.textbbox((0, 0), slogan, font=font)
         text_w, text_h = bbox[2] - bbox[0], bbox[3] - bbox[1]
         x = (width - text_w) // 2
         y = (height - text_h) // 2
-        draw.text((x, y), slogan, font=font, fill="black")
+        block_width = width // len(palette)
+        first, last = max(x, 0) // block_width, min(x + text_w, width - 1) // block_width
+        fill = palette_engine.contrast_text_color(palette[first:last + 1])
+        draw.text((x, y), slogan, font=font, fill=fill)
+    return img
 
-        return img, text, palette
+
+async def generate_slogan_palette(slogan: str, query: str):
+    """
+    Fetch a color palette from the ColorMagic API (or the local palettes,
+    see PALETTE_BACKEND) and create an image with the slogan displayed on
+    top of it.
+
+    Args:
+        slogan (str): The slogan text to overlay on the palette.
+        query (str): Keyword to search for a matching palette.
+
+    Returns:
+        tuple: (PIL.Image, palette_name, palette_colors)
+            - PIL.Image: Image with palette background and slogan text.
+            - palette_name (str): The palette description returned by the search.
+            - palette_colors (list[str]): List of hex color codes.
+    """
+    try:
+        with telemetry.span("palette") as span:
+            span.set(backend=PALETTE_BACKEND)
+            palettes = await search_palettes(query)
+
+            if not palettes:
+                raise ValueError("No palette found.")
+
+            # Use the first palette from results
+            palette = palettes[0]["colors"]
+            text = palettes[0]["text"]
+
+            return render_palette(slogan, palette), text, palette
 
     except Exception as e:
-        print("⚠️ Error generating image:", e)
+        logger.warning("⚠️ Error generating image: %s", e)
         # Fallback: plain white background with slogan
         img = Image.new("RGB", (512, 512), color="white")
         draw = ImageDraw.Draw(img)
         draw.text((10, 250), slogan, fill="black")
-        return img, "fallback", ["#ffffff"]
\ No newline at end of file
+        return img, "fallback", ["#ffffff"]
+
+
+async def dump_prewarm(path: str = os.path.join("data", "palettes.json"), queries=PALETTE_KEYWORDS):
+    """
+    Query ColorMagic for every keyword and write the results as a pre-warm file.
+
+    Args:
+        path (str): Destination JSON file.
+        queries (Iterable[str]): Keywords to fetch.
+    """
+    results = {}
+    for query in queries:
+        resp = await http_client.get(SEARCH_URL, params={"q": query}, timeout=30)
+        resp.raise_for_status()
+        results[query] = resp.json()
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Saved palettes for {len(results)} queries to {path}")
+
+
+if __name__ == "__main__":
+    # python colormagic_api.py [output.json] → write the offline pre-warm file
+    http_client.run(dump_prewarm(*sys.argv[1:2]))
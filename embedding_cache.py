@@ -0,0 +1,105 @@
+import hashlib
+from array import array
+
+from langchain_core.embeddings import Embeddings
+
+from caching import SqliteLRUStore
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that serves repeated texts from a persistent cache.
+
+    Vectors are stored as float32 bytes keyed by (model name, text hash),
+    so rebuilding the index or asking the same query twice never reaches
+    the embedding model again.
+
+    Args:
+        underlying (Embeddings): The embeddings model to wrap.
+        model (str): Model name, part of every cache key.
+        path (str): Location of the SQLite cache file.
+        max_entries (int): Vectors kept before LRU eviction kicks in.
+    """
+
+    def __init__(self, underlying: Embeddings, model: str, path: str, max_entries: int = 100_000):
+        self.underlying = underlying
+        self.model = model
+        self.store = SqliteLRUStore(path, max_entries=max_entries)
+
+    def _key(self, kind: str, text: str) -> str:
+        # Documents and queries can be embedded with different instructions
+        raw = f"{self.model}\0{kind}\0{text}".encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    @staticmethod
+    def _encode(vector) -> bytes:
+        return array("f", vector).tobytes()
+
+    @staticmethod
+    def _decode(value: bytes) -> list:
+        vector = array("f")
+        vector.frombytes(value)
+        return vector.tolist()
+
+    def _embed_many(self, kind: str, texts, embed):
+        keys = [self._key(kind, text) for text in texts]
+        cached = self.store.get_many(keys)
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+
+        if missing:
+            vectors = embed(list(missing.values()))
+            fresh = {key: self._encode(v) for key, v in zip(missing, vectors)}
+            self.store.put_many(fresh)
+            cached.update(fresh)
+
+        return [self._decode(cached[key]) for key in keys]
+
+    def embed_documents(self, texts):
+        """
+        Embed a list of documents, only calling the model for unseen texts.
+
+        Args:
+            texts (list[str]): Texts to embed.
+
+        Returns:
+            list[list[float]]: One vector per input text.
+        """
+        return self._embed_many("doc", texts, self.underlying.embed_documents)
+
+    def embed_queries(self, texts):
+        """
+        Embed a list of search queries (with the model's query instruction),
+        only calling the model for unseen texts.
+
+        Args:
+            texts (list[str]): Queries to embed.
+
+        Returns:
+            list[list[float]]: One vector per query, as `embed_query` would return.
+        """
+        return self._embed_many("query", texts, lambda batch: [self.underlying.embed_query(t) for t in batch])
+
+    def embed_query(self, text: str):
+        """
+        Embed a single query, served from the cache when possible.
+
+        Args:
+            text (str): Query text.
+
+        Returns:
+            list[float]: The query vector.
+        """
+        key = self._key("query", text)
+        value = self.store.get(key)
+        if value is None:
+            value = self._encode(self.underlying.embed_query(text))
+            self.store.put(key, value)
+        return self._decode(value)
+
+    def stats(self):
+        """Return the cache hit/miss counters."""
+        return self.store.stats()
@@ -0,0 +1,457 @@
+"""
+On-disk FAISS index with a SQLite docstore.
+
+The vectorstore directory holds:
+    docstore.sqlite  chunk text, metadata and raw vectors, read lazily
+    CURRENT          name of the live index generation
+    index-<n>/       one index generation:
+        index.faiss  the FAISS index, opened read-only
+        index.ids    docstore ID of every index position, one per line
+        index.json   the index type it was built with
+
+A rebuild writes a new generation directory and then switches CURRENT
+to it in one atomic rename, so readers always see an index and ID list
+that belong together. The previous generation, and the documents it
+references, are kept until the next rebuild for readers still using it.
+
+Only IVF indexes are memory-mapped: their inverted lists are shared
+through the OS page cache by every process. Other types (Flat, HNSW)
+are read into each process's memory, so set FAISS_INDEX=ivf-flat
+(or another IVF type) when many workers serve the same store.
+
+Because the raw vectors are kept, the index can be rebuilt with another
+index type (or after documents were removed) without embedding anything
+again.
+
+Usage:
+    python faiss_store.py rebuild [--index hnsw]
+    python faiss_store.py evaluate [--index hnsw] [--queries 200] [--k 3]
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from contextlib import contextmanager
+
+import faiss
+import numpy as np
+from langchain_community.docstore.base import Docstore
+from langchain_core.documents import Document
+
+import telemetry
+
+try:
+    import fcntl
+except ImportError:  # Windows: rebuilds are not serialised across processes
+    fcntl = None
+
+INDEX_FILE = "index.faiss"
+INDEX_IDS_FILE = "index.ids"
+INDEX_INFO_FILE = "index.json"
+DOCSTORE_FILE = "docstore.sqlite"
+CURRENT_FILE = "CURRENT"
+LOCK_FILE = ".lock"
+
+# Index type: an alias below or any faiss.index_factory string ("IVF256,SQfp16", ...)
+FAISS_INDEX = os.getenv("FAISS_INDEX", "flat")
+FAISS_NPROBE = int(os.getenv("FAISS_NPROBE", "16"))
+FAISS_EF_SEARCH = int(os.getenv("FAISS_EF_SEARCH", "64"))
+FAISS_TRAIN_SIZE = int(os.getenv("FAISS_TRAIN_SIZE", "50000"))
+
+INDEX_ALIASES = {
+    "flat": "Flat",
+    "flat-fp16": "SQfp16",
+    "ivf-flat": "IVF{nlist},Flat",
+    "ivf-fp16": "IVF{nlist},SQfp16",
+    "hnsw": "HNSW32",
+    "ivf-pq": "IVF{nlist},PQ{m}",
+}
+
+logger = logging.getLogger(__name__)
+
+# Vectors read from SQLite per batch when (re)building the index
+_READ_BATCH = 10_000
+# Product quantisation trains 256 centroids per sub-vector and needs ~39 points each
+_PQ_MIN_VECTORS = 39 * 256
+
+
+def resolve_index_factory(index_type: str, count: int, dimension: int) -> str:
+    """
+    Turn an index type into a faiss.index_factory string fitted to the corpus.
+
+    The number of IVF lists is derived from (or clamped to) the corpus
+    size so training always has enough points; PQ uses at most one
+    sub-quantizer per 4 dimensions and falls back to flat codes when
+    there are too few vectors to train it.
+
+    Args:
+        index_type (str): An alias ("flat", "ivf-flat", "hnsw", "ivf-pq", ...)
+            or a factory string.
+        count (int): Number of vectors.
+        dimension (int): Vector dimension.
+
+    Returns:
+        str: A factory string.
+    """
+    factory = INDEX_ALIASES.get(index_type.lower(), index_type)
+    nlist = max(1, min(int(4 * math.sqrt(count)), count // 39))
+    m = next(c for c in (64, 48, 32, 16, 8, 4, 2, 1) if dimension % c == 0 and c <= max(1, dimension // 4))
+    factory = factory.format(nlist=nlist, m=m)
+
+    factory = re.sub(r"IVF(\d+)", lambda match: f"IVF{min(int(match.group(1)), max(1, count // 39))}", factory)
+    if "PQ" in factory and count < _PQ_MIN_VECTORS:
+        factory = re.sub(r"PQ\d+(x\d+)?", "Flat", factory)
+    return factory
+
+
+class SQLiteDocstore(Docstore):
+    """
+    Docstore backed by SQLite instead of a pickled dict.
+
+    Documents are read one by one on lookup, so worker processes share
+    the OS page cache instead of each holding the whole corpus. The raw
+    vectors are stored alongside so the index can be rebuilt cheaply.
+
+    Args:
+        path (str): Location of the SQLite file.
+        read_only (bool): Open without write access (safe for concurrent readers).
+    """
+
+    def __init__(self, path: str, read_only: bool = False):
+        self.path = path
+        self._lock = threading.Lock()
+        if read_only:
+            self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        else:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS docs ("
+                " id TEXT PRIMARY KEY, content TEXT NOT NULL, metadata TEXT NOT NULL, vector BLOB NOT NULL)"
+            )
+        self._conn.execute("PRAGMA mmap_size = 268435456")
+
+    def search(self, search: str):
+        """Return the document with the given ID, or an error string if missing."""
+        with self._lock:
+            row = self._conn.execute("SELECT content, metadata FROM docs WHERE id = ?", (search,)).fetchone()
+        if row is None:
+            return f"ID {search} not found."
+        return Document(page_content=row[0], metadata=json.loads(row[1]))
+
+    def add_documents(self, ids, documents, vectors):
+        """Store chunks together with their embedding vectors."""
+        rows = [
+            (i, doc.page_content, json.dumps(doc.metadata), np.asarray(v, dtype=np.float32).tobytes())
+            for i, doc, v in zip(ids, documents, vectors)
+        ]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def prune(self, keep):
+        """Remove every document whose ID is not in `keep`."""
+        with self._lock:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep (id TEXT PRIMARY KEY)")
+            self._conn.execute("DELETE FROM keep")
+            self._conn.executemany("INSERT OR IGNORE INTO keep VALUES (?)", [(i,) for i in keep])
+            removed = self._conn.execute("DELETE FROM docs WHERE id NOT IN (SELECT id FROM keep)").rowcount
+            self._conn.execute("DELETE FROM keep")
+            self._conn.commit()
+        return removed
+
+    def ids(self):
+        """Return every stored document ID, in insertion order."""
+        with self._lock:
+            return [i for (i,) in self._conn.execute("SELECT id FROM docs ORDER BY rowid")]
+
+    def dimension(self) -> int:
+        """Dimension of the stored vectors (0 when empty)."""
+        with self._lock:
+            row = self._conn.execute("SELECT vector FROM docs LIMIT 1").fetchone()
+        return len(row[0]) // 4 if row else 0
+
+    def vectors(self, ids) -> np.ndarray:
+        """Return the vectors of the given documents, in the same order."""
+        found = {}
+        # Stay below SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            batch = ids[start:start + 500]
+            query = f"SELECT id, vector FROM docs WHERE id IN ({','.join('?' * len(batch))})"
+            with self._lock:
+                found.update(self._conn.execute(query, batch).fetchall())
+        missing = [i for i in ids if i not in found]
+        if missing:
+            raise KeyError(f"{len(missing)} document(s) missing from the docstore, e.g. {missing[0]}")
+        return np.vstack([np.frombuffer(found[i], dtype=np.float32) for i in ids])
+
+    def sample_vectors(self, ids, size: int) -> np.ndarray:
+        """Return the vectors of up to `size` randomly chosen documents (for index training)."""
+        return self.vectors(random.sample(ids, min(size, len(ids))))
+
+    def iter_vectors(self, ids):
+        """
+        Read the vectors of `ids` in order without loading them all at once.
+
+        Yields:
+            np.ndarray: Batches of vectors.
+        """
+        for start in range(0, len(ids), _READ_BATCH):
+            yield self.vectors(ids[start:start + _READ_BATCH])
+
+
+class PositionMap(Mapping):
+    """Read-only `index_to_docstore_id` mapping over an index generation's ID list."""
+
+    def __init__(self, ids):
+        self.ids = ids
+
+    def __getitem__(self, position):
+        if not 0 <= position < len(self.ids):
+            raise KeyError(position)
+        return self.ids[position]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(range(len(self.ids)))
+
+
+@contextmanager
+def build_lock(persist_dir: str):
+    """
+    Hold an exclusive lock on the vectorstore while it is updated.
+
+    Serialises ingestion and index rebuilds across processes, so two
+    workers starting at once don't build the same generation twice.
+    """
+    os.makedirs(persist_dir, exist_ok=True)
+    with open(os.path.join(persist_dir, LOCK_FILE), "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def current_generation(persist_dir: str):
+    """Return the directory of the live index generation, or None if there is none."""
+    try:
+        with open(os.path.join(persist_dir, CURRENT_FILE), encoding="utf-8") as f:
+            name = f.read().strip()
+    except OSError:
+        return None
+    path = os.path.join(persist_dir, name)
+    return path if name and os.path.isdir(path) else None
+
+
+def read_ids(generation: str):
+    """Return the docstore IDs of an index generation, in position order."""
+    with open(os.path.join(generation, INDEX_IDS_FILE), encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def rebuild_index(persist_dir: str, index_type: str = FAISS_INDEX, ids=None):
+    """
+    Build a FAISS index from the vectors in the docstore and make it live.
+
+    The index and its ID list are written to a new generation directory,
+    then CURRENT is switched to it atomically. Generations older than the
+    previous one are removed, together with documents neither of the two
+    remaining generations references. Call under `build_lock`.
+
+    Args:
+        persist_dir (str): Vectorstore directory.
+        index_type (str): Index alias or factory string.
+        ids (list[str] | None): Documents to index, in position order.
+            Defaults to those of the live generation (or all documents).
+
+    Returns:
+        str | None: The factory string used, or None if there is nothing to index.
+    """
+    docstore = SQLiteDocstore(os.path.join(persist_dir, DOCSTORE_FILE))
+    previous = current_generation(persist_dir)
+    if ids is None:
+        ids = read_ids(previous) if previous else docstore.ids()
+    if not ids:
+        return None
+
+    count, dimension = len(ids), docstore.dimension()
+    factory = resolve_index_factory(index_type, count, dimension)
+    started = time.perf_counter()
+    with telemetry.span("vectorstore.build") as span:
+        span.set(factory=factory, vectors=count)
+        index = faiss.index_factory(dimension, factory)
+        if not index.is_trained:
+            index.train(docstore.sample_vectors(ids, FAISS_TRAIN_SIZE))
+        for vectors in docstore.iter_vectors(ids):
+            index.add(vectors)
+
+    name = f"index-{time.time_ns()}"
+    generation = os.path.join(persist_dir, name)
+    os.makedirs(generation)
+    faiss.write_index(index, os.path.join(generation, INDEX_FILE))
+    with open(os.path.join(generation, INDEX_IDS_FILE), "w", encoding="utf-8") as f:
+        f.write("\n".join(ids))
+    with open(os.path.join(generation, INDEX_INFO_FILE), "w", encoding="utf-8") as f:
+        json.dump({"index_type": index_type, "factory": factory, "vectors": count}, f)
+
+    current_path = os.path.join(persist_dir, CURRENT_FILE)
+    with open(current_path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(name)
+    os.replace(current_path + ".tmp", current_path)
+
+    # Keep the previous generation (and its documents) for readers still using it
+    keep = {name, os.path.basename(previous)} if previous else {name}
+    for old in os.listdir(persist_dir):
+        if old.startswith("index-") and old not in keep:
+            shutil.rmtree(os.path.join(persist_dir, old), ignore_errors=True)
+    live = set(ids)
+    if previous:
+        live.update(read_ids(previous))
+    docstore.prune(live)
+
+    logger.info("🧱 Built '%s' index over %d vectors in %.1fs", factory, count, time.perf_counter() - started)
+    return factory
+
+
+def index_info(persist_dir: str):
+    """Return what the live index was built with ({} if there is none)."""
+    generation = current_generation(persist_dir)
+    if generation is None:
+        return {}
+    try:
+        with open(os.path.join(generation, INDEX_INFO_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def open_index(path: str):
+    """
+    Open an index read-only.
+
+    IVF indexes are memory-mapped so their inverted lists are shared
+    between processes; other index types are read into memory.
+    """
+    try:
+        index = faiss.read_index(path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+    except RuntimeError:
+        index = faiss.read_index(path)
+
+    # Search-time knobs; indexes without the parameter ignore it
+    params = faiss.ParameterSpace()
+    for name, value in (("nprobe", FAISS_NPROBE), ("efSearch", FAISS_EF_SEARCH)):
+        try:
+            params.set_index_parameter(index, name, value)
+        except RuntimeError:
+            pass
+    return index
+
+
+def load(persist_dir: str, embeddings):
+    """
+    Open the on-disk index as a LangChain FAISS vectorstore.
+
+    Args:
+        persist_dir (str): Vectorstore directory.
+        embeddings (Embeddings): Used to embed queries.
+
+    Returns:
+        FAISS: A read-only vectorstore.
+    """
+    from langchain_community.vectorstores import FAISS
+
+    generation = current_generation(persist_dir)
+    if generation is None:
+        raise FileNotFoundError(f"No FAISS index in '{persist_dir}'.")
+    return FAISS(
+        embedding_function=embeddings,
+        index=open_index(os.path.join(generation, INDEX_FILE)),
+        docstore=SQLiteDocstore(os.path.join(persist_dir, DOCSTORE_FILE), read_only=True),
+        index_to_docstore_id=PositionMap(read_ids(generation)),
+    )
+
+
+def evaluate(persist_dir: str, index_type: str = None, queries: int = 200, k: int = 3):
+    """
+    Compare search latency and recall@k of an index against exact flat search.
+
+    Stored vectors are used as queries. With `index_type`, a temporary index
+    of that type is built in memory; otherwise the on-disk index is used.
+
+    Returns:
+        dict: Latency (ms per query) for both indexes and recall@k.
+    """
+    docstore = SQLiteDocstore(os.path.join(persist_dir, DOCSTORE_FILE), read_only=True)
+    generation = current_generation(persist_dir)
+    ids = read_ids(generation) if generation else docstore.ids()
+    count, dimension = len(ids), docstore.dimension()
+
+    if index_type:
+        factory = resolve_index_factory(index_type, count, dimension)
+        index = faiss.index_factory(dimension, factory)
+        if not index.is_trained:
+            index.train(docstore.sample_vectors(ids, FAISS_TRAIN_SIZE))
+    elif generation:
+        factory = index_info(persist_dir).get("factory", "on-disk")
+        index = open_index(os.path.join(generation, INDEX_FILE))
+    else:
+        raise FileNotFoundError(f"No FAISS index in '{persist_dir}'; pass --index to evaluate one.")
+
+    exact = faiss.IndexFlatL2(dimension)
+    for vectors in docstore.iter_vectors(ids):
+        exact.add(vectors)
+        if index_type:
+            index.add(vectors)
+
+    sample = docstore.sample_vectors(ids, queries)
+
+    def timed(target):
+        started = time.perf_counter()
+        _, found = target.search(sample, k)
+        return found, (time.perf_counter() - started) * 1000 / len(sample)
+
+    truth, flat_ms = timed(exact)
+    found, index_ms = timed(index)
+    hits = sum(len(set(t) & set(f)) for t, f in zip(truth, found))
+    return {
+        "index": factory,
+        "vectors": count,
+        "queries": len(sample),
+        "k": k,
+        "flat_ms_per_query": flat_ms,
+        "index_ms_per_query": index_ms,
+        "recall_at_k": hits / truth.size,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the FAISS vectorstore.")
+    parser.add_argument("command", choices=["rebuild", "evaluate"])
+    parser.add_argument("--dir", default="vectorstore", help="vectorstore directory")
+    parser.add_argument("--index", help=f"index alias ({', '.join(INDEX_ALIASES)}) or factory string")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=3)
+    args = parser.parse_args(argv)
+    telemetry.setup()
+
+    if args.command == "rebuild":
+        with build_lock(args.dir):
+            rebuild_index(args.dir, args.index or FAISS_INDEX)
+    else:
+        print(json.dumps(evaluate(args.dir, args.index, args.queries, args.k), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+import asyncio
+import atexit
+import contextvars
+import importlib.util
+import os
+import random
+import threading
+import weakref
+from urllib.parse import urlsplit
+
+import httpx
+
+import telemetry
+
+# Connection pool and retry settings (overridable through the environment)
+MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+PER_HOST_CONCURRENCY = int(os.getenv("HTTP_PER_HOST_CONCURRENCY", "4"))
+MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+BACKOFF_BASE = float(os.getenv("HTTP_BACKOFF_BASE", "0.5"))
+BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "8"))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class ClientManager:
+    """
+    Process-wide pool of `httpx.AsyncClient`s shared by the API modules.
+
+    One client is kept per event loop, so connections are reused with
+    keep-alive (and HTTP/2 when `h2` is installed) instead of a fresh
+    TCP/TLS handshake per request. A per-host semaphore caps concurrent
+    requests to each upstream, and failed requests are retried with
+    jittered exponential backoff.
+
+    Synchronous callers such as the Streamlit app should use `submit` or
+    `run`, which execute coroutines on a long-lived background loop so its
+    client survives across script reruns.
+
+    Args:
+        max_connections (int): Total connections per client.
+        max_keepalive_connections (int): Idle connections kept open.
+        keepalive_expiry (float): Seconds an idle connection is kept.
+        per_host_concurrency (int): Concurrent requests allowed per host.
+        max_retries (int): Default retries after the first attempt.
+        backoff_base (float): Base delay in seconds for the backoff.
+        backoff_max (float): Upper bound of a single backoff delay.
+        http2 (bool | None): Force HTTP/2 on or off (default: if `h2` is installed).
+        transport (httpx.AsyncBaseTransport | None): Custom transport, e.g.
+            `httpx.MockTransport` for testing.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = MAX_CONNECTIONS,
+        max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY,
+        per_host_concurrency: int = PER_HOST_CONCURRENCY,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = BACKOFF_MAX,
+        http2=None,
+        transport=None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.per_host_concurrency = per_host_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.http2 = importlib.util.find_spec("h2") is not None if http2 is None else http2
+        self.transport = transport
+
+        self._clients = weakref.WeakKeyDictionary()
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+
+    def client(self) -> httpx.AsyncClient:
+        """Return the shared client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=self.limits,
+                http2=self.http2,
+                transport=self.transport,
+                follow_redirects=True,
+            )
+            self._clients[loop] = client
+        return client
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        per_loop = self._semaphores.setdefault(loop, {})
+        if host not in per_loop:
+            per_loop[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return per_loop[host]
+
+    def _backoff(self, attempt: int, response=None) -> float:
+        # Honour a numeric Retry-After, otherwise use "full jitter" backoff
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        retries=None,
+        retry_statuses=RETRY_STATUSES,
+        retry_errors=(httpx.TransportError,),
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Send a request through the shared client.
+
+        Transport errors and retryable status codes (429, 5xx) are retried
+        with jittered backoff. The last response is returned as-is, so
+        callers still decide when to `raise_for_status()`.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Absolute URL.
+            retries (int | None): Override the default number of retries.
+            retry_statuses (Collection[int]): Status codes that are retried.
+            retry_errors (tuple[type[Exception], ...]): Exceptions that are
+                retried, e.g. only `httpx.ConnectError` for requests that
+                must not be sent twice.
+            **kwargs: Passed to `httpx.AsyncClient.request` (e.g. `timeout`).
+
+        Returns:
+            httpx.Response: The final response.
+        """
+        retries = self.max_retries if retries is None else retries
+        client = self.client()
+        host = urlsplit(url).netloc
+        semaphore = self._semaphore(host)
+
+        with telemetry.span("http", host=host) as span:
+            for attempt in range(retries + 1):
+                response = None
+                try:
+                    async with semaphore:
+                        response = await client.request(method, url, **kwargs)
+                    telemetry.inc("http_responses_total", host=host, status=response.status_code)
+                    if response.status_code not in retry_statuses or attempt == retries:
+                        span.set(status=response.status_code, attempts=attempt + 1)
+                        return response
+                    await response.aclose()
+                except retry_errors as e:
+                    telemetry.inc("http_responses_total", host=host, status=type(e).__name__)
+                    if attempt == retries:
+                        span.set(attempts=attempt + 1)
+                        raise
+                telemetry.inc("http_retries_total", host=host)
+                await asyncio.sleep(self._backoff(attempt, response))
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """Shortcut for `request("GET", url, ...)`."""
+        return await self.request("GET", url, **kwargs)
+
+    async def aclose(self):
+        """Close the client bound to the running event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _background_loop(self):
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="http-client-loop", daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def submit(self, coro):
+        """
+        Schedule a coroutine on the background loop.
+
+        The caller's context variables (e.g. the current trace) are carried
+        over, so spans opened by the coroutine join the caller's trace.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the coroutine's result.
+        """
+        return asyncio.run_coroutine_threadsafe(_run_in(contextvars.copy_context(), coro), self._background_loop())
+
+    def run(self, coro):
+        """Run a coroutine on the background loop and wait for its result."""
+        return self.submit(coro).result()
+
+    def close(self):
+        """Close the background loop's client and stop the loop."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), loop).result(timeout=10)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=10)
+        loop.close()
+
+
+async def _run_in(context: contextvars.Context, coro):
+    # The task runs in a copy of the loop thread's context; restore the caller's values in it
+    for var, value in context.items():
+        var.set(value)
+    return await coro
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_manager() -> ClientManager:
+    """Return the process-wide client manager, creating it on first use."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ClientManager()
+        return _manager
+
+
+def configure(**kwargs) -> ClientManager:
+    """
+    Replace the process-wide client manager.
+
+    Args:
+        **kwargs: Passed to `ClientManager` (e.g. `transport=httpx.MockTransport(handler)`).
+
+    Returns:
+        ClientManager: The new manager.
+    """
+    global _manager
+    with _manager_lock:
+        old, _manager = _manager, ClientManager(**kwargs)
+    if old is not None:
+        old.close()
+    return _manager
+
+
+async def request(method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a request through the process-wide client manager."""
+    return await get_manager().request(method, url, **kwargs)
+
+
+async def get(url: str, **kwargs) -> httpx.Response:
+    """Send a GET request through the process-wide client manager."""
+    return await get_manager().get(url, **kwargs)
+
+
+async def aclose():
+    """Close the process-wide client bound to the running event loop."""
+    await get_manager().aclose()
+
+
+def submit(coro):
+    """Schedule a coroutine on the process-wide background loop."""
+    return get_manager().submit(coro)
+
+
+def run(coro):
+    """Run a coroutine on the process-wide background loop and wait for it."""
+    return get_manager().run(coro)
+
+
+@atexit.register
+def _shutdown():
+    if _manager is not None:
+        _manager.close()
@@ -0,0 +1,161 @@
+import hashlib
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+# Chunking and pipeline settings (overridable through the environment)
+CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "1000"))
+CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "150"))
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", str(os.cpu_count() or 1)))
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "64"))
+
+
+def chunking_config():
+    """Return the chunking settings, recorded in the manifest to detect changes."""
+    return {"chunk_size": CHUNK_SIZE, "chunk_overlap": CHUNK_OVERLAP}
+
+
+def load_file(path: str):
+    """
+    Load a single PDF or TXT file.
+
+    Args:
+        path (str): Path to the source file.
+
+    Returns:
+        list: The documents (pages) loaded from the file.
+    """
+    from langchain_community.document_loaders import PyPDFLoader, TextLoader
+
+    if path.endswith(".pdf"):
+        return PyPDFLoader(path).load()
+    if path.endswith(".txt"):
+        return TextLoader(path).load()
+    return []
+
+
+def parse_file(file: str, path: str, digest: str, chunk_size: int = CHUNK_SIZE, chunk_overlap: int = CHUNK_OVERLAP):
+    """
+    Load and chunk one source file (runs inside a worker process).
+
+    Chunks get stable docstore IDs derived from the file's name and
+    content hash, so identical files under different names don't collide.
+
+    Returns:
+        tuple: (file, digest, chunks, ids)
+    """
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+    splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    chunks = splitter.split_documents(load_file(path))
+    prefix = hashlib.sha256(f"{file}\0{digest}".encode("utf-8")).hexdigest()
+    ids = [f"{prefix}-{i}" for i in range(len(chunks))]
+    return file, digest, chunks, ids
+
+
+def iter_parsed(sources, workers: int = INGEST_WORKERS, **chunking):
+    """
+    Parse source files in a process pool, yielding each as soon as it is ready.
+
+    At most two files per worker are in flight, so memory stays bounded
+    no matter how many files there are.
+
+    Args:
+        sources (list[tuple]): (file, path, digest) for each file to parse.
+        workers (int): Worker processes (1 parses inline).
+        **chunking: `chunk_size` / `chunk_overlap` overrides.
+
+    Yields:
+        tuple: (file, digest, chunks, ids)
+    """
+    workers = max(1, min(workers, len(sources)))
+    if workers == 1:
+        for source in sources:
+            yield parse_file(*source, **chunking)
+        return
+
+    pending = iter(sources)
+    # Spawn rather than fork: callers may already run background threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        in_flight = set()
+        while True:
+            while len(in_flight) < workers * 2:
+                source = next(pending, None)
+                if source is None:
+                    break
+                in_flight.add(pool.submit(parse_file, *source, **chunking))
+            if not in_flight:
+                return
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def iter_batches(parsed, batch_size: int = EMBED_BATCH_SIZE):
+    """
+    Regroup parsed files into fixed-size chunk batches.
+
+    Yields:
+        tuple: (chunks, ids) with at most `batch_size` items each.
+    """
+    chunks, ids = [], []
+    for _, _, file_chunks, file_ids in parsed:
+        # Walk each file by offset instead of re-slicing the remainder per batch
+        start = 0
+        while start < len(file_chunks):
+            take = batch_size - len(chunks)
+            chunks.extend(file_chunks[start:start + take])
+            ids.extend(file_ids[start:start + take])
+            start += take
+            if len(chunks) == batch_size:
+                yield chunks, ids
+                chunks, ids = [], []
+    if chunks:
+        yield chunks, ids
+
+
+def ingest(docstore, sources, embeddings, workers: int = INGEST_WORKERS, batch_size: int = EMBED_BATCH_SIZE, **chunking):
+    """
+    Parse, chunk and embed source files, storing them in the docstore batch by batch.
+
+    Args:
+        docstore (SQLiteDocstore): Where chunks and their vectors are stored.
+        sources (list[tuple]): (file, path, digest) for each file to ingest.
+        embeddings (Embeddings): Model used to embed the chunks.
+        workers (int): Worker processes used for parsing.
+        batch_size (int): Chunks embedded per call.
+        **chunking: `chunk_size` / `chunk_overlap` overrides.
+
+    Returns:
+        tuple: (files, stats) — manifest entries for the ingested files
+        and throughput figures.
+    """
+    files = {}
+    stats = {"files": 0, "chunks": 0}
+    started = time.perf_counter()
+
+    def record(parsed):
+        # Track manifest entries as files flow through the pipeline
+        for file, digest, chunks, ids in parsed:
+            files[file] = {"sha256": digest, "ids": ids}
+            stats["files"] += 1
+            yield file, digest, chunks, ids
+
+    for chunks, ids in iter_batches(record(iter_parsed(sources, workers, **chunking)), batch_size):
+        vectors = embeddings.embed_documents([chunk.page_content for chunk in chunks])
+        docstore.add_documents(ids, chunks, vectors)
+        stats["chunks"] += len(chunks)
+
+    stats["seconds"] = time.perf_counter() - started
+    stats["files_per_second"] = stats["files"] / stats["seconds"] if stats["seconds"] else 0.0
+    stats["chunks_per_second"] = stats["chunks"] / stats["seconds"] if stats["seconds"] else 0.0
+    logger.info(
+        "📥 Ingested %d file(s), %d chunk(s) in %.1fs (%.2f files/s, %.1f chunks/s)",
+        stats["files"], stats["chunks"], stats["seconds"], stats["files_per_second"], stats["chunks_per_second"],
+    )
+    return files, stats
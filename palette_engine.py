@@ -0,0 +1,199 @@
+"""
+Local palette search, an offline alternative to the ColorMagic API.
+
+    palettes = palette_engine.search("soft green")
+    fill = palette_engine.contrast_text_color(palettes[0]["colors"])
+
+Palettes come from a bundled dataset (data/local_palettes.json), each
+tagged with the color keywords the branding prompt allows. The dataset is
+loaded once and indexed two ways: by keyword (a palette × keyword matrix)
+and by perceptual color (CIELAB vectors of every swatch). A query is
+matched on its keywords; color words, CSS color names and hex codes are
+also turned into Lab targets, and palettes are ranked by their nearest
+swatch to those targets (CIE76 distance). Results have the same shape as
+ColorMagic's: [{"text": str, "colors": [hex, ...]}, ...].
+
+Select it with PALETTE_BACKEND=local (see colormagic_api.py).
+"""
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+from PIL import ImageColor
+
+PALETTE_DATASET_PATH = os.getenv(
+    "PALETTE_DATASET_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "local_palettes.json"),
+)
+
+# Reference colors for the keywords that name a hue (mood words have none)
+KEYWORD_COLORS = {
+    "white": "#ffffff",
+    "black": "#000000",
+    "green": "#2d6a4f",
+    "red": "#c1121f",
+    "mint": "#98ff98",
+    "aqua": "#00c2c7",
+    "orange": "#f77f00",
+    "pink": "#ff8fab",
+    "blue": "#1e6091",
+    "cream": "#fffdd0",
+}
+
+# sRGB (D65) → XYZ, and the D65 reference white
+_RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+_WHITE_D65 = np.array([0.95047, 1.0, 1.08883])
+_LAB_EPSILON = 216 / 24389
+_LAB_KAPPA = 24389 / 27
+
+
+def hex_to_rgb(colors) -> np.ndarray:
+    """
+    Parse colors ("#aabbcc", "#abc" or CSS names) into an (..., 3) array in [0, 1].
+
+    Raises:
+        ValueError: If a color cannot be parsed.
+    """
+    return np.array([ImageColor.getrgb(c)[:3] for c in colors], dtype=np.float64) / 255.0
+
+
+def _linearize(rgb: np.ndarray) -> np.ndarray:
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """Convert sRGB values in [0, 1], shape (..., 3), to CIELAB (D65)."""
+    xyz = _linearize(rgb) @ _RGB_TO_XYZ.T / _WHITE_D65
+    f = np.where(xyz > _LAB_EPSILON, np.cbrt(xyz), (_LAB_KAPPA * xyz + 16) / 116)
+    fx, fy, fz = f[..., 0], f[..., 1], f[..., 2]
+    return np.stack([116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)], axis=-1)
+
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """WCAG relative luminance of sRGB values in [0, 1], shape (..., 3)."""
+    return _linearize(rgb) @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def text_colors(rgb: np.ndarray) -> np.ndarray:
+    """
+    Pick black or white text for many backgrounds at once.
+
+    Args:
+        rgb (np.ndarray): Backgrounds, shape (n, swatches, 3) in [0, 1].
+            Text must stay readable over every swatch of a row.
+
+    Returns:
+        np.ndarray: Booleans, shape (n,); True where white text has the
+        better worst-case WCAG contrast ratio.
+    """
+    luminance = relative_luminance(rgb)
+    on_black = (luminance + 0.05) / 0.05
+    on_white = 1.05 / (luminance + 0.05)
+    return on_white.min(axis=-1) > on_black.min(axis=-1)
+
+
+@lru_cache(maxsize=256)
+def _contrast_text_color(colors: tuple) -> str:
+    return "#ffffff" if text_colors(hex_to_rgb(colors)[np.newaxis])[0] else "#000000"
+
+
+def contrast_text_color(colors) -> str:
+    """
+    Return the text color ("#000000" or "#ffffff") readable over all `colors`.
+
+    Args:
+        colors (list[str]): Background colors the text overlaps.
+
+    Returns:
+        str: Hex color, black when `colors` is empty.
+    """
+    return _contrast_text_color(tuple(colors)) if colors else "#000000"
+
+
+@lru_cache(maxsize=1024)
+def _word_lab(word: str):
+    # Lab color named by a query word (keyword, CSS name or hex code), or None
+    try:
+        return rgb_to_lab(hex_to_rgb([KEYWORD_COLORS.get(word, word)])[0])
+    except ValueError:
+        return None
+
+
+class PaletteIndex:
+    """
+    In-memory palette dataset indexed by keyword and CIELAB color.
+
+    Args:
+        palettes (list[dict]): Entries with "text", "colors" (equal-length
+            hex lists) and "keywords".
+    """
+
+    def __init__(self, palettes):
+        self.palettes = [{"text": p["text"], "colors": list(p["colors"])} for p in palettes]
+        self.keywords = sorted({k for p in palettes for k in p["keywords"]})
+        self._keyword_ids = {k: i for i, k in enumerate(self.keywords)}
+        self._tags = np.zeros((len(palettes), len(self.keywords)), dtype=np.float32)
+        for row, p in enumerate(palettes):
+            self._tags[row, [self._keyword_ids[k] for k in p["keywords"]]] = 1.0
+        rgb = np.stack([hex_to_rgb(p["colors"]) for p in palettes])
+        self.lab = rgb_to_lab(rgb)
+
+    @classmethod
+    def from_file(cls, path: str = PALETTE_DATASET_PATH) -> "PaletteIndex":
+        """Load the dataset from a JSON list of palettes."""
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def search(self, query: str, limit: int = 5):
+        """
+        Find the palettes best matching a query.
+
+        Palettes tagged with more of the query's keywords rank first; ties
+        (and queries without keywords) are ranked by the perceptual
+        distance of their closest swatch to each color named in the query.
+
+        Args:
+            query (str): Keywords, CSS color names or hex codes.
+            limit (int): Maximum results.
+
+        Returns:
+            list[dict]: {"text", "colors"} per palette, best first; empty
+            if nothing in the query is recognised.
+        """
+        words = [w.strip(".*_\"'") for w in query.lower().replace(",", " ").split()]
+        query_tags = np.zeros(len(self.keywords), dtype=np.float32)
+        for word in words:
+            if word in self._keyword_ids:
+                query_tags[self._keyword_ids[word]] = 1.0
+        matches = self._tags @ query_tags
+        targets = [lab for lab in map(_word_lab, words) if lab is not None]
+        if not matches.any() and not targets:
+            return []
+
+        # (palettes, swatches, targets) → nearest swatch per target, averaged over targets
+        if targets:
+            targets = np.stack(targets)
+            distance = np.linalg.norm(self.lab[:, :, np.newaxis, :] - targets, axis=-1).min(axis=1).mean(axis=1)
+        else:
+            distance = np.zeros(len(self.palettes))
+        # Sort by keyword matches (descending), then distance; stable, so dataset order breaks ties
+        order = np.lexsort((distance, -matches))
+        if matches.any():
+            order = order[matches[order] > 0]
+        return [dict(self.palettes[i], colors=list(self.palettes[i]["colors"])) for i in order[:limit]]
+
+
+@lru_cache(maxsize=1)
+def get_index() -> PaletteIndex:
+    """Return the bundled palette index, loading it on first use."""
+    return PaletteIndex.from_file(PALETTE_DATASET_PATH)
+
+
+def search(query: str, limit: int = 5):
+    """Search the bundled palettes (see `PaletteIndex.search`)."""
+    return get_index().search(query, limit)
@@ -1,6 +1,120 @@
-import httpx
-from PIL import Image, ImageDraw
+import asyncio
+import hashlib
+import logging
+import os
+import re
 from io import BytesIO
+from urllib.parse import quote
+
+import http_client
+import telemetry
+from caching import DiskLRUCache
+from PIL import Image, ImageDraw
+
+logger = logging.getLogger(__name__)
+
+IMAGE_URL = os.getenv("POLLINATIONS_IMAGE_URL", "https://image.pollinations.ai/prompt/")
+
+LOGO_CACHE_DIR = os.getenv("LOGO_CACHE_DIR", os.path.join("cache", "logos"))
+LOGO_CACHE_MAX_BYTES = int(os.getenv("LOGO_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
+_logo_cache = DiskLRUCache(LOGO_CACHE_DIR, max_bytes=LOGO_CACHE_MAX_BYTES)
+
+# Downloads in progress, so identical prompts share a single request
+_inflight = {}
+
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalise a logo-mark prompt (case, punctuation, whitespace)."""
+    return " ".join(_NON_WORD_RE.sub(" ", prompt.lower()).split())
+
+
+def logo_cache_key(prompt: str) -> str:
+    """Return the content-addressed cache key for a logo-mark prompt."""
+    return hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest()
+
+
+def logo_cache_path(prompt: str) -> str:
+    """Return where the cached logo for a prompt is (or would be) stored."""
+    return _logo_cache.path(logo_cache_key(prompt))
+
+
+def cached_logo(key: str):
+    """Return the cached logo bytes for a `logo_cache_key`, or None."""
+    return _logo_cache.get(key)
+
+
+async def _download_logo(prompt: str, key: str) -> bytes:
+    safe_prompt = normalize_prompt(prompt).replace(" ", "_")
+    logger.debug("Safe Prompt: %s", safe_prompt)
+
+    # Pollinations.ai endpoint; image generation is slow, so only retry once
+    resp = await http_client.get(IMAGE_URL + quote(safe_prompt), timeout=60, retries=1)
+    resp.raise_for_status()
+    data = resp.content
+    _logo_cache.put(key, data)
+    return data
+
+
+async def fetch_logo_bytes(prompt: str) -> bytes:
+    """
+    Return the encoded logo image for a prompt, from the disk cache when possible.
+
+    Concurrent calls for the same normalised prompt share one download.
+
+    Args:
+        prompt (str): Text prompt describing the logo.
+
+    Returns:
+        bytes: The image as returned by Pollinations.ai.
+    Raises:
+        httpx.HTTPError: If the download fails.
+    """
+    key = logo_cache_key(prompt)
+    data = _logo_cache.get(key)
+    if data is not None:
+        return data
+
+    inflight_key = (asyncio.get_running_loop(), key)
+    task = _inflight.get(inflight_key)
+    if task is None:
+        task = asyncio.ensure_future(_download_logo(prompt, key))
+        _inflight[inflight_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(inflight_key, None))
+    # Shield so one cancelled waiter doesn't cancel the shared download
+    return await asyncio.shield(task)
+
+
+def _placeholder(prompt: str):
+    # Fallback: plain white background with prompt text
+    img = Image.new("RGB", (512, 512), color="white")
+    draw = ImageDraw.Draw(img)
+    draw.text((10, 250), prompt, fill="black")
+    return img
+
+
+async def generate_logo_bytes(prompt: str) -> bytes:
+    """
+    Generate a logo image and return it encoded, ready for `st.image`.
+
+    Args:
+        prompt (str): Text prompt describing the logo.
+
+    Returns:
+        bytes: Generated image from Pollinations.ai, or a PNG placeholder
+        if the request fails.
+    """
+    with telemetry.span("logo") as span:
+        try:
+            return await fetch_logo_bytes(prompt)
+        except Exception as e:
+            logger.warning("⚠️ Error generating image: %s", e)
+            span.set(fallback=True)
+            buffer = BytesIO()
+            _placeholder(prompt).save(buffer, format="PNG")
+            return buffer.getvalue()
 
 
 async def generate_logo_image(prompt: str):
@@ -14,24 +128,15 @@ async def generate_logo_image(prompt: str):
         PIL.Image: Generated image from Pollinations.ai, or a fallback
         placeholder image if the request fails.
     """
-    try:
-        safe_prompt = prompt.replace(" ", "_")
-        print("Safe Prompt:", safe_prompt)
-
-        # Pollinations.ai endpoint
-        url = f"https://image.pollinations.ai/prompt/{safe_prompt}"
-
-        # Send request to Pollinations API
-        async with httpx.AsyncClient(timeout=60, follow_redirects=True) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            return Image.open(BytesIO(resp.content))
-
-    except Exception as e:
-        print("⚠️ Error generating image:", e)
-
-        # Fallback: plain white background with prompt text
-        img = Image.new("RGB", (512, 512), color="white")
-        draw = ImageDraw.Draw(img)
-        draw.text((10, 250), prompt, fill="black")
-        return img
\ No newline at end of file
+    with telemetry.span("logo") as span:
+        try:
+            return Image.open(BytesIO(await fetch_logo_bytes(prompt)))
+        except Exception as e:
+            logger.warning("⚠️ Error generating image: %s", e)
+            span.set(fallback=True)
+            return _placeholder(prompt)
+
+
+def cache_stats():
+    """Return hit/miss counters of the logo image cache."""
+    return _logo_cache.stats()
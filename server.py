@@ -0,0 +1,354 @@
+"""
+Headless HTTP API for branding generation.
+
+Usage:
+    python server.py [--host 0.0.0.0] [--port 8080] [--workers 4]
+
+Endpoints:
+    POST /branding          {"description": str, "fresh": bool, "assets": bool}
+    GET  /logos/{key}       logo image referenced by a result
+    GET  /palettes/render   palette image (PNG), ?colors=#aabbcc,...&slogan=...
+    GET  /healthz           readiness and queue depth
+    GET  /metrics           Prometheus metrics (see telemetry.py)
+
+Generations wait in a bounded queue and at most OLLAMA_CONCURRENCY run at
+once; when the queue is full the server answers 503 with Retry-After.
+Identical descriptions arriving while one is being generated share its
+result. With --workers, several processes share the port (SO_REUSEPORT)
+and the on-disk vectorstore and caches.
+"""
+import argparse
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+from aiohttp import web
+
+import http_client
+import telemetry
+from agent import generate_branding, get_cached_result, is_ready, normalize_description, warm_up
+from colormagic_api import render_palette, search_palettes
+from pollinations_api import cached_logo, fetch_logo_bytes, logo_cache_key
+
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8080"))
+# Generations waiting for a free Ollama slot before requests are rejected
+SERVER_QUEUE_SIZE = int(os.getenv("SERVER_QUEUE_SIZE", "32"))
+OLLAMA_CONCURRENCY = int(os.getenv("OLLAMA_CONCURRENCY", "2"))
+SERVER_REQUEST_TIMEOUT = float(os.getenv("SERVER_REQUEST_TIMEOUT", "300"))
+SERVER_RETRY_AFTER = int(os.getenv("SERVER_RETRY_AFTER", "5"))
+
+logger = logging.getLogger(__name__)
+
+_LOGO_KEY_RE = re.compile(r"[0-9a-f]{64}")
+_HEX_COLOR_RE = re.compile(r"#?[0-9a-fA-F]{6}")
+
+
+class ServiceBusy(Exception):
+    """Raised when the generation queue is full."""
+
+
+class BrandingService:
+    """
+    Runs `generate_branding` off the event loop with bounded concurrency.
+
+    Requests are queued (up to `queue_size`) and served by `concurrency`
+    workers, each running one Ollama generation at a time on a thread.
+    A request for a description that is already queued or running waits
+    for that generation instead of starting another.
+
+    Args:
+        queue_size (int): Generations allowed to wait before `generate` raises `ServiceBusy`.
+        concurrency (int): Concurrent Ollama generations.
+    """
+
+    def __init__(self, queue_size: int = SERVER_QUEUE_SIZE, concurrency: int = OLLAMA_CONCURRENCY):
+        self.queue_size = queue_size
+        self.concurrency = concurrency
+        self.stats = {"requests": 0, "cached": 0, "coalesced": 0, "rejected": 0, "completed": 0, "failed": 0}
+        self._queue = None
+        self._workers = []
+        self._inflight = {}
+        self._executor = None
+
+    async def start(self):
+        """Start the worker tasks on the running loop."""
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="llm")
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def stop(self):
+        """Cancel the workers and any generation still queued."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        for future in self._inflight.values():
+            if not future.done():
+                future.cancel()
+        self._executor.shutdown(wait=False)
+
+    def queue_depth(self) -> int:
+        """Generations waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def generate(self, description: str, use_cache: bool = True) -> dict:
+        """
+        Generate (or reuse) the branding for a description.
+
+        Args:
+            description (str): The brand/business description.
+            use_cache (bool): Serve a previous result if there is one.
+
+        Returns:
+            dict: Branding information, as returned by `generate_branding`.
+        Raises:
+            ServiceBusy: If the queue is full.
+        """
+        self.stats["requests"] += 1
+        # Cache hits skip the queue; the corpus version is only known once the index is loaded
+        if use_cache and is_ready():
+            entry = get_cached_result(description)
+            if entry is not None:
+                self.stats["cached"] += 1
+                return dict(entry["result"])
+
+        key = (normalize_description(description), use_cache)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            try:
+                self._queue.put_nowait((description, use_cache, future, time.perf_counter()))
+            except asyncio.QueueFull:
+                self.stats["rejected"] += 1
+                raise ServiceBusy(f"{self.queue_size} generations already queued") from None
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._finish(key))
+        else:
+            self.stats["coalesced"] += 1
+        # Shield so one client disconnecting doesn't cancel the shared generation
+        return dict(await asyncio.shield(future))
+
+    def _finish(self, key):
+        future = self._inflight.pop(key)
+        # Mark a failure as seen even if every waiter already gave up
+        if not future.cancelled():
+            future.exception()
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            description, use_cache, future, queued_at = await self._queue.get()
+            telemetry.record("queue", time.perf_counter() - queued_at)
+            try:
+                result = await loop.run_in_executor(self._executor, _generate, description, use_cache)
+            except Exception as e:
+                self.stats["failed"] += 1
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                self.stats["completed"] += 1
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._queue.task_done()
+
+
+def _generate(description: str, use_cache: bool) -> dict:
+    # Runs on an executor thread: each generation is its own trace
+    with telemetry.trace("server.generate"):
+        return generate_branding(description, use_cache)
+
+
+def palette_url(slogan: str, colors) -> str:
+    """Return the relative URL rendering a palette image with the slogan."""
+    return "/palettes/render?" + urlencode({"colors": ",".join(colors), "slogan": slogan})
+
+
+async def build_assets(result: dict) -> dict:
+    """
+    Fetch the logo and palette for a result and describe them by URL.
+
+    Returns:
+        dict: logo_url (or logo_error), palette_name, palette_colors and
+        palette_url (the "fallback" white palette if the search fails).
+    """
+
+    async def logo():
+        try:
+            await fetch_logo_bytes(result["logo_mark"])
+            return {"logo_url": f"/logos/{logo_cache_key(result['logo_mark'])}"}
+        except Exception as e:
+            return {"logo_url": None, "logo_error": str(e)}
+
+    async def palette():
+        try:
+            palettes = await search_palettes(result["color"].lower())
+            if not palettes:
+                raise ValueError("No palette found.")
+            name, colors = palettes[0]["text"], palettes[0]["colors"]
+            assets = {}
+        except Exception as e:
+            name, colors = "fallback", ["#ffffff"]
+            assets = {"palette_error": str(e)}
+        assets.update(palette_name=name, palette_colors=colors, palette_url=palette_url(result["slogan"], colors))
+        return assets
+
+    assets = {}
+    for part in await asyncio.gather(logo(), palette()):
+        assets.update(part)
+    return assets
+
+
+def _error(status: int, message: str, **kwargs):
+    return web.json_response({"error": message}, status=status, **kwargs)
+
+
+async def handle_branding(request: web.Request):
+    try:
+        body = await request.json()
+    except ValueError:
+        return _error(400, "Body must be JSON.")
+    description = body.get("description") if isinstance(body, dict) else None
+    if not isinstance(description, str) or not description.strip():
+        return _error(400, "'description' is required.")
+
+    service = request.app["service"]
+    try:
+        result = await asyncio.wait_for(
+            service.generate(description, use_cache=not body.get("fresh", False)),
+            SERVER_REQUEST_TIMEOUT,
+        )
+    except ServiceBusy as e:
+        return _error(503, str(e), headers={"Retry-After": str(SERVER_RETRY_AFTER)})
+    except asyncio.TimeoutError:
+        return _error(504, "Generation timed out.")
+    except Exception as e:
+        return _error(500, f"Generation failed: {e}")
+
+    if body.get("assets", True):
+        result["assets"] = await build_assets(result)
+    return web.json_response(result)
+
+
+async def handle_logo(request: web.Request):
+    key = request.match_info["key"]
+    data = cached_logo(key) if _LOGO_KEY_RE.fullmatch(key) else None
+    if data is None:
+        return _error(404, "Unknown logo.")
+    return web.Response(body=data, content_type="image/jpeg" if data[:2] == b"\xff\xd8" else "image/png")
+
+
+async def handle_palette(request: web.Request):
+    colors = [c if c.startswith("#") else f"#{c}" for c in request.query.get("colors", "").split(",") if c]
+    if not colors or len(colors) > 16 or not all(_HEX_COLOR_RE.fullmatch(c) for c in colors):
+        return _error(400, "'colors' must be 1-16 hex colors.")
+
+    img = render_palette(request.query.get("slogan", "")[:200], colors)
+    buffer = io.BytesIO()
+    with telemetry.span("encode.palette"):
+        img.save(buffer, format="PNG")
+    return web.Response(body=buffer.getvalue(), content_type="image/png")
+
+
+async def handle_health(request: web.Request):
+    service = request.app["service"]
+    return web.json_response({"ready": is_ready(), "queue": service.queue_depth(), **service.stats})
+
+
+async def handle_metrics(request: web.Request):
+    # Queue and request gauges are sampled at scrape time
+    service = request.app["service"]
+    telemetry.set_gauge("branding_queue_depth", service.queue_depth())
+    for outcome, count in service.stats.items():
+        telemetry.set_gauge("branding_server_requests", count, outcome=outcome)
+    return web.Response(
+        body=telemetry.render_prometheus().encode(),
+        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+    )
+
+
+def create_app(service: BrandingService = None) -> web.Application:
+    """
+    Build the aiohttp application.
+
+    Args:
+        service (BrandingService | None): Service to serve (default: one
+            configured from the environment).
+
+    Returns:
+        aiohttp.web.Application: The application, ready for `web.run_app`.
+    """
+    app = web.Application(client_max_size=64 * 1024)
+    app["service"] = service or BrandingService()
+
+    async def on_startup(app):
+        # Load the vectorstore in the background; early requests wait for it
+        warm_up()
+        await app["service"].start()
+
+    async def on_cleanup(app):
+        await app["service"].stop()
+        await http_client.aclose()
+
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    app.router.add_post("/branding", handle_branding)
+    app.router.add_get("/logos/{key}", handle_logo)
+    app.router.add_get("/palettes/render", handle_palette)
+    app.router.add_get("/healthz", handle_health)
+    app.router.add_get("/metrics", handle_metrics)
+    return app
+
+
+def serve(host: str, port: int, queue_size: int, concurrency: int, reuse_port: bool = False):
+    """Run one server process until interrupted."""
+    telemetry.setup()
+    web.run_app(
+        create_app(BrandingService(queue_size, concurrency)),
+        host=host,
+        port=port,
+        reuse_port=reuse_port,
+        print=None,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the branding generator over HTTP.")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=1, help="server processes sharing the port")
+    parser.add_argument("--queue-size", type=int, default=SERVER_QUEUE_SIZE)
+    parser.add_argument("--concurrency", type=int, default=OLLAMA_CONCURRENCY, help="Ollama generations per process")
+    args = parser.parse_args(argv)
+
+    telemetry.setup()
+    logger.info("🚀 Serving on http://%s:%d with %d worker(s)", args.host, args.port, args.workers)
+    if args.workers == 1:
+        serve(args.host, args.port, args.queue_size, args.concurrency)
+        return
+
+    # Build or update the index once, before the workers open it
+    warm_up(background=False)
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=serve, args=(args.host, args.port, args.queue_size, args.concurrency, True))
+        for _ in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()
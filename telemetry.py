@@ -0,0 +1,419 @@
+"""
+Spans, metrics and structured logging for the branding pipeline.
+
+    with telemetry.span("retrieval"):
+        ...
+    telemetry.observe("llm_time_to_first_token_seconds", ttft)
+
+Every span records its duration in the `branding_stage_seconds`
+histogram (labelled by stage) and in a ring buffer of recent spans,
+grouped by trace, for the app's debug panel. Metrics are rendered in
+the Prometheus text format: server.py serves them at /metrics, and with
+METRICS_FILE set they are also written to that file periodically.
+
+TELEMETRY=0 turns spans and metrics into no-ops. LOG_LEVEL and
+LOG_FORMAT (text or json) configure logging for the entry points.
+"""
+import atexit
+import contextvars
+import itertools
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+
+TELEMETRY_ENABLED = os.getenv("TELEMETRY", "1").lower() not in ("0", "false", "no", "off")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+METRICS_FILE = os.getenv("METRICS_FILE", "")
+METRICS_FILE_INTERVAL = float(os.getenv("METRICS_FILE_INTERVAL", "15"))
+SPAN_BUFFER_SIZE = int(os.getenv("SPAN_BUFFER_SIZE", "1000"))
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+RATE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+# Known metrics: (type, help, histogram buckets)
+METRICS = {
+    "branding_stage_seconds": ("histogram", "Duration of pipeline stages.", LATENCY_BUCKETS),
+    "branding_stage_errors_total": ("counter", "Pipeline stages that raised.", None),
+    "branding_queue_depth": ("gauge", "Generations waiting for a server worker.", None),
+    "branding_server_requests": ("gauge", "Server requests since start, by outcome.", None),
+    "http_responses_total": ("counter", "Outgoing HTTP attempts by host and status.", None),
+    "http_retries_total": ("counter", "Outgoing HTTP attempts that were retried.", None),
+    "llm_time_to_first_token_seconds": ("histogram", "Time until the LLM streamed its first token.", LATENCY_BUCKETS),
+    "llm_tokens_per_second": ("histogram", "LLM generation speed after the first token.", RATE_BUCKETS),
+    "llm_tokens_total": ("counter", "Tokens streamed by the LLM.", None),
+}
+
+logger = logging.getLogger(__name__)
+
+_trace = contextvars.ContextVar("telemetry_trace", default=None)
+_current_span = contextvars.ContextVar("telemetry_span", default=None)
+_ids = itertools.count(1)
+
+
+def _label_key(labels: dict):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Registry:
+    """Thread-safe counters, gauges and histograms, rendered for Prometheus."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, **labels):
+        with self._lock:
+            self._gauges[(name, _label_key(labels))] = value
+
+    def observe(self, name: str, value: float, **labels):
+        key = (name, _label_key(labels))
+        buckets = (METRICS.get(name, (None, None, None))[2] or LATENCY_BUCKETS)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * len(buckets), 0.0, 0]
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram[0][i] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def clear(self):
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def summary(self):
+        """
+        Return the current values in a compact form.
+
+        Returns:
+            dict: {"counters": {series: value}, "gauges": {...},
+            "histograms": {series: {"count", "sum", "mean"}}}
+        """
+        with self._lock:
+            return {
+                "counters": {_series(n, l): v for (n, l), v in self._counters.items()},
+                "gauges": {_series(n, l): v for (n, l), v in self._gauges.items()},
+                "histograms": {
+                    _series(n, l): {"count": h[2], "sum": h[1], "mean": h[1] / h[2] if h[2] else 0.0}
+                    for (n, l), h in self._histograms.items()
+                },
+            }
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            series = {}
+            for (name, labels), value in self._counters.items():
+                series.setdefault(name, []).append((labels, value))
+            for (name, labels), value in self._gauges.items():
+                series.setdefault(name, []).append((labels, value))
+            for (name, labels), value in self._histograms.items():
+                series.setdefault(name, []).append((labels, value))
+
+            gauges = {name for name, _ in self._gauges}
+            for name in sorted(series):
+                kind, help_text, buckets = METRICS.get(name, (None, None, None))
+                if name in gauges:
+                    kind = "gauge"
+                if help_text:
+                    lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind or 'untyped'}")
+                for labels, value in sorted(series[name]):
+                    if kind != "histogram":
+                        lines.append(f"{_series(name, labels)} {_number(value)}")
+                        continue
+                    counts, total, count = value
+                    for bound, bucket_count in zip(buckets or LATENCY_BUCKETS, counts):
+                        lines.append(f"{_series(name + '_bucket', labels + (('le', _number(bound)),))} {bucket_count}")
+                    lines.append(f"{_series(name + '_bucket', labels + (('le', '+Inf'),))} {count}")
+                    lines.append(f"{_series(name + '_sum', labels)} {_number(total)}")
+                    lines.append(f"{_series(name + '_count', labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _series(name: str, labels) -> str:
+    if not labels:
+        return name
+    escaped = (f'{k}="{_escape(v)}"' for k, v in labels)
+    return f"{name}{{{','.join(escaped)}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+registry = Registry()
+_spans = deque(maxlen=SPAN_BUFFER_SIZE)
+
+
+def inc(name: str, value: float = 1.0, **labels):
+    """Increment a counter."""
+    if TELEMETRY_ENABLED:
+        registry.inc(name, value, **labels)
+
+
+def set_gauge(name: str, value: float, **labels):
+    """Set a gauge."""
+    if TELEMETRY_ENABLED:
+        registry.set(name, value, **labels)
+
+
+def observe(name: str, value: float, **labels):
+    """Record a histogram observation."""
+    if TELEMETRY_ENABLED:
+        registry.observe(name, value, **labels)
+
+
+class Span:
+    """
+    A timed pipeline stage. Use through `span()` or `trace()`.
+
+    Args:
+        name (str): Stage name, used as the `stage` label.
+        labels (dict): Extra low-cardinality labels for the metrics.
+        new_trace (bool): Start a new trace rooted at this span.
+    """
+
+    __slots__ = ("name", "labels", "attributes", "id", "parent", "trace", "start", "duration", "error", "_tokens")
+
+    def __init__(self, name: str, labels: dict, new_trace: bool = False):
+        self.name = name
+        self.labels = labels
+        self.attributes = {}
+        self.id = next(_ids)
+        self.parent = None if new_trace else _current_span.get()
+        self.trace = self.id if new_trace else _trace.get()
+        self.start = self.duration = 0.0
+        self.error = None
+        self._tokens = ()
+
+    def set(self, **attributes):
+        """Attach attributes shown in the debug panel and logs (not metric labels)."""
+        self.attributes.update(attributes)
+
+    def __enter__(self):
+        self._tokens = (_trace.set(self.trace), _current_span.set(self.id))
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self.start
+        trace_token, span_token = self._tokens
+        try:
+            _current_span.reset(span_token)
+            _trace.reset(trace_token)
+        except ValueError:
+            # Exited in another context (e.g. a generator resumed elsewhere)
+            pass
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        _finish(self)
+        return False
+
+
+class _NoopSpan:
+    trace = None
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str, **labels):
+    """
+    Time a block as a pipeline stage.
+
+    Args:
+        name (str): Stage name ("retrieval", "llm", "http", ...).
+        **labels: Low-cardinality metric labels (e.g. host).
+
+    Returns:
+        Span: A context manager; call `.set(...)` on it to add attributes.
+    """
+    if not TELEMETRY_ENABLED:
+        return _NOOP_SPAN
+    return Span(name, labels)
+
+
+def trace(name: str, **labels):
+    """Like `span`, but starts a new trace; its `.trace` identifies the spans below it."""
+    if not TELEMETRY_ENABLED:
+        return _NOOP_SPAN
+    return Span(name, labels, new_trace=True)
+
+
+def record(name: str, duration: float, **attributes):
+    """
+    Record a stage timed by the caller (e.g. across generator yields).
+
+    Args:
+        name (str): Stage name.
+        duration (float): Seconds.
+        **attributes: Attributes for the debug panel and logs.
+    """
+    if not TELEMETRY_ENABLED:
+        return
+    finished = Span(name, {})
+    finished.parent = _current_span.get()
+    finished.start = time.perf_counter() - duration
+    finished.duration = duration
+    finished.attributes = attributes
+    _finish(finished)
+
+
+def _finish(finished: Span):
+    registry.observe("branding_stage_seconds", finished.duration, stage=finished.name, **finished.labels)
+    if finished.error:
+        registry.inc("branding_stage_errors_total", stage=finished.name, error=finished.error)
+    entry = {
+        "trace": finished.trace,
+        "span": finished.id,
+        "parent": finished.parent,
+        "stage": finished.name,
+        "ms": round(finished.duration * 1000, 3),
+        "error": finished.error,
+        **finished.labels,
+        **finished.attributes,
+    }
+    _spans.append(entry)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("span %s", finished.name, extra={"fields": entry})
+
+
+def recent_spans(trace_id=None, limit: int = 200):
+    """
+    Return recently finished spans, oldest first.
+
+    Args:
+        trace_id (int | None): Only spans of this trace.
+        limit (int): Most recent spans returned.
+
+    Returns:
+        list[dict]: trace, span, parent, stage, ms, error, labels and attributes.
+    """
+    spans = list(_spans)
+    if trace_id is not None:
+        spans = [s for s in spans if s["trace"] == trace_id]
+    return spans[-limit:]
+
+
+def render_prometheus() -> str:
+    """Return all metrics in the Prometheus text format."""
+    return registry.render()
+
+
+def write_metrics(path: str = METRICS_FILE):
+    """Atomically write the metrics to a file (for node_exporter's textfile collector)."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render_prometheus())
+    os.replace(tmp_path, path)
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Render log records as "time level logger: message key=value ..." or as
+    one JSON object per line, including any `extra={"fields": {...}}` and
+    the current trace ID.
+
+    Args:
+        json_output (bool): Emit JSON lines instead of text.
+    """
+
+    def __init__(self, json_output: bool = False):
+        super().__init__()
+        self.json_output = json_output
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = dict(getattr(record, "fields", None) or {})
+        if "trace" not in fields and _trace.get() is not None:
+            fields["trace"] = _trace.get()
+
+        if self.json_output:
+            payload = {
+                "time": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                **fields,
+            }
+            if record.exc_info:
+                payload["exception"] = self.formatException(record.exc_info)
+            return json.dumps(payload, ensure_ascii=False, default=str)
+
+        line = f"{self.formatTime(record)} {record.levelname:<7} {record.name}: {record.getMessage()}"
+        if fields:
+            line += " " + " ".join(f"{k}={v}" for k, v in fields.items() if v is not None)
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+_setup_lock = threading.Lock()
+_setup_done = False
+
+
+def setup(level: str = LOG_LEVEL, log_format: str = LOG_FORMAT, metrics_file: str = METRICS_FILE):
+    """
+    Configure logging and the metrics file exporter (once per process).
+
+    Called by the entry points (app.py, server.py, batch.py, CLIs);
+    library modules only log through `logging.getLogger(__name__)`.
+    """
+    global _setup_done
+    with _setup_lock:
+        if _setup_done:
+            return
+        _setup_done = True
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(StructuredFormatter(json_output=log_format == "json"))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    if metrics_file and TELEMETRY_ENABLED:
+        _start_file_exporter(metrics_file)
+
+
+def _start_file_exporter(path: str, interval: float = METRICS_FILE_INTERVAL):
+    def export():
+        while True:
+            time.sleep(interval)
+            try:
+                write_metrics(path)
+            except OSError as e:
+                logger.warning("Could not write metrics file: %s", e)
+
+    threading.Thread(target=export, name="metrics-exporter", daemon=True).start()
+    atexit.register(write_metrics, path)